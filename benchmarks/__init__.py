@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from surebets_finder.bootstrap import bootstrap_clients_di, bootstrap_di
+
+bootstrap_di()
+bootstrap_clients_di()
+
+EXAMPLES_PATH = Path(__file__).parent.parent / "surebets_finder" / "examples"
+
+
+def load_example(file_name: str) -> str:
+    with open(EXAMPLES_PATH / file_name) as file:
+        return file.read()
+
+
+def load_efortuna_page() -> str:
+    """Recorded eFortuna main content wrapped into the rest of the page, as returned by the browser"""
+
+    return (
+        "<!DOCTYPE html><html><head><title>Zakłady bukmacherskie</title>"
+        "<script>window.dataLayer = window.dataLayer || [];</script></head>"
+        "<body><header><nav><a href='/'>efortuna.pl</a></nav></header>"
+        f"{load_example('efortuna.html')}"
+        "<footer><p>Fortuna Online Zakłady Bukmacherskie</p></footer></body></html>"
+    )
@@ -0,0 +1,56 @@
+"""
+Compares extraction of the eFortuna main content with the previous implementation on the recorded page.
+
+    $ poetry run python -m benchmarks.efortuna_extraction
+"""
+import statistics
+import timeit
+from typing import Callable, Dict
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from benchmarks import load_efortuna_page
+from surebets_finder.raw_content.aplication.clients.efortuna_client import EFortunaClient
+
+REPEAT = 10
+
+
+def legacy_extract_information(page_content: str) -> str:
+    soup = BeautifulSoup(page_content, "html.parser")
+
+    main_content = soup.find(id=EFortunaClient.MAIN_HTML_DIV_ID).prettify()
+
+    return main_content.replace('<div=""', "")
+
+
+def soup_strainer_extract_information(page_content: str) -> str:
+    div_id = EFortunaClient.MAIN_HTML_DIV_ID
+    soup = BeautifulSoup(page_content, "html.parser", parse_only=SoupStrainer(id=div_id))
+
+    return str(soup.find(id=div_id)).replace('<div=""', "")
+
+
+def main() -> None:
+    page = load_efortuna_page()
+    client = EFortunaClient(urls=[])  # type: ignore
+
+    candidates: Dict[str, Callable[[str], str]] = {
+        "legacy: html.parser + prettify": legacy_extract_information,
+        "html.parser + SoupStrainer": soup_strainer_extract_information,
+        "lxml": client._extract_information,
+    }
+
+    print(f"page size: {len(page)} chars, best/median of {REPEAT} runs")
+
+    for name, extract in candidates.items():
+        timings = timeit.repeat(lambda: extract(page), number=1, repeat=REPEAT)
+        output_size = len(extract(page))
+
+        print(
+            f"{name:32} {min(timings) * 1000:8.1f} ms {statistics.median(timings) * 1000:8.1f} ms "
+            f"output {output_size} chars"
+        )
+
+
+if __name__ == "__main__":
+    main()
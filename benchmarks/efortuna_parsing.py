@@ -0,0 +1,28 @@
+"""
+Compares parsing of the stored eFortuna main content into rows with both backends on the recorded page.
+
+    $ poetry run python -m benchmarks.efortuna_parsing
+"""
+import statistics
+import timeit
+
+from benchmarks import load_example
+from surebets_finder.shared.efortuna_parser import LXML_BACKEND, SOUP_BACKEND, iter_rows
+
+REPEAT = 10
+
+
+def main() -> None:
+    content = load_example("efortuna.html")
+
+    print(f"content size: {len(content)} chars, best/median of {REPEAT} runs")
+
+    for backend in [SOUP_BACKEND, LXML_BACKEND]:
+        timings = timeit.repeat(lambda: list(iter_rows(content, backend)), number=1, repeat=REPEAT)
+        rows = len(list(iter_rows(content, backend)))
+
+        print(f"{backend:8} {min(timings) * 1000:8.1f} ms {statistics.median(timings) * 1000:8.1f} ms rows {rows}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Measures throughput, cost per event and peak memory of every finder on synthetic payloads of growing size and
+compares them with the stored baselines. Runs fully offline.
+
+    $ poetry run python -m benchmarks.finders
+    $ poetry run python -m benchmarks.finders --sizes 1000,10000,100000
+    $ poetry run python -m benchmarks.finders --save    # stores current results as the new baselines
+
+Baselines depend on the machine they were recorded on, so record them again on your machine (on the base
+branch) before comparing a change.
+
+Peak memory is traced by `tracemalloc`, so allocations made by libxml2 inside lxml are not included.
+"""
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.payloads import betclick_json, efortuna_html, lvbet_json
+from surebets_finder.bet.application.bet_finder import (
+    BetClickBetFinder,
+    BetFinder,
+    EFortunaBetFinder,
+    EFortunaRowsBetFinder,
+    LVBetBetFinder,
+)
+from surebets_finder.shared.category import Category
+from surebets_finder.shared.efortuna_parser import iter_rows, rows_to_json
+
+BASELINES_PATH = Path(__file__).parent / "baselines" / "finders.json"
+DEFAULT_SIZES = [1000, 10000]
+REPEAT = 3
+
+# name -> (finder factory, payload generator)
+CASES: Dict[str, Tuple[Callable[[], BetFinder], Callable[[int], str]]] = {
+    "efortuna-html": (EFortunaBetFinder, efortuna_html),  # type: ignore
+    "efortuna-rows": (EFortunaRowsBetFinder, lambda events: rows_to_json(iter_rows(efortuna_html(events)))),  # type: ignore
+    "betclick": (BetClickBetFinder, betclick_json),  # type: ignore
+    "lvbet": (LVBetBetFinder, lvbet_json),  # type: ignore
+}
+
+
+def _consume(finder: BetFinder, content: str) -> int:
+    return sum(1 for _ in finder.iter_bets(content, Category.ESPORT))
+
+
+def measure(name: str, events: int) -> Dict[str, float]:
+    finder_factory, generate = CASES[name]
+    finder = finder_factory()
+    content = generate(events)
+
+    timings = []
+    bets = 0
+
+    for _ in range(REPEAT):
+        started_at = time.perf_counter()
+        bets = _consume(finder, content)
+        timings.append(time.perf_counter() - started_at)
+
+    # tracing allocations slows parsing down, so memory is measured in a separate run
+    tracemalloc.start()
+    _consume(finder, content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+
+    return {
+        "events": events,
+        "bets": bets,
+        "payload_mib": round(len(content.encode()) / 1024 / 1024, 2),
+        "seconds": round(best, 4),
+        "events_per_second": round(events / best),
+        "us_per_event": round(best / events * 1_000_000, 2),
+        "peak_mib": round(peak / 1024 / 1024, 2),
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]], baselines: Dict[str, Dict[str, float]], threshold: float
+) -> List[str]:
+    regressions = []
+
+    for key, result in results.items():
+        baseline = baselines.get(key)
+
+        if baseline is None:
+            continue
+
+        for metric in ["us_per_event", "peak_mib"]:
+            # small absolute values are mostly noise
+            if result[metric] > baseline[metric] * (1 + threshold) and result[metric] - baseline[metric] > 0.1:
+                regressions.append(f"{key} {metric}: {baseline[metric]} -> {result[metric]}")
+
+    return regressions
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma separated event counts")
+    parser.add_argument("--finders", default=",".join(CASES), help="comma separated finders to run")
+    parser.add_argument("--save", action="store_true", help="store results as the new baselines")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative regression")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+
+    stored: Dict[str, Any] = json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+    baselines: Dict[str, Dict[str, float]] = stored.get("results", {})
+    results: Dict[str, Dict[str, float]] = {}
+
+    print(f"{'finder':14} {'events':>7} {'payload':>9} {'events/s':>10} {'us/event':>9} {'peak':>9} {'baseline':>9}")
+
+    for name in args.finders.split(","):
+        for events in map(int, args.sizes.split(",")):
+            key = f"{name}/{events}"
+            result = results[key] = measure(name, events)
+            baseline = baselines.get(key, {}).get("us_per_event", "-")
+
+            print(
+                f"{name:14} {events:7} {result['payload_mib']:7.2f}MB {result['events_per_second']:10} "
+                f"{result['us_per_event']:9} {result['peak_mib']:7.2f}MB {baseline:>9}"
+            )
+
+    if args.save:
+        stored = {
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()}",
+            "results": {**baselines, **results},
+        }
+        BASELINES_PATH.write_text(f"{json.dumps(stored, indent=2, sort_keys=True)}\n")
+        print(f"Baselines saved to {BASELINES_PATH}")
+        return 0
+
+    regressions = compare(results, baselines, args.threshold)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,78 @@
+"""
+Compares decoding the whole BetClick/LVBet payload with `json.loads` against streaming bets decoded item by item,
+on the recorded payloads repeated to grow them.
+
+    $ poetry run python -m benchmarks.json_parsing
+"""
+import json
+import logging
+import statistics
+import timeit
+import tracemalloc
+from typing import Any, Callable, List
+
+from benchmarks import load_example
+from surebets_finder.bet.application.bet_finder import BetClickBetFinder, LVBetBetFinder
+from surebets_finder.shared.category import Category
+
+REPEAT = 5
+SCALES = [1, 10]
+
+
+def _grow(content: str, scale: int) -> str:
+    return json.dumps(json.loads(content) * scale, indent=2)
+
+
+def legacy_find_bets(finder: Any, content: str) -> List[Any]:
+    bets = []
+
+    for item in json.loads(content):
+        # `iter_bets` skips items which cannot be turned into a bet, so does the legacy loop
+        try:
+            bet = finder._to_bet(item, Category.ESPORT)
+        except (IndexError, KeyError):
+            continue
+
+        if bet is not None:
+            bets.append(bet)
+
+    return bets
+
+
+def stream_bets(finder: Any, content: str) -> int:
+    return sum(1 for _ in finder.iter_bets(content, Category.ESPORT))
+
+
+def _peak_memory(function: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak / 1024 / 1024
+
+
+def main() -> None:
+    logging.disable(logging.ERROR)
+
+    print(f"best/median of {REPEAT} runs, peak memory allocated while parsing")
+
+    for file_name, finder in [("betclick.json", BetClickBetFinder()), ("lvbet.json", LVBetBetFinder())]:  # type: ignore
+        for scale in SCALES:
+            content = _grow(load_example(file_name), scale)
+            candidates: List[Any] = [
+                ("json.loads + list", lambda: legacy_find_bets(finder, content)),
+                ("streamed iter_bets", lambda: stream_bets(finder, content)),
+            ]
+
+            for name, parse in candidates:
+                timings = timeit.repeat(parse, number=1, repeat=REPEAT)
+
+                print(
+                    f"{file_name:14} x{scale:<3} {name:20} {min(timings) * 1000:8.1f} ms "
+                    f"{statistics.median(timings) * 1000:8.1f} ms peak {_peak_memory(parse):7.2f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
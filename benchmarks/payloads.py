@@ -0,0 +1,200 @@
+"""
+Deterministic generators of synthetic provider payloads in the layout of the recorded examples, so finders
+can be benchmarked on any number of events without network access.
+"""
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+TEAMS = [
+    "G2 Esports",
+    "MAD Lions",
+    "Natus Vincere",
+    "Team Liquid",
+    "Fnatic",
+    "Astralis",
+    "Team Vitality",
+    "FaZe Clan",
+    "Ninjas in Pyjamas",
+    "Cloud9",
+    "Evil Geniuses",
+    "Heroic",
+    "Complexity Gaming",
+    "BIG",
+    "mousesports",
+    "OG",
+    "Virtus.pro",
+    "ENCE",
+    "Rogue",
+    "Excel Esports",
+]
+COMPETITIONS = ["blast-premier", "iem-katowice", "dreamhack-open", "lec-spring", "esl-pro-league"]
+START_DATE = datetime(2021, 1, 19, 12, 0)
+EPOCH = datetime(1970, 1, 1)
+
+# one in `SUB_MARKETS_EVERY` efortuna events has a row of additional markets, as on the recorded page
+SUB_MARKETS_EVERY = 7
+
+
+def _event(rng: random.Random, index: int) -> Tuple[str, str, float, float, datetime, str]:
+    opponent_1, opponent_2 = rng.sample(TEAMS, 2)
+    odds_1 = round(rng.uniform(1.05, 6.0), 2)
+    odds_2 = round(rng.uniform(1.05, 6.0), 2)
+    date = START_DATE + timedelta(minutes=15 * rng.randrange(0, 4 * 24 * 60))
+    competition = COMPETITIONS[index % len(COMPETITIONS)]
+
+    return opponent_1, opponent_2, odds_1, odds_2, date, competition
+
+
+def _slug(name: str) -> str:
+    return name.lower().replace(" ", "-").replace(".", "")
+
+
+def efortuna_html(events: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    rows: List[str] = []
+
+    for index in range(events):
+        opponent_1, opponent_2, odds_1, odds_2, date, competition = _event(rng, index)
+        market_id = f"MPL{31000000 + index}"
+        url = f"/zaklady-bukmacherskie/esport/{competition}/{_slug(opponent_1)}-{_slug(opponent_2)}-{market_id}"
+        has_sub_markets = index % SUB_MARKETS_EVERY == 0
+
+        rows.append(
+            f"""
+        <tr role="row"{' class="tablesorter-hasChildRow"' if has_sub_markets else ''}>
+         <td class="col-title" data-type="text" data-value="{opponent_1} - {opponent_2}">
+          <a class="event-name" data-id="{market_id}" href="{url}">
+           <span class="market-name">
+            {opponent_1} - {opponent_2}
+           </span>
+          </a>
+          <span class="event-meta">
+           <span class="event-info-number">
+            {6000 + index}
+           </span>
+          </span>
+          <div class="event-icons">
+          </div>
+         </td>
+         <td class="col-odds">
+          <a class="odds-button" data-id="{2 * index}" data-market-id="{market_id}" data-value="{odds_1:.2f}" href="#">
+           <span class="odds-value">
+            {odds_1:.2f}
+           </span>
+          </a>
+         </td>
+         <td class="col-odds">
+          <a class="odds-button" data-id="{2 * index + 1}" data-market-id="{market_id}" data-value="{odds_2:.2f}" href="#">
+           <span class="odds-value">
+            {odds_2:.2f}
+           </span>
+          </a>
+         </td>
+         <td class="col-date" data-type="numeric" data-value="{int((date - EPOCH).total_seconds() * 1000)}">
+          <span class="event-datetime">
+           {date:%d.%m.}&#160;{date:%H:%M}
+          </span>
+         </td>
+        </tr>"""
+        )
+
+        if has_sub_markets:
+            rows.append(
+                """
+        <tr class="row-sub-markets" role="row">
+         <td colspan="4">
+          <a class="sub-markets-link" href="#">+ 12</a>
+         </td>
+        </tr>"""
+            )
+
+    return (
+        '<div id="main-content">\n <table class="table events-table tablesorter" role="grid">\n'
+        '  <thead>\n   <tr role="row"><th class="col-title">Mecz</th><th class="col-odds">1</th>'
+        '<th class="col-odds">2</th><th class="col-date">Data</th></tr>\n  </thead>\n'
+        f'  <tbody>{"".join(rows)}\n  </tbody>\n </table>\n</div>'
+    )
+
+
+def betclick_json(events: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    items: List[Dict[str, Any]] = []
+
+    for index in range(events):
+        opponent_1, opponent_2, odds_1, odds_2, date, competition = _event(rng, index)
+        items.append(
+            {
+                "id": 2859000 + index,
+                "name": f"{opponent_1} - {opponent_2}",
+                "status": 20,
+                "date": f"{date:%Y-%m-%dT%H:%M:%SZ}",
+                "isLive": False,
+                "competition": {
+                    "id": 28000 + index % len(COMPETITIONS),
+                    "name": competition,
+                    "sport": {"id": 102, "name": "E-Sports", "position": 0},
+                    "relativeDesktopUrl": f"e-sports/{competition}-e{28000 + index % len(COMPETITIONS)}",
+                },
+                "markets": [
+                    {
+                        "id": 261973000 + index,
+                        "name": "Zwycięzca meczu",
+                        "selections": [
+                            {"id": 4 * index, "name": opponent_1, "odds": odds_1, "status": 1},
+                            {"id": 4 * index + 1, "name": opponent_2, "odds": odds_2, "status": 1},
+                        ],
+                        "categories": ["Match"],
+                    }
+                ],
+                "relativeDesktopUrl": f"{_slug(opponent_1)}-{_slug(opponent_2)}-m{1157000 + index}",
+                "contestants": [
+                    {"type": 0, "name": opponent_1, "shortName": opponent_1},
+                    {"type": 0, "name": opponent_2, "shortName": opponent_2},
+                ],
+                "openMarketCount": 5,
+            }
+        )
+
+    return json.dumps(items, ensure_ascii=False, indent=2)
+
+
+def lvbet_json(events: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    items: List[Dict[str, Any]] = []
+
+    for index in range(events):
+        opponent_1, opponent_2, odds_1, odds_2, date, competition = _event(rng, index)
+        items.append(
+            {
+                "date": f"{date:%Y-%m-%dT%H:%M:%S}+00:00",
+                "group": {"id": 41000 + index % len(COMPETITIONS), "label": competition, "parentId": 83},
+                "id": 9607000 + index,
+                "isLive": False,
+                "isPre": True,
+                "participants": {"away": opponent_1, "home": opponent_2},
+                "primaryMarkets": [
+                    {
+                        "id": 328941000 + index,
+                        "label": "match-winner",
+                        "name": "Zwycięzca meczu",
+                        "selections": [
+                            {"id": 4 * index, "name": opponent_2, "rate": {"decimal": odds_1, "fractional": "5/12"}},
+                            {
+                                "id": 4 * index + 1,
+                                "name": opponent_1,
+                                "rate": {"decimal": odds_2, "fractional": "19/10"},
+                            },
+                        ],
+                    }
+                ],
+                "sportsGroups": [
+                    {"id": 330, "label": "counter-strike", "parentId": 1},
+                    {"id": 83, "label": "world", "parentId": 330},
+                    {"id": 41000 + index % len(COMPETITIONS), "label": competition, "parentId": 83},
+                ],
+            }
+        )
+
+    return json.dumps(items, ensure_ascii=False, indent=2)
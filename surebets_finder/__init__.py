@@ -3,7 +3,6 @@
 #
 # https://app.lvbet.pl/_api/v1/offer/matches/?is_live=false&sports_groups_ids=43555,43910,41071,42981,43200,43415,44564,45586,45649&lang=pl
 
-
-from surebets_finder.bootstrap import bootstrap_di
-
-bootstrap_di()
+#
+# Dependencies are registered by `surebets_finder.bootstrap`, which is called by the CLI commands, so importing
+# the package does not load database, HTTP and browser libraries.
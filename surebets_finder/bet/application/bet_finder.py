@@ -1,41 +1,32 @@
-import json
 from datetime import datetime
 from decimal import Decimal
 from logging import Logger
-from typing import Any, Dict, List, Protocol, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
 from bson.objectid import ObjectId
 from kink import inject
 
+from surebets_finder.bet.application.normalization import (
+    current_year,
+    extract_opponents,
+    normalize_name,
+    parse_betclick_date,
+    parse_efortuna_date,
+    parse_iso_date,
+)
+from surebets_finder.bet.application.parse_report import ParseReport
 from surebets_finder.bet.domain.entities import Bet
 from surebets_finder.shared.category import Category
+from surebets_finder.shared.efortuna_parser import LXML_BACKEND, EFortunaRow, iter_rows, rows_from_json
+from surebets_finder.shared.json_stream import iter_json_array
 from surebets_finder.shared.provider import Provider
 
 
-def _extract_oponents(str_which_contain_two_opponents: str) -> Tuple[str, str]:
-    without_white_spaces = " ".join(str_which_contain_two_opponents.split())
-
-    splited = without_white_spaces.split(" ")
-    index = splited.index("-")
-
-    opponent_1_parts = []
-    opponent_2_parts = []
-    for i, item in enumerate(splited):
-        if i < index:
-            opponent_1_parts.append(item)
-
-        if i > index:
-            opponent_2_parts.append(item)
-
-    opponent_1 = " ".join(opponent_1_parts)
-    opponent_2 = " ".join(opponent_2_parts)
-
-    return opponent_1.lower().strip(), opponent_2.lower().strip()
-
-
 class BetFinder(Protocol):
+    def iter_bets(self, content: str, category: Category) -> Iterator[Bet]:
+        """Yields bets one at a time as they are found in the content"""
+        ...
+
     def find_bets(self, content: str, category: Category) -> List[Bet]:
         ...
 
@@ -44,57 +35,64 @@ class BetFinder(Protocol):
 class EFortunaBetFinder(BetFinder):
     def __init__(self, logger: Logger) -> None:
         self._logger = logger
+        self._backend = LXML_BACKEND
 
-    def _find_oponents(self, item: Tag) -> Tuple[str, str]:
-        opponents_names = item.select_one(".market-name").text
-        opponents_names = opponents_names.strip()
+    def _require(self, value: Optional[str], name: str) -> str:
+        if value is None:
+            raise AttributeError(f"row has no `{name}`")
 
-        return _extract_oponents(opponents_names)
+        return value
 
-    def _find_odds(self, item: Tag) -> Tuple[Decimal, Decimal]:
-        odds = item.select(".odds-value")
+    def _find_oponents(self, row: EFortunaRow) -> Tuple[str, str]:
+        opponents_names = self._require(row.market_name, "market-name")
+        opponents_names = opponents_names.strip()
 
-        return Decimal(odds[0].text), Decimal(odds[1].text)
+        return extract_opponents(opponents_names)
 
-    def _find_date(self, item: Tag) -> datetime:
-        date_str = item.select_one(".event-datetime").text
+    def _find_odds(self, row: EFortunaRow) -> Tuple[Decimal, Decimal]:
+        odds = row.odds
 
-        date_str = date_str.replace("\xa0", " ")
-        date_str = date_str.strip()
+        return Decimal(odds[0]), Decimal(odds[1])
 
-        current_year = datetime.utcnow().strftime("%Y")
-        date_str = date_str.replace(" ", current_year)
+    def _find_date(self, row: EFortunaRow, year: str) -> datetime:
+        date_str = self._require(row.event_datetime, "event-datetime")
 
-        return datetime.strptime(date_str, "%d.%m.%Y%H:%M")
+        return parse_efortuna_date(date_str, year)
 
-    def _find_url(self, item: Tag) -> str:
-        url_html_tag = item.select_one("a.event-name")
+    def _find_url(self, row: EFortunaRow) -> str:
+        return self._require(row.url, "a.event-name")
 
-        return url_html_tag.get("href", "")
+    def _iter_rows(self, content: str) -> Iterable[EFortunaRow]:
+        return iter_rows(content, self._backend)
 
-    def find_bets(self, content: str, category: Category) -> List[Bet]:
+    def iter_bets(self, content: str, category: Category) -> Iterator[Bet]:
         self._logger.info("Finding bets for efortuna.pl !")
 
-        bets = []
+        year = current_year()
+        report = ParseReport(Provider.EFORTUNA)
 
-        parsed_content = BeautifulSoup(content, "html.parser")
+        try:
+            for row in self._iter_rows(content):
+                if "running-live" in row.classes:
+                    report.skip("running-live", row)
+                    continue
 
-        for item in parsed_content.select("table tbody tr"):  # type: Tag
-            if "running-live" in item.get("class", []):
-                self._logger.info(f"HTML item `{item}` has class `running-live`, skiping this one!")
-                continue
+                if "row-sub-markets" in row.classes:
+                    report.skip("row-sub-markets", row)
+                    continue
 
-            if "row-sub-markets" in item.get("class", []):
-                self._logger.info(f"HTML item `{item}` has class `row-sub-markets`, skiping this one!")
-                continue
+                try:
+                    opponent_1, opponent_2 = self._find_oponents(row)
+                    odds_1, odds_2 = self._find_odds(row)
+                    date = self._find_date(row, year)
+                    url = self._find_url(row)
+                except (IndexError, AttributeError, ValueError) as e:
+                    report.fail(e, row)
+                    continue
 
-            try:
-                opponent_1, opponent_2 = self._find_oponents(item)
-                odds_1, odds_2 = self._find_odds(item)
-                date = self._find_date(item)
-                url = self._find_url(item)
+                report.found += 1
 
-                bet = Bet(
+                yield Bet(
                     id=ObjectId(),
                     opponent_1=opponent_1,
                     opponent_2=opponent_2,
@@ -106,12 +104,19 @@ class EFortunaBetFinder(BetFinder):
                     url=url,
                     updated_at=datetime.utcnow(),
                 )
+        finally:
+            report.log(self._logger)
+
+    def find_bets(self, content: str, category: Category) -> List[Bet]:
+        return list(self.iter_bets(content, category))
 
-                bets.append(bet)
-            except (IndexError, AttributeError, ValueError) as e:
-                self._logger.error(f"Can not fetch all of the information from `{item}` due to {str(e)}.")
 
-        return bets
+@inject
+class EFortunaRowsBetFinder(EFortunaBetFinder):
+    """Finds bets in rows extracted from the html when the page was downloaded"""
+
+    def _iter_rows(self, content: str) -> Iterable[EFortunaRow]:
+        return rows_from_json(content)
 
 
 @inject
@@ -119,38 +124,56 @@ class BetClickBetFinder(BetFinder):
     def __init__(self, logger: Logger) -> None:
         self._logger = logger
 
-    def find_bets(self, content: str, category: Category) -> List[Bet]:
-        self._logger.info("Finding bets for betclick.pl !")
+    def _to_bet(self, item: Dict[str, Any], category: Category) -> Optional[Bet]:
+        if not item.get("markets"):
+            return None
+
+        opponent_1 = normalize_name(item["contestants"][0]["name"])
+        opponent_2 = normalize_name(item["contestants"][1]["name"])
+        odds_1 = Decimal(item["markets"][0]["selections"][0]["odds"])
+        odds_2 = Decimal(item["markets"][0]["selections"][1]["odds"])
+        date = parse_betclick_date(item["date"])
+        url = f'{item["competition"]["relativeDesktopUrl"]}/{item["relativeDesktopUrl"]}'
+
+        return Bet(
+            id=ObjectId(),
+            opponent_1=opponent_1,
+            opponent_2=opponent_2,
+            odds_1=odds_1,
+            odds_2=odds_2,
+            category=category,
+            provider=Provider.BETCLICK,
+            date=date,
+            url=url,
+            updated_at=datetime.utcnow(),
+        )
+
+    def iter_bets(self, content: str, category: Category) -> Iterator[Bet]:
+        # the payload is decoded item by item, so the whole decoded json is never kept in memory
 
-        json_content = json.loads(content)
+        self._logger.info("Finding bets for betclick.pl !")
 
-        bets = []
+        report = ParseReport(Provider.BETCLICK)
 
-        for item in json_content:  # type: Dict[str, Any]
-            if item.get("markets"):
-                opponent_1 = item["contestants"][0]["name"].lower()
-                opponent_2 = item["contestants"][1]["name"].lower()
-                odds_1 = Decimal(item["markets"][0]["selections"][0]["odds"])
-                odds_2 = Decimal(item["markets"][0]["selections"][1]["odds"])
-                date = datetime.strptime(item["date"], "%Y-%m-%dT%H:%M:%SZ")
-                url = f'{item["competition"]["relativeDesktopUrl"]}/{item["relativeDesktopUrl"]}'
+        try:
+            for item in iter_json_array(content):
+                try:
+                    bet = self._to_bet(item, category)
+                except (IndexError, KeyError, ValueError) as e:
+                    report.fail(e, item)
+                    continue
 
-                bet = Bet(
-                    id=ObjectId(),
-                    opponent_1=opponent_1,
-                    opponent_2=opponent_2,
-                    odds_1=odds_1,
-                    odds_2=odds_2,
-                    category=category,
-                    provider=Provider.BETCLICK,
-                    date=date,
-                    url=url,
-                    updated_at=datetime.utcnow(),
-                )
+                if bet is None:
+                    report.skip("no-markets", item)
+                    continue
 
-                bets.append(bet)
+                report.found += 1
+                yield bet
+        finally:
+            report.log(self._logger)
 
-        return bets
+    def find_bets(self, content: str, category: Category) -> List[Bet]:
+        return list(self.iter_bets(content, category))
 
 
 @inject
@@ -176,36 +199,45 @@ class LVBetBetFinder(BetFinder):
 
         return f'{first_part_of_url}/--/{ids_part_of_url}/{item["id"]}'
 
-    def find_bets(self, content: str, category: Category) -> List[Bet]:
-        self._logger.info("Finding bets for lvbet.pl !")
-
-        json_content = json.loads(content)
+    def _to_bet(self, item: Dict[str, Any], category: Category) -> Bet:
+        opponent_1 = normalize_name(item["participants"]["away"])
+        opponent_2 = normalize_name(item["participants"]["home"])
+        odds_1 = Decimal(item["primaryMarkets"][0]["selections"][0]["rate"]["decimal"])
+        odds_2 = Decimal(item["primaryMarkets"][0]["selections"][1]["rate"]["decimal"])
+        date = parse_iso_date(item["date"])
+
+        return Bet(
+            id=ObjectId(),
+            opponent_1=opponent_1,
+            opponent_2=opponent_2,
+            odds_1=odds_1,
+            odds_2=odds_2,
+            category=category,
+            provider=Provider.LVBET,
+            date=date,
+            url=self._build_url(item, opponent_1, opponent_2),
+            updated_at=datetime.utcnow(),
+        )
+
+    def iter_bets(self, content: str, category: Category) -> Iterator[Bet]:
+        # the payload is decoded item by item, so the whole decoded json is never kept in memory
 
-        bets = []
+        self._logger.info("Finding bets for lvbet.pl !")
 
-        for item in json_content:  # type: Dict[str, Any]
-            try:
-                opponent_1 = item["participants"]["away"].lower()
-                opponent_2 = item["participants"]["home"].lower()
-                odds_1 = Decimal(item["primaryMarkets"][0]["selections"][0]["rate"]["decimal"])
-                odds_2 = Decimal(item["primaryMarkets"][0]["selections"][1]["rate"]["decimal"])
-                date = datetime.fromisoformat(item["date"])
+        report = ParseReport(Provider.LVBET)
 
-                bet = Bet(
-                    id=ObjectId(),
-                    opponent_1=opponent_1,
-                    opponent_2=opponent_2,
-                    odds_1=odds_1,
-                    odds_2=odds_2,
-                    category=category,
-                    provider=Provider.BETCLICK,
-                    date=date,
-                    url=self._build_url(item, opponent_1, opponent_2),
-                    updated_at=datetime.utcnow(),
-                )
+        try:
+            for item in iter_json_array(content):
+                try:
+                    bet = self._to_bet(item, category)
+                except (IndexError, KeyError) as e:
+                    report.fail(e, item)
+                    continue
 
-                bets.append(bet)
-            except (IndexError, KeyError) as e:
-                self._logger.error(f"Can not fetch all of the information from `{item}` due to {str(e)}.")
+                report.found += 1
+                yield bet
+        finally:
+            report.log(self._logger)
 
-        return bets
+    def find_bets(self, content: str, category: Category) -> List[Bet]:
+        return list(self.iter_bets(content, category))
@@ -1,4 +1,11 @@
-from surebets_finder.bet.application.bet_finder import BetClickBetFinder, BetFinder, EFortunaBetFinder, LVBetBetFinder
+from surebets_finder.bet.application.bet_finder import (
+    BetClickBetFinder,
+    BetFinder,
+    EFortunaBetFinder,
+    EFortunaRowsBetFinder,
+    LVBetBetFinder,
+)
+from surebets_finder.shared.content_format import ContentFormat
 from surebets_finder.shared.provider import Provider
 from surebets_finder.shared.reflection import raises
 
@@ -6,7 +13,10 @@ from surebets_finder.shared.reflection import raises
 class BetFinderFactory:
     @classmethod
     @raises(ValueError)
-    def create(cls, provider: Provider) -> BetFinder:
+    def create(cls, provider: Provider, content_format: ContentFormat = ContentFormat.RAW) -> BetFinder:
+        if provider == Provider.EFORTUNA and content_format == ContentFormat.ROWS:
+            return EFortunaRowsBetFinder()  # type: ignore
+
         if provider == Provider.EFORTUNA:
             return EFortunaBetFinder()  # type: ignore
 
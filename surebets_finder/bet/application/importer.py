@@ -1,50 +1,161 @@
+import os
+import socket
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
 from logging import Logger
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+from uuid import uuid4
 
-from kink import inject
+from kink import di, inject
 
 from surebets_finder.bet.application.bet_finder_factory import BetFinderFactory
-from surebets_finder.bet.domain.errors import BetNotFoundError
-from surebets_finder.bet.domain.repositories import BetRepository
-from surebets_finder.raw_content.facade import RawContentFacade
+from surebets_finder.bet.domain.entities import Bet, BetUpsertResult
+from surebets_finder.bet.domain.repositories import BetRepository, OddsHistoryRepository
+from surebets_finder.raw_content.facade import RawContentDTO, RawContentFacade
+from surebets_finder.shared.batching import DEFAULT_BATCH_SIZE, batched
+from surebets_finder.shared.category import Category
+from surebets_finder.shared.content_format import ContentFormat
+from surebets_finder.shared.provider import Provider
+
+
+def _bootstrap_worker() -> None:
+    """Processes started with `spawn` (default on macOS and Windows) do not inherit registered dependencies"""
+
+    if Logger not in di:
+        from surebets_finder.bootstrap import bootstrap_di
+
+        bootstrap_di()
+
+
+def _find_bets_in_pages(
+    provider: Provider, content_format: ContentFormat, category: Category, pages: List[str]
+) -> List[Bet]:
+    """Runs in a worker process, so it takes and returns only picklable values"""
+
+    finder = BetFinderFactory.create(provider, content_format)
+
+    return [bet for page in pages for bet in finder.iter_bets(page, category)]
 
 
 @inject
 class BetImporter:
-    def __init__(self, repository: BetRepository, logger: Logger) -> None:
+    DEFAULT_BATCH_SIZE = DEFAULT_BATCH_SIZE
+    # a raw content whose importer has died is claimed again by another one after this time
+    LEASE = timedelta(minutes=10)
+
+    def __init__(self, repository: BetRepository, odds_history: OddsHistoryRepository, logger: Logger) -> None:
         self._repository = repository
+        self._odds_history = odds_history
         self._logger = logger
         self._facade = RawContentFacade()  # type: ignore
+        self._owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+    def _claim_all(self, provider: Optional[Provider]) -> Iterator[RawContentDTO]:
+        """Raw contents are claimed one at a time, so several importers can work through the same backlog"""
+
+        while True:
+            raw_content_dto = self._facade.claim_unprocessed_raw_content(self._owner, self.LEASE, provider)
+
+            if raw_content_dto is None:
+                return
+
+            yield raw_content_dto
+
+    def _save_batch(self, bets: List[Bet], recorded_at: datetime) -> BetUpsertResult:
+        result = self._repository.upsert_many(bets, recorded_at)
+        self._odds_history.record(bets, recorded_at)
 
-    def import_all(self) -> None:
-        self._logger.info("Bets importer has started!")
+        return result
 
-        for raw_content_dto in self._facade.get_all_unprocessed_raw_contents():
-            finder = BetFinderFactory.create(raw_content_dto.provider)
+    def _save_all(self, raw_content_dto: RawContentDTO, bets: Iterable[Bet], batch_size: int) -> None:
+        """
+        Bets are written in batches of `batch_size` by a writer thread while the next batch is being found,
+        so at most two batches are kept in memory.
+        """
 
-            bets = finder.find_bets(raw_content_dto.content, raw_content_dto.category)
+        result = BetUpsertResult()
+        written: Optional["Future[BetUpsertResult]"] = None
+        # odds are recorded as of the time they were downloaded, not the time they are imported
+        recorded_at = raw_content_dto.id.generation_time.replace(tzinfo=None)
 
-            for bet in bets:
-                try:
-                    existing_bet = self._repository.find_one(
-                        {"opponent_1": bet.opponent_1, "opponent_2": bet.opponent_2, "date": bet.date}
-                    )
-                    self._logger.info(
-                        f"Bet with with params"
-                        f"`opponent_1={bet.opponent_1}, opponent_2={bet.opponent_2}, date={bet.date}` "
-                        f"already exist! Updating values"
-                    )
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="bet-writer") as writer:
+            for batch in batched(bets, batch_size):
+                if written is not None:
+                    result += written.result()
 
-                    existing_bet.odds_1 = bet.odds_1
-                    existing_bet.odds_2 = bet.odds_2
-                    existing_bet.url = bet.url
-                    self._repository.save(existing_bet)
-                except BetNotFoundError:
-                    self._logger.info("Creating new bet!")
+                written = writer.submit(self._save_batch, batch, recorded_at)
 
-                    self._repository.create(bet)
+            if written is not None:
+                result += written.result()
 
-            self._facade.mark_raw_content_as_processed(raw_content_dto.id)
+        self._facade.mark_raw_content_as_processed(raw_content_dto.id, self._owner)
 
-            self._logger.info(
-                f"Found {len(bets)} from RawContent with id={raw_content_dto.id} where provider={raw_content_dto.provider.value}!"
+        self._logger.info(
+            f"Found {result.inserted + result.updated + result.unchanged} from RawContent with id={raw_content_dto.id} "
+            f"where provider={raw_content_dto.provider.value}! "
+            f"Inserted {result.inserted}, updated {result.updated}, unchanged {result.unchanged}"
+        )
+
+    def _try_save_all(
+        self, raw_content_dto: RawContentDTO, find_bets: Callable[[], Iterable[Bet]], batch_size: int
+    ) -> None:
+        """
+        A raw content which cannot be imported does not abort the run. It stays leased, so it is claimed again
+        only after its lease expires.
+        """
+
+        try:
+            self._save_all(raw_content_dto, find_bets(), batch_size)
+        except Exception:
+            self._logger.exception(
+                f"Importing bets from RawContent with id={raw_content_dto.id} where "
+                f"provider={raw_content_dto.provider.value} has failed! It is left until its lease expires"
             )
+
+    def _import_in_processes(self, raw_content_dtos: Iterable[RawContentDTO], processes: int, batch_size: int) -> None:
+        """
+        Parsing is sent to a pool of `processes` processes, bets are written by the current process in order
+        of raw contents. At most two raw contents per process are parsed ahead of writing.
+        """
+
+        pending: Deque[Tuple[RawContentDTO, "Future[List[Bet]]"]] = deque()
+
+        with ProcessPoolExecutor(max_workers=processes, initializer=_bootstrap_worker) as executor:
+            for raw_content_dto in raw_content_dtos:
+                future = executor.submit(
+                    _find_bets_in_pages,
+                    raw_content_dto.provider,
+                    raw_content_dto.content_format,
+                    raw_content_dto.category,
+                    raw_content_dto.pages,
+                )
+                pending.append((raw_content_dto, future))
+
+                if len(pending) >= 2 * processes:
+                    written_dto, written_future = pending.popleft()
+                    self._try_save_all(written_dto, written_future.result, batch_size)
+
+            while pending:
+                written_dto, written_future = pending.popleft()
+                self._try_save_all(written_dto, written_future.result, batch_size)
+
+    def import_all(
+        self, provider: Optional[Provider] = None, processes: int = 1, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> None:
+        """Bets of every unprocessed raw content are found in `processes` processes when it is greater than 1"""
+
+        self._logger.info(f"Bets importer has started with processes={processes}!")
+
+        raw_content_dtos = self._claim_all(provider)
+
+        if processes > 1:
+            self._import_in_processes(raw_content_dtos, processes, batch_size)
+            return
+
+        for raw_content_dto in raw_content_dtos:
+            finder = BetFinderFactory.create(raw_content_dto.provider, raw_content_dto.content_format)
+
+            bets = (bet for page in raw_content_dto.pages for bet in finder.iter_bets(page, raw_content_dto.category))
+
+            self._try_save_all(raw_content_dto, lambda: bets, batch_size)
@@ -0,0 +1,53 @@
+"""
+Normalization of opponents names and dates shared by the finders. Results are memoized in bounded LRU caches,
+as the same names and kickoff times repeat across pages and import cycles.
+"""
+from datetime import datetime
+from functools import lru_cache
+from typing import Tuple
+
+NAMES_CACHE_SIZE = 8192
+DATES_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=NAMES_CACHE_SIZE)
+def extract_opponents(str_which_contain_two_opponents: str) -> Tuple[str, str]:
+    without_white_spaces = " ".join(str_which_contain_two_opponents.split())
+
+    splited = without_white_spaces.split(" ")
+    index = splited.index("-")
+
+    opponent_1 = " ".join(splited[:index])
+    opponent_2 = " ".join(splited[index:][1:])
+
+    return opponent_1.lower().strip(), opponent_2.lower().strip()
+
+
+@lru_cache(maxsize=NAMES_CACHE_SIZE)
+def normalize_name(name: str) -> str:
+    return name.lower()
+
+
+def current_year() -> str:
+    """Computed once per run of a finder and passed to `parse_efortuna_date`, efortuna dates come without a year"""
+
+    return datetime.utcnow().strftime("%Y")
+
+
+@lru_cache(maxsize=DATES_CACHE_SIZE)
+def parse_efortuna_date(date_str: str, year: str) -> datetime:
+    date_str = date_str.replace("\xa0", " ")
+    date_str = date_str.strip()
+    date_str = date_str.replace(" ", year)
+
+    return datetime.strptime(date_str, "%d.%m.%Y%H:%M")
+
+
+@lru_cache(maxsize=DATES_CACHE_SIZE)
+def parse_betclick_date(date_str: str) -> datetime:
+    return datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
+
+
+@lru_cache(maxsize=DATES_CACHE_SIZE)
+def parse_iso_date(date_str: str) -> datetime:
+    return datetime.fromisoformat(date_str)
@@ -0,0 +1,62 @@
+import logging
+from collections import Counter
+from logging import Logger
+from typing import Any, Counter as CounterType, Dict
+
+from surebets_finder.shared.provider import Provider
+
+MAX_EXEMPLAR_LENGTH = 300
+
+
+def _exemplar(item: Any) -> str:
+    text = " ".join(str(item).split())
+
+    if len(text) > MAX_EXEMPLAR_LENGTH:
+        return f"{text[:MAX_EXEMPLAR_LENGTH]}..."
+
+    return text
+
+
+class ParseReport:
+    """
+    Counts items of a single content which were skipped or could not be parsed, per reason. Only the first item
+    of every reason is turned into text (as an exemplar), so counting costs a dict update per item.
+    """
+
+    def __init__(self, provider: Provider) -> None:
+        self.provider = provider
+        self.found = 0
+        self.skipped: CounterType[str] = Counter()
+        self.failed: CounterType[str] = Counter()
+        self.exemplars: Dict[str, str] = {}
+
+    def skip(self, reason: str, item: Any) -> None:
+        self.skipped[reason] += 1
+
+        if reason not in self.exemplars:
+            self.exemplars[reason] = _exemplar(item)
+
+    def fail(self, error: Exception, item: Any) -> None:
+        reason = type(error).__name__
+        self.failed[reason] += 1
+
+        if reason not in self.exemplars:
+            self.exemplars[reason] = f"{error} in {_exemplar(item)}"
+
+    def _format(self, counter: CounterType[str]) -> str:
+        reasons = ", ".join(f"{reason}={count}" for reason, count in counter.most_common())
+
+        return f"{sum(counter.values())} ({reasons})" if counter else "0"
+
+    def log(self, logger: Logger) -> None:
+        logger.log(
+            logging.WARNING if self.failed else logging.INFO,
+            f"[{self.provider.value}] Found {self.found} bets, skipped {self._format(self.skipped)}, "
+            f"failed {self._format(self.failed)}",
+        )
+
+        for reason in self.failed:
+            logger.warning(f"[{self.provider.value}] Exemplar of `{reason}`: {self.exemplars[reason]}")
+
+        for reason in self.skipped:
+            logger.debug(f"[{self.provider.value}] Exemplar of `{reason}`: {self.exemplars[reason]}")
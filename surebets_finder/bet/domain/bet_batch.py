@@ -0,0 +1,145 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from bson.objectid import ObjectId
+
+from surebets_finder.bet.domain.entities import Bet
+from surebets_finder.shared.category import Category
+from surebets_finder.shared.provider import Provider
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_CATEGORIES = list(Category)
+_PROVIDERS = list(Provider)
+
+
+def _to_microseconds(value: datetime) -> int:
+    # aware datetimes are kept as naive UTC, the same way as MongoDB returns them
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_microseconds(value: int) -> datetime:
+    return _EPOCH + value * _MICROSECOND
+
+
+class BetBatch:
+    """
+    Columnar storage of bets for holding many of them in a single process: odds are kept as integer hundredths
+    (rounded half up, the same precision as stored in the database), team names are interned in a table shared
+    by the whole batch, enums are kept as one byte codes and dates as microseconds since epoch.
+
+    Bets found by any finder can be collected with `BetBatch.from_bets(finder.iter_bets(...))`.
+    """
+
+    ODDS_SCALE = 100
+
+    def __init__(self) -> None:
+        self._ids = bytearray()
+        self._names: List[str] = []
+        self._name_codes: Dict[str, int] = {}
+        self._opponents_1 = array("I")
+        self._opponents_2 = array("I")
+        self._odds_1 = array("I")
+        self._odds_2 = array("I")
+        self._categories = array("B")
+        self._providers = array("B")
+        self._dates = array("q")
+        self._updated_at = array("q")
+        self._created_at = array("q")
+        self._urls: List[str] = []
+
+    @classmethod
+    def from_bets(cls, bets: Iterable[Bet]) -> "BetBatch":
+        batch = cls()
+        batch.extend(bets)
+
+        return batch
+
+    def _name_code(self, name: str) -> int:
+        code = self._name_codes.get(name)
+
+        if code is None:
+            code = len(self._names)
+            self._names.append(name)
+            self._name_codes[name] = code
+
+        return code
+
+    def _to_hundredths(self, odds: Decimal) -> int:
+        return int((odds * self.ODDS_SCALE).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+    def append(self, bet: Bet) -> None:
+        self._ids += bet.id.binary
+        self._opponents_1.append(self._name_code(bet.opponent_1))
+        self._opponents_2.append(self._name_code(bet.opponent_2))
+        self._odds_1.append(self._to_hundredths(bet.odds_1))
+        self._odds_2.append(self._to_hundredths(bet.odds_2))
+        self._categories.append(_CATEGORIES.index(bet.category))
+        self._providers.append(_PROVIDERS.index(bet.provider))
+        self._dates.append(_to_microseconds(bet.date))
+        self._updated_at.append(_to_microseconds(bet.updated_at))
+        self._created_at.append(_to_microseconds(bet.created_at))
+        self._urls.append(bet.url)
+
+    def extend(self, bets: Iterable[Bet]) -> None:
+        for bet in bets:
+            self.append(bet)
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __getitem__(self, index: int) -> Bet:
+        """Builds the bet stored at the given position, odds are rounded to hundredths"""
+
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Bet index {index} is out of range!")
+
+        index %= len(self)
+        id_start, id_end = index * 12, (index + 1) * 12
+
+        return Bet(
+            id=ObjectId(bytes(self._ids[id_start:id_end])),
+            opponent_1=self._names[self._opponents_1[index]],
+            opponent_2=self._names[self._opponents_2[index]],
+            odds_1=Decimal(self._odds_1[index]).scaleb(-2),
+            odds_2=Decimal(self._odds_2[index]).scaleb(-2),
+            category=_CATEGORIES[self._categories[index]],
+            provider=_PROVIDERS[self._providers[index]],
+            date=_from_microseconds(self._dates[index]),
+            url=self._urls[index],
+            updated_at=_from_microseconds(self._updated_at[index]),
+            created_at=_from_microseconds(self._created_at[index]),
+        )
+
+    def __iter__(self) -> Iterator[Bet]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def opponents(self, index: int) -> Tuple[str, str]:
+        return self._names[self._opponents_1[index]], self._names[self._opponents_2[index]]
+
+    def provider(self, index: int) -> Provider:
+        return _PROVIDERS[self._providers[index]]
+
+    def date(self, index: int) -> datetime:
+        return _from_microseconds(self._dates[index])
+
+    @property
+    def odds_1(self) -> array:
+        """Odds in hundredths, e.g. 125 for 1.25, for comparing bets without building `Decimal`s"""
+
+        return self._odds_1
+
+    @property
+    def odds_2(self) -> array:
+        return self._odds_2
+
+    def iter_keys(self) -> Iterator[Tuple[int, int, int, int]]:
+        """Yields (provider, opponent_1, opponent_2, date) codes of every bet for grouping the same events"""
+
+        return zip(self._providers, self._opponents_1, self._opponents_2, self._dates)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 
@@ -6,9 +6,11 @@ from bson.objectid import ObjectId
 
 from surebets_finder.shared.category import Category
 from surebets_finder.shared.provider import Provider
-from surebets_finder.shared.reflection import raises
+from surebets_finder.shared.reflection import raises, with_slots
 
 
+# no per-instance `__dict__`, a finder builds one bet per row
+@with_slots
 @dataclass
 class Bet:
     id: ObjectId
@@ -21,7 +23,7 @@ class Bet:
     date: datetime
     url: str
     updated_at: datetime
-    created_at: datetime = datetime.utcnow()
+    created_at: datetime = field(default_factory=datetime.utcnow)
 
     @raises(ValueError)
     def get_full_url(self) -> str:
@@ -35,3 +37,24 @@ class Bet:
             return f"https://lvbet.pl/en/pre-matches/{self.url}"
 
         raise ValueError(f"Provider `{self.provider}` is not correct!")
+
+
+@dataclass(frozen=True)
+class BetUpsertResult:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    def __add__(self, other: "BetUpsertResult") -> "BetUpsertResult":
+        return BetUpsertResult(
+            inserted=self.inserted + other.inserted,
+            updated=self.updated + other.updated,
+            unchanged=self.unchanged + other.unchanged,
+        )
+
+
+@dataclass(frozen=True)
+class OddsSnapshot:
+    recorded_at: datetime
+    odds_1: Decimal
+    odds_2: Decimal
@@ -1,8 +1,11 @@
-from typing import Any, Dict, List, Protocol
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol
 
 from bson.objectid import ObjectId
 
-from surebets_finder.bet.domain.entities import Bet
+from surebets_finder.bet.domain.bet_batch import BetBatch
+from surebets_finder.bet.domain.entities import Bet, BetUpsertResult, OddsSnapshot
+from surebets_finder.shared.batching import DEFAULT_BATCH_SIZE
 
 
 class BetRepository(Protocol):  # pragma: no cover
@@ -15,8 +18,43 @@ class BetRepository(Protocol):  # pragma: no cover
     def get_all_which_are_in_future(self) -> List[Bet]:
         ...
 
+    def iter_which_are_in_future(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Bet]:
+        """Yields bets as the cursor fetches them in batches of `batch_size`"""
+        ...
+
+    def get_all_which_are_in_future_as_batch(self) -> BetBatch:
+        ...
+
     def find_one(self, params: Dict[str, Any]) -> Bet:
         ...
 
     def save(self, bet: Bet) -> None:
         ...
+
+    def upsert_many(self, bets: Iterable[Bet], recorded_at: datetime) -> BetUpsertResult:
+        """
+        Creates bets which do not exist yet and updates odds and url of the existing ones in one round trip,
+        unless the stored odds were recorded at `recorded_at` or later
+        """
+        ...
+
+    def create_indexes(self) -> List[str]:
+        """Creates indexes which do not exist yet, returns names of all indexes of the repository"""
+        ...
+
+
+class OddsHistoryRepository(Protocol):  # pragma: no cover
+    def record(self, bets: Iterable[Bet], recorded_at: datetime) -> int:
+        """
+        Appends odds of bets which have changed since they were recorded last time, returns number of recorded
+        snapshots.
+        """
+        ...
+
+    def get_history(self, bet: Bet, since: datetime, until: Optional[datetime] = None) -> List[OddsSnapshot]:
+        """Odds of the event of the bet recorded between `since` and `until`, oldest first"""
+        ...
+
+    def create_indexes(self) -> List[str]:
+        """Creates indexes which do not exist yet, returns names of all indexes of the repository"""
+        ...
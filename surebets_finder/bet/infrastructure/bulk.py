@@ -0,0 +1,28 @@
+from typing import List, Tuple
+
+from pymongo import UpdateOne
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+def bulk_upsert(collection: Collection, operations: List[UpdateOne]) -> Tuple[int, int]:
+    """
+    Writes idempotent update and upsert operations in one unordered `bulk_write`, returns numbers of upserted
+    and modified documents.
+
+    When another writer has inserted some of the documents in the meantime, their upserts fail on a unique
+    index. Operations are then written once again: the failed upserts match now and the already applied
+    operations do not modify anything the second time.
+    """
+
+    try:
+        result = collection.bulk_write(operations, ordered=False)
+        return result.upserted_count, result.modified_count
+    except BulkWriteError as e:
+        if any(error["code"] != DUPLICATE_KEY_ERROR for error in e.details["writeErrors"]):
+            raise
+
+        result = collection.bulk_write(operations, ordered=False)
+        return e.details["nUpserted"] + result.upserted_count, e.details["nModified"] + result.modified_count
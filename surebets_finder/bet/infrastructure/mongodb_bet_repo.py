@@ -2,20 +2,32 @@ from dataclasses import asdict
 from datetime import datetime
 from decimal import ROUND_HALF_UP, Decimal
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from bson import Decimal128
 from bson.objectid import ObjectId
 from kink import inject
+from pymongo import ASCENDING, IndexModel, UpdateOne
 from pymongo.database import Database
 
-from surebets_finder.bet.domain.entities import Bet
+from surebets_finder.bet.domain.bet_batch import BetBatch
+from surebets_finder.bet.domain.entities import Bet, BetUpsertResult
 from surebets_finder.bet.domain.errors import BetNotFoundError
 from surebets_finder.bet.domain.repositories import BetRepository
+from surebets_finder.bet.infrastructure.bulk import bulk_upsert
+from surebets_finder.shared.batching import DEFAULT_BATCH_SIZE
 from surebets_finder.shared.category import Category
 from surebets_finder.shared.provider import Provider
 from surebets_finder.shared.reflection import raises
 
+# the same event of a provider is found again on every import cycle
+NATURAL_KEY = ("opponent_1", "opponent_2", "date", "provider")
+
+INDEXES = [
+    IndexModel([(field, ASCENDING) for field in NATURAL_KEY], name="natural_key", unique=True),
+    IndexModel([("date", ASCENDING)], name="date"),
+]
+
 
 @inject(alias=BetRepository)
 class MongoDBBetRepository(BetRepository):
@@ -44,7 +56,7 @@ class MongoDBBetRepository(BetRepository):
             id=document["_id"],
             opponent_1=document["opponent_1"],
             opponent_2=document["opponent_2"],
-            odds_1=document["odds_2"].to_decimal(),
+            odds_1=document["odds_1"].to_decimal(),
             odds_2=document["odds_2"].to_decimal(),
             category=Category(document["category"]),
             provider=Provider(document["provider"]),
@@ -71,9 +83,16 @@ class MongoDBBetRepository(BetRepository):
         self._collection.insert_one(document)
 
     def get_all_which_are_in_future(self) -> List[Bet]:
-        documents = self._collection.find({"date": {"$gte": datetime.utcnow()}})
+        return list(self.iter_which_are_in_future())
+
+    def iter_which_are_in_future(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Bet]:
+        documents = self._collection.find({"date": {"$gte": datetime.utcnow()}}, batch_size=batch_size)
+
+        for document in documents:
+            yield self._to_entity(document)
 
-        return [self._to_entity(document) for document in documents]
+    def get_all_which_are_in_future_as_batch(self) -> BetBatch:
+        return BetBatch.from_bets(self.iter_which_are_in_future())
 
     @raises(BetNotFoundError)
     def find_one(self, params: Dict[str, Any]) -> Bet:
@@ -101,3 +120,56 @@ class MongoDBBetRepository(BetRepository):
         }
 
         self._collection.update_one(query, to_update)
+
+    def _natural_key(self, bet: Bet) -> Tuple[Any, ...]:
+        return bet.opponent_1, bet.opponent_2, bet.date, bet.provider.value
+
+    def _to_upserts(self, bet: Bet, updated_at: datetime, recorded_at: datetime) -> Tuple[UpdateOne, UpdateOne]:
+        """
+        The first operation updates the bet only if its odds or url have changed and the stored ones were recorded
+        before `recorded_at`, so `modified_count` counts updated bets and an older raw content imported late
+        does not roll back odds. The second one creates the bet when it does not exist yet.
+        """
+
+        key = dict(zip(NATURAL_KEY, self._natural_key(bet)))
+        values = {
+            "odds_1": self._to_decimal_128(bet.odds_1),
+            "odds_2": self._to_decimal_128(bet.odds_2),
+            "url": bet.url,
+        }
+
+        document = asdict(bet, dict_factory=self._serialize)
+        document["_id"] = document.pop("id")
+        document["recorded_at"] = recorded_at
+
+        return (
+            UpdateOne(
+                {
+                    **key,
+                    # matches bets stored before `recorded_at` was introduced too
+                    "recorded_at": {"$not": {"$gte": recorded_at}},
+                    "$or": [{field: {"$ne": value}} for field, value in values.items()],
+                },
+                {"$set": {**values, "updated_at": updated_at, "recorded_at": recorded_at}},
+            ),
+            UpdateOne(key, {"$setOnInsert": document}, upsert=True),
+        )
+
+    def upsert_many(self, bets: Iterable[Bet], recorded_at: datetime) -> BetUpsertResult:
+        # the last occurrence of a bet wins, as it would with saving bets one by one
+        unique_bets = {self._natural_key(bet): bet for bet in bets}
+
+        if not unique_bets:
+            return BetUpsertResult()
+
+        updated_at = datetime.utcnow()
+        operations = [
+            operation for bet in unique_bets.values() for operation in self._to_upserts(bet, updated_at, recorded_at)
+        ]
+
+        inserted, updated = bulk_upsert(self._collection, operations)
+
+        return BetUpsertResult(inserted=inserted, updated=updated, unchanged=len(unique_bets) - inserted - updated)
+
+    def create_indexes(self) -> List[str]:
+        return self._collection.create_indexes(INDEXES)
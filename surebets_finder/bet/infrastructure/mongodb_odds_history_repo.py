@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from kink import inject
+from pymongo import ASCENDING, IndexModel, UpdateOne
+from pymongo.database import Database
+
+from surebets_finder.bet.domain.entities import Bet, OddsSnapshot
+from surebets_finder.bet.domain.repositories import OddsHistoryRepository
+from surebets_finder.bet.infrastructure.bulk import bulk_upsert
+from surebets_finder.bet.infrastructure.mongodb_bet_repo import NATURAL_KEY
+
+# snapshots of an event are kept in one document per day, odds change at most a few hundred times a day
+BUCKET_SPAN = timedelta(days=1)
+
+# odds are stored in hundredths, e.g. 125 for 1.25
+ODDS_SCALE = 100
+
+INDEXES = [
+    IndexModel([*((field, ASCENDING) for field in NATURAL_KEY), ("bucket", ASCENDING)], name="bucket", unique=True),
+]
+
+
+@inject(alias=OddsHistoryRepository)
+class MongoDBOddsHistoryRepository(OddsHistoryRepository):
+    """
+    Append-only history of odds in documents bucketed per event, provider and day. A bucket keeps its
+    snapshots in `snapshots` and the last recorded odds and time in `last_odds_1`/`last_odds_2`/`last_t`, so a
+    snapshot is appended only when the odds differ from them. Every bucket starts with the odds of its first import.
+
+    A snapshot recorded before `last_t` of its bucket (a raw content imported late by another importer) is
+    dropped, so it neither rolls back the last odds nor makes the next import append unchanged odds again.
+    """
+
+    def __init__(self, database: Database) -> None:
+        self._collection = database["odds_history"]
+
+    def _to_hundredths(self, odds: Decimal) -> int:
+        return int((odds * ODDS_SCALE).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+    def _bucket(self, recorded_at: datetime) -> datetime:
+        return datetime.min + (recorded_at - datetime.min) // BUCKET_SPAN * BUCKET_SPAN
+
+    def _event_key(self, bet: Bet) -> Dict[str, Any]:
+        return dict(zip(NATURAL_KEY, (bet.opponent_1, bet.opponent_2, bet.date, bet.provider.value)))
+
+    def _to_appends(self, bet: Bet, recorded_at: datetime) -> Tuple[UpdateOne, UpdateOne]:
+        """
+        The first operation appends the snapshot only if odds have changed since the last snapshot recorded before
+        it, so `modified_count` counts appended snapshots, the second one starts the bucket with the snapshot when
+        it does not exist yet.
+        """
+
+        key = {**self._event_key(bet), "bucket": self._bucket(recorded_at)}
+        odds_1, odds_2 = self._to_hundredths(bet.odds_1), self._to_hundredths(bet.odds_2)
+        snapshot = {"t": recorded_at, "o1": odds_1, "o2": odds_2}
+
+        return (
+            UpdateOne(
+                {
+                    **key,
+                    # matches buckets started before `last_t` was introduced too
+                    "last_t": {"$not": {"$gte": recorded_at}},
+                    "$or": [{"last_odds_1": {"$ne": odds_1}}, {"last_odds_2": {"$ne": odds_2}}],
+                },
+                {
+                    "$push": {"snapshots": snapshot},
+                    "$set": {"last_odds_1": odds_1, "last_odds_2": odds_2, "last_t": recorded_at},
+                },
+            ),
+            UpdateOne(
+                key,
+                {
+                    "$setOnInsert": {
+                        "last_odds_1": odds_1,
+                        "last_odds_2": odds_2,
+                        "last_t": recorded_at,
+                        "snapshots": [snapshot],
+                    }
+                },
+                upsert=True,
+            ),
+        )
+
+    def record(self, bets: Iterable[Bet], recorded_at: datetime) -> int:
+        unique_bets = {tuple(self._event_key(bet).values()): bet for bet in bets}
+
+        if not unique_bets:
+            return 0
+
+        operations = [operation for bet in unique_bets.values() for operation in self._to_appends(bet, recorded_at)]
+        started, appended = bulk_upsert(self._collection, operations)
+
+        return started + appended
+
+    def get_history(self, bet: Bet, since: datetime, until: Optional[datetime] = None) -> List[OddsSnapshot]:
+        bucket_range: Dict[str, datetime] = {"$gte": self._bucket(since)}
+
+        if until is not None:
+            bucket_range["$lte"] = until
+
+        documents = self._collection.find(
+            {**self._event_key(bet), "bucket": bucket_range}, projection={"snapshots": True, "_id": False}
+        )
+
+        return sorted(
+            (
+                OddsSnapshot(
+                    recorded_at=snapshot["t"],
+                    odds_1=Decimal(snapshot["o1"]).scaleb(-2),
+                    odds_2=Decimal(snapshot["o2"]).scaleb(-2),
+                )
+                for document in documents
+                for snapshot in document["snapshots"]
+                if snapshot["t"] >= since and (until is None or snapshot["t"] <= until)
+            ),
+            key=lambda snapshot: snapshot.recorded_at,
+        )
+
+    def create_indexes(self) -> List[str]:
+        return self._collection.create_indexes(INDEXES)
@@ -5,14 +5,17 @@ from kink import di
 from pymongo import MongoClient
 from pymongo.database import Database
 
-from surebets_finder.bet.domain.repositories import BetRepository
+from surebets_finder.bet.domain.repositories import BetRepository, OddsHistoryRepository
 from surebets_finder.bet.infrastructure.mongodb_bet_repo import MongoDBBetRepository
+from surebets_finder.bet.infrastructure.mongodb_odds_history_repo import MongoDBOddsHistoryRepository
 from surebets_finder.logger import create_logger
 from surebets_finder.raw_content.domain.repositories import RawContentRepository
 from surebets_finder.raw_content.infrastructure.mongodb_raw_content_repo import MongoDBRawContentRepository
 
 
 def bootstrap_di() -> None:
+    """Registers dependencies needed by every command: logger, database and repositories"""
+
     host = os.getenv("MONGO_HOST", "mongo")
 
     di[Logger] = create_logger()
@@ -21,3 +24,33 @@ def bootstrap_di() -> None:
 
     di[RawContentRepository] = lambda _di: MongoDBRawContentRepository(_di[Database])
     di[BetRepository] = lambda _di: MongoDBBetRepository(_di[Database])
+    di[OddsHistoryRepository] = lambda _di: MongoDBOddsHistoryRepository(_di[Database])
+
+
+def bootstrap_clients_di() -> None:
+    """
+    Registers dependencies of the raw content clients. Imported only by commands which download raw contents,
+    as HTTP and browser libraries take a noticeable part of the start up time.
+    """
+
+    from pathlib import Path
+
+    from requests import Session
+
+    from surebets_finder.raw_content.aplication.clients.browser_pool import BrowserPool
+    from surebets_finder.raw_content.aplication.clients.conditional_cache import ConditionalRequestCache
+    from surebets_finder.raw_content.aplication.clients.efortuna_client import EFortunaSettings
+    from surebets_finder.raw_content.aplication.clients.http_session import build_http_session
+    from surebets_finder.raw_content.aplication.clients.throttling import ThrottleRegistry, load_throttle_configs
+    from surebets_finder.shared.content_format import ContentFormat
+
+    di[Session] = lambda _: build_http_session()
+    di[ConditionalRequestCache] = lambda _: ConditionalRequestCache()
+    di[ThrottleRegistry] = lambda _: ThrottleRegistry(load_throttle_configs(os.environ))
+    di[BrowserPool] = lambda _: BrowserPool(size=int(os.getenv("BROWSER_POOL_SIZE", "2")))
+    di[EFortunaSettings] = lambda _: EFortunaSettings(
+        content_format=ContentFormat(os.getenv("EFORTUNA_CONTENT_FORMAT", ContentFormat.RAW.value)),
+        html_sample_rate=float(os.getenv("EFORTUNA_HTML_SAMPLE_RATE", "0")),
+        # html is sampled only into a directory which is given explicitly
+        html_debug_dir=Path(os.environ["EFORTUNA_HTML_DEBUG_DIR"]) if os.getenv("EFORTUNA_HTML_DEBUG_DIR") else None,
+    )
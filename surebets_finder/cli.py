@@ -1,7 +1,51 @@
+"""
+Commands import what they use inside their bodies, so `--help` and commands which do not download anything
+do not pay for importing database, HTTP and browser libraries.
+"""
+import os
+import signal
+from typing import Any, Dict, List, Tuple, Union
+
 import click
 
-from surebets_finder.bet.application.importer import BetImporter
-from surebets_finder.raw_content.aplication.importer import Importer
+from surebets_finder.shared.batching import DEFAULT_BATCH_SIZE
+from surebets_finder.shared.provider import Provider
+
+
+def _parse_intervals(ctx: click.Context, param: click.Parameter, values: Tuple[str, ...]) -> Dict[Provider, float]:
+    from surebets_finder.daemon import DEFAULT_INTERVALS
+
+    intervals = dict(DEFAULT_INTERVALS)
+
+    for value in values:
+        try:
+            provider, seconds = value.split("=")
+            intervals[Provider(provider)] = float(seconds)
+        except ValueError:
+            raise click.BadParameter(
+                f"`{value}` is not in PROVIDER=SECONDS format, providers {[p.value for p in Provider]}"
+            )
+
+    return intervals
+
+
+def _bootstrap(with_clients: bool = False) -> None:
+    from surebets_finder.bootstrap import bootstrap_clients_di, bootstrap_di
+
+    bootstrap_di()
+
+    if with_clients:
+        bootstrap_clients_di()
+
+
+def _close_resources() -> None:
+    from kink import di
+    from requests import Session
+
+    from surebets_finder.raw_content.aplication.clients.browser_pool import BrowserPool
+
+    di[BrowserPool].close()
+    di[Session].close()
 
 
 @click.group()
@@ -10,15 +54,141 @@ def cli_group() -> None:
 
 
 @cli_group.command()
-def import_raw_content() -> None:
+@click.option(
+    "--concurrency",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of urls fetched at the same time.",
+)
+def import_raw_content(concurrency: int) -> None:
+    _bootstrap(with_clients=True)
+
+    from surebets_finder.raw_content.aplication.importer import Importer
+
     raw_content_importer = Importer()  # type: ignore
-    raw_content_importer.import_all()
+
+    try:
+        raw_content_importer.import_all(max_workers=concurrency)
+    finally:
+        _close_resources()
 
 
 @cli_group.command()
-def import_bets() -> None:
+@click.option(
+    "--processes",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Number of processes parsing raw contents, 0 means one per CPU.",
+)
+@click.option(
+    "--batch-size",
+    default=DEFAULT_BATCH_SIZE,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of bets written at once while the next ones are being found.",
+)
+def import_bets(processes: int, batch_size: int) -> None:
+    _bootstrap()
+
+    from surebets_finder.bet.application.importer import BetImporter
+
     bet_importer = BetImporter()  # type: ignore
-    bet_importer.import_all()
+    bet_importer.import_all(processes=processes or os.cpu_count() or 1, batch_size=batch_size)
+
+
+@cli_group.command()
+@click.option(
+    "--interval",
+    "intervals",
+    multiple=True,
+    metavar="PROVIDER=SECONDS",
+    callback=_parse_intervals,
+    help="Seconds between import cycles of a provider, can be repeated.",
+)
+@click.option(
+    "--concurrency",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of urls of a provider fetched at the same time.",
+)
+def run(intervals: Dict[Provider, float], concurrency: int) -> None:
+    """Keeps importing raw contents and bets of every provider on its own interval until SIGINT/SIGTERM"""
+
+    _bootstrap(with_clients=True)
+
+    from logging import Logger
+
+    from kink import di
+
+    from surebets_finder.bet.application.importer import BetImporter
+    from surebets_finder.daemon import Daemon
+    from surebets_finder.raw_content.aplication.clients.throttling import ThrottleRegistry
+    from surebets_finder.raw_content.aplication.importer import Importer
+
+    daemon = Daemon(
+        raw_content_importer=Importer(),  # type: ignore
+        bet_importer=BetImporter(),  # type: ignore
+        logger=di[Logger],
+        intervals=intervals,
+        max_workers=concurrency,
+        throttles=di[ThrottleRegistry],
+    )
+
+    def _stop(signum: int, frame: Any) -> None:
+        daemon.stop()
+
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+
+    try:
+        daemon.run()
+    finally:
+        _close_resources()
+
+
+@cli_group.command()
+@click.option("--batch-size", default=100, show_default=True, type=click.IntRange(min=1))
+def compress_raw_content(batch_size: int) -> None:
+    """Compresses raw contents stored before compression was introduced"""
+
+    _bootstrap()
+
+    from logging import Logger
+
+    from kink import di
+
+    from surebets_finder.raw_content.domain.repositories import RawContentRepository
+
+    repository: RawContentRepository = di[RawContentRepository]  # type: ignore
+    compressed = repository.compress_uncompressed(batch_size=batch_size)
+    di[Logger].info(f"Compressed content of {compressed} raw contents!")
+
+
+@cli_group.command()
+def migrate() -> None:
+    """Creates indexes of collections, indexes which already exist are left untouched"""
+
+    _bootstrap()
+
+    from logging import Logger
+
+    from kink import di
+
+    from surebets_finder.bet.domain.repositories import BetRepository, OddsHistoryRepository
+    from surebets_finder.raw_content.domain.repositories import RawContentRepository
+
+    repositories: List[Union[BetRepository, OddsHistoryRepository, RawContentRepository]] = [
+        di[BetRepository],  # type: ignore
+        di[OddsHistoryRepository],  # type: ignore
+        di[RawContentRepository],  # type: ignore
+    ]
+
+    for repository in repositories:
+        indexes = repository.create_indexes()
+        di[Logger].info(f"Indexes {', '.join(indexes)} of {type(repository).__name__} are in place!")
 
 
 def main() -> None:
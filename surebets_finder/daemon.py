@@ -0,0 +1,85 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import Logger
+from threading import Event
+from typing import Dict, Mapping, Optional
+
+from surebets_finder.bet.application.importer import BetImporter
+from surebets_finder.raw_content.aplication.clients.throttling import ThrottleRegistry
+from surebets_finder.raw_content.aplication.importer import Importer
+from surebets_finder.shared.provider import Provider
+
+# Seconds between the starts of two consecutive import cycles of a provider
+DEFAULT_INTERVALS: Dict[Provider, float] = {
+    Provider.EFORTUNA: 60,
+    Provider.LVBET: 30,
+    Provider.BETCLICK: 30,
+}
+
+
+class Daemon:
+    """
+    Keeps importing providers in a single long-running process, so clients, HTTP sessions, browsers and
+    database connections stay warm between cycles.
+
+    Every provider is scheduled on its own interval and a cycle chains fetching raw content with finding and
+    saving bets of that provider. A cycle which overruns its interval is not started again until it finishes.
+    """
+
+    def __init__(
+        self,
+        raw_content_importer: Importer,
+        bet_importer: BetImporter,
+        logger: Logger,
+        intervals: Mapping[Provider, float],
+        max_workers: int = 1,
+        throttles: Optional[ThrottleRegistry] = None,
+    ) -> None:
+        self._raw_content_importer = raw_content_importer
+        self._bet_importer = bet_importer
+        self._logger = logger
+        self._intervals = dict(intervals)
+        self._max_workers = max_workers
+        self._throttles = throttles
+        self._stopping = Event()
+
+    def _cycle(self, provider: Provider) -> None:
+        started_at = time.perf_counter()
+
+        try:
+            self._raw_content_importer.import_all(max_workers=self._max_workers, providers=[provider])
+            self._bet_importer.import_all(provider=provider)
+        except Exception:
+            self._logger.exception(f"[{provider.value}] Import cycle has failed!")
+            return
+
+        self._logger.info(f"[{provider.value}] Import cycle took {time.perf_counter() - started_at:.3f}s")
+
+        if self._throttles is not None:
+            self._logger.info(f"[{provider.value}] Throttle state {self._throttles.get(provider).state()}")
+
+    def stop(self) -> None:
+        self._logger.info("Stopping daemon, waiting for running import cycles to finish!")
+        self._stopping.set()
+
+    def run(self) -> None:
+        intervals = ", ".join(f"{provider.value}={interval}s" for provider, interval in self._intervals.items())
+        self._logger.info(f"Daemon has started with intervals {intervals}!")
+
+        next_runs = {provider: time.monotonic() for provider in self._intervals}
+        running: Dict[Provider, "Future[None]"] = {}
+
+        with ThreadPoolExecutor(max_workers=len(self._intervals), thread_name_prefix="daemon") as executor:
+            while not self._stopping.is_set():
+                now = time.monotonic()
+
+                for provider, next_run in next_runs.items():
+                    if next_run > now or (provider in running and not running[provider].done()):
+                        continue
+
+                    running[provider] = executor.submit(self._cycle, provider)
+                    next_runs[provider] = now + self._intervals[provider]
+
+                self._stopping.wait(max(min(next_runs.values()) - time.monotonic(), 0.05))
+
+        self._logger.info("Daemon has stopped!")
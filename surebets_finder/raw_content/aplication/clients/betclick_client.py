@@ -1,25 +1,55 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
-from typing import List
+from typing import Dict, Iterator, List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
 from kink import inject
+from requests import Session
 
 from surebets_finder.raw_content.aplication.clients.client import IWebClient
+from surebets_finder.raw_content.aplication.clients.conditional_cache import ConditionalRequestCache
+from surebets_finder.raw_content.aplication.clients.http_session import get_throttled
+from surebets_finder.raw_content.aplication.clients.throttling import ThrottleRegistry
 from surebets_finder.raw_content.domain.errors import RequestError
+from surebets_finder.shared.content_format import ContentFormat
+from surebets_finder.shared.provider import Provider
 
 
 @inject
 class BetClickClient(IWebClient):
-    def __init__(self, urls: List[str], logger: Logger) -> None:
+    DEFAULT_PAGE_SIZE = 100
+    CONCURRENT_PAGES = 4
+    MAX_PAGES = 50
+
+    def __init__(
+        self,
+        urls: List[str],
+        logger: Logger,
+        session: Session,
+        response_cache: ConditionalRequestCache,
+        throttles: ThrottleRegistry,
+    ) -> None:
         self._urls = urls
         self._logger = logger
+        self._session = session
+        self._response_cache = response_cache
+        self._throttle = throttles.get(Provider.BETCLICK)
 
     def _make_request(self, url: str) -> str:
         try:
-            response = requests.get(url=url, timeout=(2, 3))
+            response = get_throttled(
+                self._session,
+                self._throttle,
+                url,
+                headers=self._response_cache.conditional_headers(url),
+                timeout=(2, 3),
+            )
+
             response.raise_for_status()
 
-            return response.text
+            return self._response_cache.read(url, response)
         except requests.exceptions.HTTPError as e:
             self._logger.exception(f"[betclic.pl] HTTP Error! {str(e)}")
             raise RequestError("HTTP Error!") from e
@@ -33,14 +63,73 @@ class BetClickClient(IWebClient):
             self._logger.exception(f"[betclic.pl] Request Error! {str(e)}")
             raise RequestError("Request Error!") from e
 
-    def get_raw_data(self) -> str:
-        all_data = ""
+    @property
+    def urls(self) -> List[str]:
+        return self._urls
+
+    @property
+    def content_format(self) -> ContentFormat:
+        return ContentFormat.RAW
+
+    def _count_events(self, page: str) -> int:
+        try:
+            return len(json.loads(page))
+        except ValueError as e:
+            # e.g. a maintenance page of a CDN returned with 200
+            self._logger.exception(f"[betclic.pl] Response is not a valid JSON! {str(e)}")
+            raise RequestError("Invalid JSON Error!") from e
+
+    def _page_url(self, url: str, limit: int, offset: int) -> str:
+        parts = urlsplit(url)
+        query: Dict[str, str] = dict(parse_qsl(parts.query))
+        query.update({"limit": str(limit), "offset": str(offset)})
+
+        return urlunsplit(parts._replace(query=urlencode(query, safe=",")))
+
+    def iter_pages(self, url: str) -> Iterator[str]:
+        """
+        Follows `limit`/`offset` paging of the given url until a page shorter than `limit` is returned.
+        The first page is downloaded alone, as most result sets fit in it. Only when it is full, next pages are
+        downloaded `CONCURRENT_PAGES` at once and yielded in offset order as soon as they arrive.
+        """
+
+        query = dict(parse_qsl(urlsplit(url).query))
+        limit = int(query.get("limit", self.DEFAULT_PAGE_SIZE))
+        offset = int(query.get("offset", 0))
+
+        page = self._make_request(self._page_url(url, limit, offset))
+        events_count = self._count_events(page)
+
+        if events_count:
+            yield page
+
+        if events_count < limit:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.CONCURRENT_PAGES, thread_name_prefix="betclick-pages") as executor:
+            for first_page in range(1, self.MAX_PAGES, self.CONCURRENT_PAGES):
+                last_page = min(first_page + self.CONCURRENT_PAGES, self.MAX_PAGES)
+                offsets = [offset + page_number * limit for page_number in range(first_page, last_page)]
+                futures = [executor.submit(self._make_request, self._page_url(url, limit, item)) for item in offsets]
+
+                try:
+                    for future in futures:
+                        page = future.result()
+                        events_count = self._count_events(page)
+
+                        if events_count:
+                            yield page
+
+                        if events_count < limit:
+                            return
+                finally:
+                    for future in futures:
+                        future.cancel()
 
-        for url in self._urls:
-            content = self._make_request(url)
-            all_data += content
+        self._logger.warning(f"[betclic.pl] Stopped paging after {self.MAX_PAGES} pages of `{url}`!")
 
-        return all_data
+    def get_raw_data(self) -> List[str]:
+        return [page for url in self._urls for page in self.iter_pages(url)]
 
     def __str__(self) -> str:
         return "BetClickClient"
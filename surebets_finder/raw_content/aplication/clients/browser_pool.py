@@ -0,0 +1,115 @@
+import atexit
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from queue import Empty, LifoQueue
+from threading import BoundedSemaphore, Lock
+from typing import Callable, Iterator, List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+def _get_browser_driver_install_path() -> str:
+    file_path = Path(__file__)
+
+    return str(file_path.parent.parent.parent.parent / "browsers")
+
+
+@lru_cache(maxsize=1)
+def _install_chrome_driver() -> str:
+    return ChromeDriverManager(path=_get_browser_driver_install_path()).install()
+
+
+def build_chrome_web_driver() -> WebDriver:
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+
+    return webdriver.Chrome(_install_chrome_driver(), chrome_options=chrome_options)
+
+
+class BrowserPool:
+    """
+    Keeps up to `size` warm browser instances which are reused across urls and import runs.
+
+    Browsers are started lazily, at most `size` of them are in use at the same time and a browser which failed
+    while being used is quit and replaced by a fresh one on the next `acquire`.
+    """
+
+    def __init__(self, size: int = 2, driver_factory: Optional[Callable[[], WebDriver]] = None) -> None:
+        self._size = size
+        self._driver_factory = driver_factory or build_chrome_web_driver
+        self._slots = BoundedSemaphore(size)
+        self._idle: "LifoQueue[WebDriver]" = LifoQueue()
+        self._drivers: List[WebDriver] = []
+        self._lock = Lock()
+
+        atexit.register(self.close)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def started(self) -> int:
+        with self._lock:
+            return len(self._drivers)
+
+    def _take(self) -> WebDriver:
+        try:
+            return self._idle.get_nowait()
+        except Empty:
+            driver = self._driver_factory()
+
+            with self._lock:
+                self._drivers.append(driver)
+
+            return driver
+
+    def _discard(self, driver: WebDriver) -> None:
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def acquire(self) -> Iterator[WebDriver]:
+        with self._slots:
+            driver = self._take()
+
+            try:
+                yield driver
+            except Exception:
+                self._discard(driver)
+                raise
+
+            with self._lock:
+                is_alive = driver in self._drivers
+
+            if is_alive:
+                self._idle.put(driver)
+            else:
+                # the pool was closed while this browser was in use
+                self._discard(driver)
+
+    def close(self) -> None:
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+
+        while True:
+            try:
+                self._idle.get_nowait()
+            except Empty:
+                break
+
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
@@ -1,6 +1,21 @@
-from typing import Protocol
+from typing import Iterator, List, Protocol
+
+from surebets_finder.shared.content_format import ContentFormat
 
 
 class IWebClient(Protocol):
-    def get_raw_data(self) -> str:
+    @property
+    def urls(self) -> List[str]:
+        ...
+
+    @property
+    def content_format(self) -> ContentFormat:
+        """Format of the yielded pages"""
+        ...
+
+    def iter_pages(self, url: str) -> Iterator[str]:
+        """Yields pages of the given url as soon as they are downloaded"""
+        ...
+
+    def get_raw_data(self) -> List[str]:
         ...
@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Optional
+
+from requests import Response
+
+
+@dataclass
+class CachedResponse:
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class ConditionalRequestCache:
+    """
+    Remembers ETag/Last-Modified validators of the last response of every url,
+    so providers supporting conditional requests can answer an unchanged payload with `304 Not Modified`.
+    """
+
+    def __init__(self) -> None:
+        self._responses: Dict[str, CachedResponse] = {}
+        self._lock = Lock()
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        with self._lock:
+            cached = self._responses.get(url)
+
+        if cached is None:
+            return {}
+
+        headers = {}
+
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        return headers
+
+    def read(self, url: str, response: Response) -> str:
+        """Returns body of the response, or the remembered one when the provider replied with `304 Not Modified`"""
+
+        with self._lock:
+            cached = self._responses.get(url)
+
+            if response.status_code == 304 and cached is not None:
+                return cached.body
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+            if etag or last_modified:
+                self._responses[url] = CachedResponse(body=response.text, etag=etag, last_modified=last_modified)
+            else:
+                self._responses.pop(url, None)
+
+        return response.text
@@ -1,71 +1,110 @@
+import random
+from dataclasses import dataclass
+from datetime import datetime
 from logging import Logger
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
 
-from bs4 import BeautifulSoup
+import lxml.html
 from kink import inject
-from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.remote.webdriver import WebDriver
-from webdriver_manager.chrome import ChromeDriverManager
+from lxml import etree
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
+from surebets_finder.raw_content.aplication.clients.browser_pool import BrowserPool
 from surebets_finder.raw_content.aplication.clients.client import IWebClient
+from surebets_finder.raw_content.aplication.clients.throttling import ThrottleRegistry
 from surebets_finder.raw_content.domain.errors import RequestError
+from surebets_finder.shared.content_format import ContentFormat
+from surebets_finder.shared.efortuna_parser import iter_rows, rows_to_json
+from surebets_finder.shared.provider import Provider
+
+
+@dataclass(frozen=True)
+class EFortunaSettings:
+    """
+    With `ContentFormat.ROWS` rows of the odds tables are extracted right after the page is downloaded and
+    stored instead of the html, `html_sample_rate` of pages is then written to `html_debug_dir` for debugging.
+    """
+
+    content_format: ContentFormat = ContentFormat.RAW
+    html_sample_rate: float = 0.0
+    html_debug_dir: Optional[Path] = None
 
 
 @inject
 class EFortunaClient(IWebClient):
     MAIN_HTML_DIV_ID = "main-content"
-
-    def __init__(self, urls: List[str], logger: Logger) -> None:
+    PAGE_LOAD_TIMEOUT = 20
+
+    def __init__(
+        self,
+        urls: List[str],
+        logger: Logger,
+        browser_pool: BrowserPool,
+        throttles: ThrottleRegistry,
+        settings: EFortunaSettings,
+    ) -> None:
         self._urls = urls
         self._logger = logger
-        self._driver = self._build_chrome_web_driver()
+        self._browser_pool = browser_pool
+        self._throttle = throttles.get(Provider.EFORTUNA)
+        self._settings = settings
 
-    def _build_chrome_web_driver(self) -> WebDriver:
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
+    def _make_request(self, url: str) -> str:
+        # a browser which raised is quit by the pool and replaced with a fresh one on the next request
+        with self._throttle.request(), self._browser_pool.acquire() as driver:
+            try:
+                driver.set_page_load_timeout(self.PAGE_LOAD_TIMEOUT)
+                driver.get(url)
+                return driver.page_source
+            except TimeoutException as e:
+                self._logger.exception(f"[efortuna.pl] Timeout Error! {str(e)}")
+                raise RequestError("Timeout Error!") from e
+            except WebDriverException as e:
+                self._logger.exception(f"[efortuna.pl] WebDriver Error! {str(e)}")
+                raise RequestError("WebDriver Error!") from e
 
-        chrome_web_driver = webdriver.Chrome(
-            ChromeDriverManager(path=self._get_browser_driver_install_path()).install(), chrome_options=chrome_options
-        )
+    def _extract_information(self, page_content: str) -> str:
+        """Cuts out markup of the main content (odds tables) from the rendered page"""
 
-        return chrome_web_driver
+        try:
+            main_content = lxml.html.fromstring(page_content).get_element_by_id(self.MAIN_HTML_DIV_ID)
+        except (KeyError, etree.ParserError) as e:
+            raise RequestError(f"There is no `{self.MAIN_HTML_DIV_ID}` on the page!") from e
 
-    def _get_browser_driver_install_path(self) -> str:
-        file_path = Path(__file__)
+        return lxml.html.tostring(main_content, encoding="unicode")
 
-        return str(file_path.parent.parent.parent.parent / "browsers")
+    def _sample_html(self, url: str, main_content: str) -> None:
+        if self._settings.html_debug_dir is None or random.random() >= self._settings.html_sample_rate:
+            return
 
-    def _make_request(self, url: str) -> str:
-        try:
-            self._driver.set_page_load_timeout(20)
-            self._driver.get(url)
-            return self._driver.page_source
-        except TimeoutException as e:
-            self._logger.exception(f"[efortuna.pl] Timeout Error! {str(e)}")
-            self._driver.close()
-            raise RequestError("Timeout Error! {str(e)}")
+        self._settings.html_debug_dir.mkdir(parents=True, exist_ok=True)
+        file_path = self._settings.html_debug_dir / f"{datetime.utcnow():%Y%m%dT%H%M%S%f}.html"
+        file_path.write_text(main_content)
 
-    def _extract_information(self, page_content: str) -> str:
-        soup = BeautifulSoup(page_content, "html.parser")
+        self._logger.info(f"[efortuna.pl] Html of {url} saved to {file_path} for debugging")
 
-        main_content = soup.find(id=self.MAIN_HTML_DIV_ID).prettify()
-        main_content = main_content.replace('<div=""', "")
+    @property
+    def urls(self) -> List[str]:
+        return self._urls
 
-        return main_content
+    @property
+    def content_format(self) -> ContentFormat:
+        return self._settings.content_format
 
-    def get_raw_data(self) -> str:
-        all_data = ""
+    def iter_pages(self, url: str) -> Iterator[str]:
+        content = self._make_request(url)
+        main_content = self._extract_information(content)
 
-        for url in self._urls:
-            content = self._make_request(url)
-            filtered_content = self._extract_information(content)
+        if self.content_format == ContentFormat.ROWS:
+            self._sample_html(url, main_content)
+            yield rows_to_json(iter_rows(main_content))
+            return
 
-            all_data += filtered_content
+        yield main_content
 
-        return all_data
+    def get_raw_data(self) -> List[str]:
+        return [page for url in self._urls for page in self.iter_pages(url)]
 
     def __str__(self) -> str:
         return "EFortunaClient"
@@ -0,0 +1,106 @@
+import random
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+from surebets_finder.raw_content.aplication.clients.throttling import ProviderThrottle
+
+DEFAULT_POOL_SIZE = 10
+
+# Number of keep-alive connections kept open per host, hosts which are not listed use DEFAULT_POOL_SIZE
+POOL_SIZES: Dict[str, int] = {
+    "https://offer.cdn.begmedia.com": 16,
+    "https://app.lvbet.pl": 8,
+}
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+STATUS_RETRIES = 3
+
+
+class JitteredRetry(Retry):
+    """
+    Exponential backoff with a random jitter added on top of it,
+    so that many concurrent requests do not retry against the provider in lockstep.
+    """
+
+    MAX_JITTER = 0.5
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+
+        if backoff <= 0:
+            return 0
+
+        return backoff + random.uniform(0, self.MAX_JITTER)
+
+
+def build_retry(total: int = 3, backoff_factor: float = 0.3) -> Retry:
+    """
+    Retries only failed connections and reads. Responses with throttling statuses are retried by
+    `get_throttled`, so every attempt goes through the throttle of the provider.
+    """
+
+    return JitteredRetry(
+        total=total,
+        connect=total,
+        read=total,
+        status=0,
+        backoff_factor=backoff_factor,
+        raise_on_status=False,
+    )
+
+
+def get_throttled(
+    session: Session,
+    throttle: ProviderThrottle,
+    url: str,
+    retries: int = STATUS_RETRIES,
+    backoff_factor: float = 0.3,
+    sleep: Callable[[float], None] = time.sleep,
+    **kwargs: Any,
+) -> Response:
+    """
+    Sends GET request through `throttle` and retries responses with one of `RETRY_STATUSES` with jittered
+    exponential backoff. Every attempt takes its own token and reports its own status, so the throttle backs off
+    on them. The last response is returned whatever its status is.
+    """
+
+    for attempt in range(retries + 1):
+        with throttle.request() as outcome:
+            response = session.get(url, **kwargs)
+            outcome.status_code = response.status_code
+
+        if response.status_code not in RETRY_STATUSES or attempt == retries:
+            break
+
+        sleep(backoff_factor * 2**attempt + random.uniform(0, JitteredRetry.MAX_JITTER))
+
+    return response
+
+
+def build_http_session(pool_sizes: Optional[Mapping[str, int]] = None, retry: Optional[Retry] = None) -> Session:
+    """
+    Builds a keep-alive session shared by the JSON clients.
+
+    Every host listed in `pool_sizes` gets its own connection pool, failed connections and reads are retried with
+    backoff and responses are requested compressed (brotli is advertised only when the `brotli` package is installed).
+    """
+
+    pool_sizes = POOL_SIZES if pool_sizes is None else pool_sizes
+    retry = build_retry() if retry is None else retry
+
+    session = Session()
+    session.headers.update(make_headers(keep_alive=True, accept_encoding=True))
+
+    default_adapter = HTTPAdapter(pool_connections=DEFAULT_POOL_SIZE, pool_maxsize=DEFAULT_POOL_SIZE, max_retries=retry)
+    session.mount("https://", default_adapter)
+    session.mount("http://", default_adapter)
+
+    for host, pool_size in pool_sizes.items():
+        session.mount(host, HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry))
+
+    return session
@@ -1,25 +1,48 @@
 from logging import Logger
-from typing import List
+from typing import Iterator, List
 
 import requests
 from kink import inject
+from requests import Session
 
 from surebets_finder.raw_content.aplication.clients.client import IWebClient
+from surebets_finder.raw_content.aplication.clients.conditional_cache import ConditionalRequestCache
+from surebets_finder.raw_content.aplication.clients.http_session import get_throttled
+from surebets_finder.raw_content.aplication.clients.throttling import ThrottleRegistry
 from surebets_finder.raw_content.domain.errors import RequestError
+from surebets_finder.shared.content_format import ContentFormat
+from surebets_finder.shared.provider import Provider
 
 
 @inject
 class LvBetClient(IWebClient):
-    def __init__(self, urls: List[str], logger: Logger) -> None:
+    def __init__(
+        self,
+        urls: List[str],
+        logger: Logger,
+        session: Session,
+        response_cache: ConditionalRequestCache,
+        throttles: ThrottleRegistry,
+    ) -> None:
         self._urls = urls
         self._logger = logger
+        self._session = session
+        self._response_cache = response_cache
+        self._throttle = throttles.get(Provider.LVBET)
 
     def _make_request(self, url: str) -> str:
         try:
-            response = requests.get(url=url, timeout=(2, 3))
+            response = get_throttled(
+                self._session,
+                self._throttle,
+                url,
+                headers=self._response_cache.conditional_headers(url),
+                timeout=(2, 3),
+            )
+
             response.raise_for_status()
 
-            return response.text
+            return self._response_cache.read(url, response)
         except requests.exceptions.HTTPError as e:
             self._logger.exception(f"[lvbet.pl] HTTP Error! {str(e)}")
             raise RequestError("HTTP Error!") from e
@@ -33,14 +56,19 @@ class LvBetClient(IWebClient):
             self._logger.exception(f"[lvbet.pl] Request Error! {str(e)}")
             raise RequestError("Request Error!") from e
 
-    def get_raw_data(self) -> str:
-        all_data = ""
+    @property
+    def urls(self) -> List[str]:
+        return self._urls
+
+    @property
+    def content_format(self) -> ContentFormat:
+        return ContentFormat.RAW
 
-        for url in self._urls:
-            content = self._make_request(url)
-            all_data += content
+    def iter_pages(self, url: str) -> Iterator[str]:
+        yield self._make_request(url)
 
-        return all_data
+    def get_raw_data(self) -> List[str]:
+        return [page for url in self._urls for page in self.iter_pages(url)]
 
     def __str__(self) -> str:
         return "BetClickClient"
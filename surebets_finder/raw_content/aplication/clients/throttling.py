@@ -0,0 +1,236 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from threading import Condition, Lock
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, get_type_hints
+
+from surebets_finder.shared.provider import Provider
+
+THROTTLING_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class ThrottleConfig:
+    rate: float
+    burst: int
+    min_concurrency: int = 1
+    max_concurrency: int = 4
+    latency_threshold: float = 2.0
+    backoff_factor: float = 0.5
+
+
+DEFAULT_THROTTLE_CONFIGS: Dict[Provider, ThrottleConfig] = {
+    Provider.EFORTUNA: ThrottleConfig(rate=1, burst=2, max_concurrency=2, latency_threshold=15),
+    Provider.LVBET: ThrottleConfig(rate=5, burst=5, max_concurrency=4),
+    Provider.BETCLICK: ThrottleConfig(rate=10, burst=10, max_concurrency=8),
+}
+
+# e.g. THROTTLE_LVBET="rate=2,max_concurrency=2" overrides the given fields of the default config of LVBet
+THROTTLE_ENV_PREFIX = "THROTTLE_"
+
+
+def parse_throttle_config(spec: str, base: ThrottleConfig) -> ThrottleConfig:
+    """Overrides fields of `base` given as comma separated FIELD=VALUE pairs, raises ValueError on unknown fields"""
+
+    types = get_type_hints(ThrottleConfig)
+    overrides: Dict[str, Any] = {}
+
+    for pair in filter(None, (item.strip() for item in spec.split(","))):
+        name, value = pair.split("=")
+
+        if name not in types:
+            raise ValueError(f"`{name}` is not a field of ThrottleConfig, fields {list(types)}")
+
+        overrides[name] = types[name](value)
+
+    return replace(base, **overrides)
+
+
+def load_throttle_configs(environ: Mapping[str, str]) -> Dict[Provider, ThrottleConfig]:
+    return {
+        provider: parse_throttle_config(environ.get(f"{THROTTLE_ENV_PREFIX}{provider.name}", ""), config)
+        for provider, config in DEFAULT_THROTTLE_CONFIGS.items()
+    }
+
+
+@dataclass
+class ThrottleState:
+    provider: Provider
+    rate: float
+    tokens: float
+    concurrency_limit: int
+    in_flight: int
+    succeeded: int
+    throttled: int
+
+
+@dataclass
+class RequestOutcome:
+    status_code: Optional[int] = None
+
+
+class TokenBucket:
+    """Lets through at most `rate` requests per second on average and bursts of up to `capacity` requests"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._lock = Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """Blocks until a token is available, returns number of seconds spent on waiting"""
+
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                self._refill()
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+
+                delay = (1 - self._tokens) / self._rate
+
+            self._sleep(delay)
+            waited += delay
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD controller of the number of requests in flight: the limit grows by one after a limit's worth of
+    successful requests and is multiplied by `backoff_factor` after every throttled one.
+    """
+
+    def __init__(self, min_limit: int, max_limit: int, backoff_factor: float = 0.5) -> None:
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff_factor = backoff_factor
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._condition = Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+
+            self._in_flight += 1
+
+    def release(self, succeeded: bool) -> None:
+        with self._condition:
+            self._in_flight -= 1
+
+            if succeeded:
+                self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+            else:
+                self._limit = max(self._min_limit, self._limit * self._backoff_factor)
+
+            self._condition.notify_all()
+
+
+class ProviderThrottle:
+    def __init__(self, provider: Provider, config: ThrottleConfig) -> None:
+        self._provider = provider
+        self._config = config
+        self._bucket = TokenBucket(config.rate, config.burst)
+        self._concurrency = AdaptiveConcurrencyLimiter(
+            config.min_concurrency, config.max_concurrency, config.backoff_factor
+        )
+        self._succeeded = 0
+        self._throttled = 0
+        self._lock = Lock()
+
+    def _is_healthy(self, outcome: RequestOutcome, latency: float, raised: bool) -> bool:
+        if outcome.status_code in THROTTLING_STATUSES or latency > self._config.latency_threshold:
+            return False
+
+        # an error without any response (connection error, timeout) is treated as a sign of an overload too
+        return not raised or outcome.status_code is not None
+
+    @contextmanager
+    def request(self) -> Iterator[RequestOutcome]:
+        """
+        Waits for a free concurrency slot and a rate limit token, the caller should record status code
+        of the response on the yielded outcome.
+        """
+
+        outcome = RequestOutcome()
+        raised = True
+
+        self._concurrency.acquire()
+        started_at = time.perf_counter()
+
+        try:
+            self._bucket.acquire()
+            started_at = time.perf_counter()
+
+            yield outcome
+
+            raised = False
+        finally:
+            is_healthy = self._is_healthy(outcome, time.perf_counter() - started_at, raised)
+            self._concurrency.release(is_healthy)
+
+            with self._lock:
+                if is_healthy:
+                    self._succeeded += 1
+                else:
+                    self._throttled += 1
+
+    def state(self) -> ThrottleState:
+        with self._lock:
+            return ThrottleState(
+                provider=self._provider,
+                rate=self._bucket.rate,
+                tokens=round(self._bucket.tokens, 2),
+                concurrency_limit=self._concurrency.limit,
+                in_flight=self._concurrency.in_flight,
+                succeeded=self._succeeded,
+                throttled=self._throttled,
+            )
+
+
+class ThrottleRegistry:
+    def __init__(self, configs: Optional[Mapping[Provider, ThrottleConfig]] = None) -> None:
+        configs = DEFAULT_THROTTLE_CONFIGS if configs is None else configs
+        self._throttles = {provider: ProviderThrottle(provider, config) for provider, config in configs.items()}
+
+    def get(self, provider: Provider) -> ProviderThrottle:
+        return self._throttles[provider]
+
+    def states(self) -> List[ThrottleState]:
+        return [throttle.state() for throttle in self._throttles.values()]
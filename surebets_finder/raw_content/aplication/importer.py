@@ -1,5 +1,9 @@
+import hashlib
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from logging import Logger
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from bson.objectid import ObjectId
 from kink import inject
@@ -10,11 +14,28 @@ from surebets_finder.raw_content.aplication.clients.efortuna_client import EFort
 from surebets_finder.raw_content.aplication.clients.lvbet_client import LvBetClient
 from surebets_finder.raw_content.aplication.url_factory import UrlFactory
 from surebets_finder.raw_content.domain.entities import RawContent
+from surebets_finder.raw_content.domain.errors import RawContentNotFoundError, RequestError
 from surebets_finder.raw_content.domain.repositories import RawContentRepository
 from surebets_finder.shared.category import Category
+from surebets_finder.shared.content_format import ContentFormat
 from surebets_finder.shared.provider import Provider
 
 
+@dataclass
+class UrlFetchReport:
+    provider: Provider
+    category: Category
+    url: str
+    elapsed: float
+    pages: List[str] = field(default_factory=list)
+    content_format: ContentFormat = ContentFormat.RAW
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
 @inject
 class Importer:
     def __init__(self, repository: RawContentRepository, logger: Logger) -> None:
@@ -23,28 +44,126 @@ class Importer:
 
     def _get_client(self, provider: Provider, urls: List[str]) -> IWebClient:
         mapper = {
-            Provider.EFORTUNA: EFortunaClient(urls),  # type: ignore
-            Provider.LVBET: LvBetClient(urls),  # type: ignore
-            Provider.BETCLICK: BetClickClient(urls),  # type: ignore
+            Provider.EFORTUNA: EFortunaClient,
+            Provider.LVBET: LvBetClient,
+            Provider.BETCLICK: BetClickClient,
         }
 
-        return mapper[provider]
+        return mapper[provider](urls)  # type: ignore
+
+    def _fetch(self, client: IWebClient, provider: Provider, category: Category, url: str) -> UrlFetchReport:
+        started_at = time.perf_counter()
+
+        try:
+            pages = list(client.iter_pages(url))
+        except RequestError as e:
+            return UrlFetchReport(provider, category, url, time.perf_counter() - started_at, error=str(e))
+        except Exception as e:
+            # an unexpected error of one client must not abort fetching of the other providers
+            self._logger.exception(f"[{provider.value}] Unexpected error while fetching {url}!")
+            return UrlFetchReport(
+                provider, category, url, time.perf_counter() - started_at, error=f"{type(e).__name__}: {e}"
+            )
+
+        return UrlFetchReport(
+            provider,
+            category,
+            url,
+            time.perf_counter() - started_at,
+            pages=pages,
+            content_format=client.content_format,
+        )
+
+    def _store(self, provider: Provider, category: Category, reports: List[UrlFetchReport]) -> None:
+        failed = [report for report in reports if not report.succeeded]
+
+        if failed:
+            self._logger.error(
+                f"Skipping category={category.value} and provider={provider.value}, "
+                f"{len(failed)} of {len(reports)} urls could not be fetched!"
+            )
+            return
+
+        pages = [page for report in reports for page in report.pages]
+        content_hash = self._hash_pages(pages)
+
+        if self._is_unchanged(provider, category, content_hash):
+            self._logger.info(
+                f"Content of category={category.value} and provider={provider.value} has not changed, skipping it!"
+            )
+            return
+
+        raw_content = RawContent(
+            id=ObjectId(),
+            pages=pages,
+            category=category,
+            provider=provider,
+            content_hash=content_hash,
+            content_format=reports[0].content_format,
+        )
+
+        self._repository.create(raw_content)
+
+    def _hash_pages(self, pages: List[str]) -> str:
+        content_hash = hashlib.sha256()
+
+        for page in pages:
+            content_hash.update(page.encode())
+            content_hash.update(b"\0")
+
+        return content_hash.hexdigest()
+
+    def _is_unchanged(self, provider: Provider, category: Category, content_hash: str) -> bool:
+        try:
+            return self._repository.get_latest_content_hash(provider, category) == content_hash
+        except RawContentNotFoundError:
+            return False
+
+    def _log_timings(self, reports: List[UrlFetchReport]) -> None:
+        for report in sorted(reports, key=lambda item: item.elapsed, reverse=True):
+            status = "OK" if report.succeeded else f"FAILED ({report.error})"
+            self._logger.info(f"[{report.provider.value}] {report.elapsed:.3f}s {status} {report.url}")
+
+    def import_all(self, max_workers: int = 1, providers: Optional[Iterable[Provider]] = None) -> List[UrlFetchReport]:
+        """
+        Fetches every url of every provider/category pair using at most `max_workers` concurrent requests.
+        RawContent of a given pair is stored as soon as all of its urls are fetched, so a slow provider
+        does not hold up the others. All providers are imported unless `providers` are given.
+        """
+
+        providers = list(Provider) if providers is None else list(providers)
+        self._logger.info(f"Importer has started with max_workers={max_workers}!")
+
+        reports: List[UrlFetchReport] = []
+        pending: Dict[Tuple[Provider, Category], List["Future[UrlFetchReport]"]] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="raw-content-importer") as executor:
+            for provider in providers:
+                for category in Category:
+                    urls = UrlFactory.create(provider, category).get_urls()
+                    client = self._get_client(provider, urls)
+                    self._logger.info(
+                        f"Importing data from category={category.value} and provider={provider.value} using {str(client)}"
+                    )
 
-    def import_all(self) -> None:
-        self._logger.info("Importer has started!")
+                    pending[(provider, category)] = [
+                        executor.submit(self._fetch, client, provider, category, url) for url in client.urls
+                    ]
 
-        for provider in Provider:
-            for category in Category:
-                urls = UrlFactory.create(provider, category).get_urls()
+            futures = {future: key for key, key_futures in pending.items() for future in key_futures}
+            remaining = {key: len(key_futures) for key, key_futures in pending.items()}
 
-                client = self._get_client(provider, urls)
+            for future in as_completed(futures):
+                reports.append(future.result())
 
-                self._logger.info(
-                    f"Importing data from category={category.value} and provider={provider.value} using {str(client)}"
-                )
+                provider, category = futures[future]
+                remaining[(provider, category)] -= 1
 
-                content = client.get_raw_data()
+                if remaining[(provider, category)] == 0:
+                    self._store(
+                        provider, category, [key_future.result() for key_future in pending[(provider, category)]]
+                    )
 
-                raw_content = RawContent(id=ObjectId(), content=content, category=category, provider=provider)
+        self._log_timings(reports)
 
-                self._repository.create(raw_content)
+        return reports
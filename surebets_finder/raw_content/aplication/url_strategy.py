@@ -41,7 +41,7 @@ class BetClickUrlStrategy(UrlStrategy):
     def get_urls(self) -> List[str]:
         if self._category == Category.ESPORT:
             return [
-                "https://offer.cdn.begmedia.com/api/pub/v4/events?application=2048&countrycode=pl&fetchMultipleDefaultMarkets=true&language=pa&limit=1000&offset=0&sitecode=plpa&sortBy=ByLiveRankingPreliveDate&sportIds=102"
+                "https://offer.cdn.begmedia.com/api/pub/v4/events?application=2048&countrycode=pl&fetchMultipleDefaultMarkets=true&language=pa&limit=100&offset=0&sitecode=plpa&sortBy=ByLiveRankingPreliveDate&sportIds=102"
             ]
 
         raise ValueError(
@@ -1,17 +1,34 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import List
 
 from bson.objectid import ObjectId
 
 from surebets_finder.shared.category import Category
+from surebets_finder.shared.content_format import ContentFormat
 from surebets_finder.shared.provider import Provider
 
 
 @dataclass
 class RawContent:
     id: ObjectId
-    content: str
+    pages: List[str]
     category: Category
     provider: Provider
     was_processed: bool = False
-    created_at: datetime = datetime.utcnow()
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    content_hash: str = ""
+    content_format: ContentFormat = ContentFormat.RAW
+
+
+@dataclass(frozen=True)
+class RawContentMetadata:
+    """Raw content read without its pages, so it cannot be mistaken for an empty one and saved back"""
+
+    id: ObjectId
+    category: Category
+    provider: Provider
+    was_processed: bool
+    created_at: datetime
+    content_hash: str
+    content_format: ContentFormat
@@ -1,8 +1,14 @@
-from typing import List, Protocol
+from datetime import timedelta
+from typing import Iterable, Iterator, List, Optional, Protocol
 
 from bson.objectid import ObjectId
 
-from surebets_finder.raw_content.domain.entities import RawContent
+from surebets_finder.raw_content.domain.entities import RawContent, RawContentMetadata
+from surebets_finder.shared.category import Category
+from surebets_finder.shared.provider import Provider
+
+# raw contents are large, a cursor fetches only a few of them at once
+RAW_CONTENT_BATCH_SIZE = 20
 
 
 class RawContentRepository(Protocol):  # pragma: no cover
@@ -12,8 +18,46 @@ class RawContentRepository(Protocol):  # pragma: no cover
     def create(self, raw_content: RawContent) -> None:
         ...
 
-    def get_all_unprocessed(self) -> List[RawContent]:
+    def get_all_unprocessed(self, provider: Optional[Provider] = None) -> List[RawContent]:
+        ...
+
+    def iter_unprocessed(
+        self, provider: Optional[Provider] = None, batch_size: int = RAW_CONTENT_BATCH_SIZE
+    ) -> Iterator[RawContent]:
+        """Yields raw contents as the cursor fetches them in batches of `batch_size`"""
+        ...
+
+    def iter_unprocessed_metadata(
+        self, provider: Optional[Provider] = None, batch_size: int = RAW_CONTENT_BATCH_SIZE
+    ) -> Iterator[RawContentMetadata]:
+        """Yields ids and metadata of raw contents without fetching their pages"""
         ...
 
     def save(self, raw_content: RawContent) -> None:
         ...
+
+    def claim_unprocessed(
+        self, owner: str, lease: timedelta, provider: Optional[Provider] = None
+    ) -> Optional[RawContent]:
+        """
+        Atomically leases the oldest unprocessed raw content which is not leased by anyone else to `owner`
+        for `lease`, returns None when there is nothing left to claim.
+        """
+        ...
+
+    def mark_as_processed(self, raw_content_ids: Iterable[ObjectId], owner: Optional[str] = None) -> int:
+        """
+        Marks raw contents as processed and releases their leases, returns number of marked raw contents.
+        With `owner` only raw contents which are still leased to it are marked.
+        """
+        ...
+
+    def get_latest_content_hash(self, provider: Provider, category: Category) -> str:
+        ...
+
+    def compress_uncompressed(self, batch_size: int = 100) -> int:
+        ...
+
+    def create_indexes(self) -> List[str]:
+        """Creates indexes which do not exist yet, returns names of all indexes of the repository"""
+        ...
@@ -1,22 +1,25 @@
 from dataclasses import dataclass
+from datetime import timedelta
 from logging import Logger
-from typing import List
+from typing import Iterator, List, Optional
 
 from bson.objectid import ObjectId
 from kink import inject
 
 from surebets_finder.raw_content.domain.entities import RawContent
-from surebets_finder.raw_content.domain.repositories import RawContentRepository
+from surebets_finder.raw_content.domain.repositories import RAW_CONTENT_BATCH_SIZE, RawContentRepository
 from surebets_finder.shared.category import Category
+from surebets_finder.shared.content_format import ContentFormat
 from surebets_finder.shared.provider import Provider
 
 
 @dataclass
 class RawContentDTO:
     id: ObjectId
-    content: str
+    pages: List[str]
     category: Category
     provider: Provider
+    content_format: ContentFormat = ContentFormat.RAW
 
 
 @inject
@@ -27,21 +30,38 @@ class RawContentFacade:
 
     def _to_dto(self, raw_content: RawContent) -> RawContentDTO:
         return RawContentDTO(
-            id=raw_content.id, content=raw_content.content, category=raw_content.category, provider=raw_content.provider
+            id=raw_content.id,
+            pages=raw_content.pages,
+            category=raw_content.category,
+            provider=raw_content.provider,
+            content_format=raw_content.content_format,
         )
 
-    def get_all_unprocessed_raw_contents(self) -> List[RawContentDTO]:
+    def get_all_unprocessed_raw_contents(self, provider: Optional[Provider] = None) -> List[RawContentDTO]:
         self._logger.info("Getting all unprocessed raw contents")
 
-        records = self._repository.get_all_unprocessed()
+        return list(self.iter_unprocessed_raw_contents(provider))
 
-        return [self._to_dto(record) for record in records]
+    def iter_unprocessed_raw_contents(
+        self, provider: Optional[Provider] = None, batch_size: int = RAW_CONTENT_BATCH_SIZE
+    ) -> Iterator[RawContentDTO]:
+        for record in self._repository.iter_unprocessed(provider, batch_size):
+            yield self._to_dto(record)
 
-    def mark_raw_content_as_processed(self, raw_content_id: ObjectId) -> None:
-        self._logger.info(f"Marking raw_content with id={raw_content_id} as processed")
+    def claim_unprocessed_raw_content(
+        self, owner: str, lease: timedelta, provider: Optional[Provider] = None
+    ) -> Optional[RawContentDTO]:
+        """
+        Leases an unprocessed raw content to `owner`, so other workers do not claim it until it is marked as
+        processed or the lease expires.
+        """
+
+        raw_content = self._repository.claim_unprocessed(owner, lease, provider)
 
-        raw_content = self._repository.get(raw_content_id)
+        return self._to_dto(raw_content) if raw_content else None
 
-        raw_content.was_processed = True
+    def mark_raw_content_as_processed(self, raw_content_id: ObjectId, owner: Optional[str] = None) -> None:
+        self._logger.info(f"Marking raw_content with id={raw_content_id} as processed")
 
-        self._repository.save(raw_content)
+        if not self._repository.mark_as_processed([raw_content_id], owner):
+            self._logger.warning(f"RawContent with id={raw_content_id} is not leased to {owner} anymore")
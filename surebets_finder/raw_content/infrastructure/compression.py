@@ -0,0 +1,74 @@
+import gzip
+from typing import Dict, Protocol
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+class Codec(Protocol):
+    name: str
+
+    def compress(self, data: bytes) -> bytes:
+        ...
+
+    def decompress(self, data: bytes) -> bytes:
+        ...
+
+
+class IdentityCodec(Codec):
+    """Used for documents stored before compression was introduced"""
+
+    name = "identity"
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+
+class GzipCodec(Codec):
+    name = "gzip"
+
+    def __init__(self, level: int = 6) -> None:
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=self._level, mtime=0)
+
+    def decompress(self, data: bytes) -> bytes:
+        return gzip.decompress(data)
+
+
+class ZstdCodec(Codec):
+    name = "zstd"
+
+    def __init__(self, level: int = 10) -> None:
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=self._level).compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zstandard.ZstdDecompressor().decompress(data)
+
+
+CODECS: Dict[str, Codec] = {IdentityCodec.name: IdentityCodec(), GzipCodec.name: GzipCodec()}
+
+if zstandard is not None:  # pragma: no cover
+    CODECS[ZstdCodec.name] = ZstdCodec()
+
+
+def get_default_codec() -> Codec:
+    """zstd when the optional `zstandard` package is installed, gzip otherwise"""
+
+    return CODECS.get(ZstdCodec.name, CODECS[GzipCodec.name])
+
+
+def get_codec(name: str) -> Codec:
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Codec `{name}` is not supported! Supported codecs {list(CODECS)}")
@@ -1,37 +1,87 @@
 from dataclasses import asdict
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
+from bson.binary import Binary
 from bson.objectid import ObjectId
 from kink import inject
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument, UpdateOne
+from pymongo.cursor import Cursor
 from pymongo.database import Database
 
-from surebets_finder.raw_content.domain.entities import RawContent
+from surebets_finder.raw_content.domain.entities import RawContent, RawContentMetadata
 from surebets_finder.raw_content.domain.errors import RawContentNotFoundError
-from surebets_finder.raw_content.domain.repositories import RawContentRepository
+from surebets_finder.raw_content.domain.repositories import RAW_CONTENT_BATCH_SIZE, RawContentRepository
+from surebets_finder.raw_content.infrastructure.compression import IdentityCodec, get_codec, get_default_codec
 from surebets_finder.shared.category import Category
+from surebets_finder.shared.content_format import ContentFormat
 from surebets_finder.shared.provider import Provider
 from surebets_finder.shared.reflection import raises
 
+# without pages only ids and metadata of raw contents are fetched
+WITHOUT_PAGES_PROJECTION = {"pages": False, "content": False}
+
+INDEXES = [
+    # only a small backlog of raw contents is unprocessed, the index does not grow with the history
+    IndexModel(
+        [("was_processed", ASCENDING), ("provider", ASCENDING)],
+        name="unprocessed",
+        partialFilterExpression={"was_processed": False},
+    ),
+    IndexModel([("provider", ASCENDING), ("category", ASCENDING), ("_id", DESCENDING)], name="latest"),
+]
+
 
 @inject(alias=RawContentRepository)
 class MongoDBRawContentRepository(RawContentRepository):
     def __init__(self, database: Database):
         self._collection = database["raw_content"]
+        self._codec = get_default_codec()
 
     def _serialize(self, data: Any) -> Dict[Any, Any]:
         """Mainly for Enum serialization"""
 
         return {field: value.value if isinstance(value, Enum) else value for field, value in data}
 
+    def _compress(self, pages: List[str]) -> Dict[str, Any]:
+        return {
+            "pages": [Binary(self._codec.compress(page.encode())) for page in pages],
+            "content_codec": self._codec.name,
+        }
+
+    def _decompress(self, document: Dict[str, Any]) -> List[str]:
+        """
+        Documents without `pages` were stored before pages were introduced and keep all of them in `content`,
+        documents without `content_codec` were stored before compression was introduced.
+        """
+
+        codec = get_codec(document.get("content_codec", IdentityCodec.name))
+        pages: List[Union[str, bytes]] = document["pages"] if "pages" in document else [document["content"]]
+
+        return [page if isinstance(page, str) else codec.decompress(page).decode() for page in pages]
+
     def _to_entity(self, document: Dict[str, Any]) -> RawContent:
         return RawContent(
             id=document["_id"],
-            content=document["content"],
+            pages=self._decompress(document),
             category=Category(document["category"]),
             provider=Provider(document["provider"]),
             was_processed=document["was_processed"],
             created_at=document["created_at"],
+            content_hash=document.get("content_hash", ""),
+            content_format=ContentFormat(document.get("content_format", ContentFormat.RAW.value)),
+        )
+
+    def _to_metadata(self, document: Dict[str, Any]) -> RawContentMetadata:
+        return RawContentMetadata(
+            id=document["_id"],
+            category=Category(document["category"]),
+            provider=Provider(document["provider"]),
+            was_processed=document["was_processed"],
+            created_at=document["created_at"],
+            content_hash=document.get("content_hash", ""),
+            content_format=ContentFormat(document.get("content_format", ContentFormat.RAW.value)),
         )
 
     @raises(RawContentNotFoundError)
@@ -47,23 +97,130 @@ class MongoDBRawContentRepository(RawContentRepository):
         document = asdict(raw_content, dict_factory=self._serialize)
 
         document["_id"] = document.pop("id")
+        document.update(self._compress(raw_content.pages))
 
         self._collection.insert_one(document)
 
-    def get_all_unprocessed(self) -> List[RawContent]:
-        documents = self._collection.find({"was_processed": False})
+    def get_all_unprocessed(self, provider: Optional[Provider] = None) -> List[RawContent]:
+        return list(self.iter_unprocessed(provider))
+
+    def _find_unprocessed(
+        self, provider: Optional[Provider], batch_size: int, projection: Optional[Dict[str, bool]] = None
+    ) -> Cursor:
+        query: Dict[str, Any] = {"was_processed": False}
+
+        if provider is not None:
+            query["provider"] = provider.value
 
-        return [self._to_entity(document) for document in documents]
+        return self._collection.find(query, projection=projection, batch_size=batch_size)
+
+    def iter_unprocessed(
+        self, provider: Optional[Provider] = None, batch_size: int = RAW_CONTENT_BATCH_SIZE
+    ) -> Iterator[RawContent]:
+        for document in self._find_unprocessed(provider, batch_size):
+            yield self._to_entity(document)
+
+    def iter_unprocessed_metadata(
+        self, provider: Optional[Provider] = None, batch_size: int = RAW_CONTENT_BATCH_SIZE
+    ) -> Iterator[RawContentMetadata]:
+        for document in self._find_unprocessed(provider, batch_size, WITHOUT_PAGES_PROJECTION):
+            yield self._to_metadata(document)
 
     def save(self, raw_content: RawContent) -> None:
         query = {"_id": raw_content.id}
         to_update = {
             "$set": {
-                "content": raw_content.content,
+                **self._compress(raw_content.pages),
                 "category": raw_content.category.value,
                 "provider": raw_content.provider.value,
                 "was_processed": raw_content.was_processed,
+                "content_hash": raw_content.content_hash,
+                "content_format": raw_content.content_format.value,
             }
         }
 
-        self._collection.update_one(query, to_update)
+        self._collection.update_one(query, {**to_update, "$unset": {"content": True}})
+
+    def claim_unprocessed(
+        self, owner: str, lease: timedelta, provider: Optional[Provider] = None
+    ) -> Optional[RawContent]:
+        now = datetime.utcnow()
+        # matches raw contents which were never leased and the ones whose lease has expired
+        query: Dict[str, Any] = {"was_processed": False, "lease_expires_at": {"$not": {"$gt": now}}}
+
+        if provider is not None:
+            query["provider"] = provider.value
+
+        document = self._collection.find_one_and_update(
+            query,
+            {"$set": {"lease_owner": owner, "lease_expires_at": now + lease}},
+            sort=[("_id", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+        return self._to_entity(document) if document else None
+
+    def mark_as_processed(self, raw_content_ids: Iterable[ObjectId], owner: Optional[str] = None) -> int:
+        ids = list(raw_content_ids)
+
+        if not ids:
+            return 0
+
+        query: Dict[str, Any] = {"_id": {"$in": ids}}
+
+        # a worker whose lease has expired meanwhile must not acknowledge a raw content claimed by another one
+        if owner is not None:
+            query["lease_owner"] = owner
+
+        result = self._collection.update_many(
+            query,
+            {"$set": {"was_processed": True}, "$unset": {"lease_owner": True, "lease_expires_at": True}},
+        )
+
+        return result.modified_count
+
+    @raises(RawContentNotFoundError)
+    def get_latest_content_hash(self, provider: Provider, category: Category) -> str:
+        document = self._collection.find_one(
+            {"provider": provider.value, "category": category.value},
+            projection={"content_hash": True},
+            sort=[("_id", DESCENDING)],
+        )
+
+        if not document:
+            raise RawContentNotFoundError(
+                f"RawContent with provider `{provider.value}` and category `{category.value}` does not exist."
+            )
+
+        return document.get("content_hash", "")
+
+    def compress_uncompressed(self, batch_size: int = 100) -> int:
+        """
+        Moves content of documents stored before compression or pages were introduced into compressed `pages`,
+        returns number of migrated documents.
+        """
+
+        documents = self._collection.find(
+            {"$or": [{"pages": {"$exists": False}}, {"content_codec": {"$in": [None, IdentityCodec.name]}}]},
+            projection={"content": True, "pages": True, "content_codec": True},
+            batch_size=batch_size,
+        )
+
+        compressed = 0
+        operations: List[UpdateOne] = []
+
+        for document in documents:
+            to_update = {"$set": self._compress(self._decompress(document)), "$unset": {"content": True}}
+            operations.append(UpdateOne({"_id": document["_id"]}, to_update))
+
+            if len(operations) == batch_size:
+                compressed += self._collection.bulk_write(operations, ordered=False).modified_count
+                operations = []
+
+        if operations:
+            compressed += self._collection.bulk_write(operations, ordered=False).modified_count
+
+        return compressed
+
+    def create_indexes(self) -> List[str]:
+        return self._collection.create_indexes(INDEXES)
@@ -0,0 +1,23 @@
+from itertools import islice
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yields lists of `size` consecutive items, the last one may be shorter"""
+
+    if size < 1:
+        raise ValueError(f"Batch size has to be at least 1, got {size}!")
+
+    iterator = iter(items)
+
+    while True:
+        batch = list(islice(iterator, size))
+
+        if not batch:
+            return
+
+        yield batch
@@ -0,0 +1,9 @@
+from enum import Enum, unique
+
+
+@unique
+class ContentFormat(Enum):
+    # response of a provider as it was downloaded (html or json)
+    RAW = "raw"
+    # rows already extracted from the html, see `surebets_finder.shared.efortuna_parser`
+    ROWS = "rows"
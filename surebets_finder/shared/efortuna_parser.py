@@ -0,0 +1,112 @@
+import json
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
+
+import lxml.html
+from lxml import etree
+
+from surebets_finder.shared.json_stream import iter_json_array
+
+if TYPE_CHECKING:  # pragma: no cover
+    from bs4.element import Tag
+
+LXML_BACKEND = "lxml"
+SOUP_BACKEND = "soup"
+
+# equivalent of the `table tbody tr` css selector, compiled once
+_ROWS_XPATH = etree.XPath(".//table//tbody//tr")
+
+
+@dataclass
+class EFortunaRow:
+    """Texts of a single row of efortuna odds table with collapsed white spaces, missing fields are left as None"""
+
+    classes: List[str] = field(default_factory=list)
+    market_name: Optional[str] = None
+    odds: List[str] = field(default_factory=list)
+    event_datetime: Optional[str] = None
+    url: Optional[str] = None
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _iter_rows_with_lxml(content: str) -> Iterator[EFortunaRow]:
+    document = lxml.html.document_fromstring(content)
+
+    for tr in _ROWS_XPATH(document):
+        row = EFortunaRow(classes=tr.get("class", "").split())
+
+        # a single walk over the row's subtree picks up all of the fields
+        for element in tr.iterdescendants(tag=etree.Element):
+            classes = element.get("class")
+
+            if not classes:
+                continue
+
+            classes = classes.split()
+
+            if "market-name" in classes and row.market_name is None:
+                row.market_name = _normalize_text(element.text_content())
+            elif "odds-value" in classes:
+                row.odds.append(_normalize_text(element.text_content()))
+            elif "event-datetime" in classes and row.event_datetime is None:
+                row.event_datetime = _normalize_text(element.text_content())
+
+            if element.tag == "a" and "event-name" in classes and row.url is None:
+                row.url = element.get("href", "")
+
+        yield row
+
+
+def _get_classes(item: "Tag") -> List[str]:
+    classes = item.get("class")
+
+    return list(classes) if classes else []
+
+
+def _iter_rows_with_soup(content: str) -> Iterator[EFortunaRow]:
+    # BeautifulSoup is imported only when the reference backend is requested explicitly
+    from bs4 import BeautifulSoup
+
+    parsed_content = BeautifulSoup(content, "html.parser")
+
+    for item in parsed_content.select("table tbody tr"):
+        market_name = item.select_one(".market-name")
+        event_datetime = item.select_one(".event-datetime")
+        url_html_tag = item.select_one("a.event-name")
+
+        yield EFortunaRow(
+            classes=_get_classes(item),
+            market_name=_normalize_text(market_name.text) if market_name is not None else None,
+            odds=[_normalize_text(odds.text) for odds in item.select(".odds-value")],
+            event_datetime=_normalize_text(event_datetime.text) if event_datetime is not None else None,
+            url=str(url_html_tag.get("href", "")) if url_html_tag is not None else None,
+        )
+
+
+def iter_rows(content: str, backend: str = LXML_BACKEND) -> Iterator[EFortunaRow]:
+    """
+    Yields rows of all odds tables found in the efortuna main content. The BeautifulSoup backend is several
+    times slower, it is kept as the reference implementation the lxml one is compared with.
+    """
+
+    if backend == LXML_BACKEND:
+        return _iter_rows_with_lxml(content)
+
+    if backend == SOUP_BACKEND:
+        return _iter_rows_with_soup(content)
+
+    raise ValueError(f"Backend `{backend}` is not supported! Supported backends {[LXML_BACKEND, SOUP_BACKEND]}")
+
+
+def rows_to_json(rows: Iterable[EFortunaRow]) -> str:
+    """Compact format of rows stored instead of the html, so the html does not need to be parsed again"""
+
+    return json.dumps([asdict(row) for row in rows], ensure_ascii=False, separators=(",", ":"))
+
+
+def rows_from_json(content: str) -> Iterator[EFortunaRow]:
+    for row in iter_json_array(content):
+        yield EFortunaRow(**row)
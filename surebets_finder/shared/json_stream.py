@@ -0,0 +1,40 @@
+import json
+import re
+from typing import Any, Iterator
+
+_DECODER = json.JSONDecoder()
+_WHITE_SPACES = re.compile(r"[ \t\n\r]*")
+
+
+def _skip_white_spaces(content: str, index: int) -> int:
+    return _WHITE_SPACES.match(content, index).end()  # type: ignore
+
+
+def iter_json_array(content: str) -> Iterator[Any]:
+    """
+    Decodes items of a top-level json array one at a time, so only a single item is kept in memory instead
+    of the whole decoded payload. Raises `ValueError` (`json.JSONDecodeError`) when content is not a valid array.
+    """
+
+    index = _skip_white_spaces(content, 0)
+
+    if not content.startswith("[", index):
+        raise json.JSONDecodeError("Expecting '['", content, index)
+
+    index = _skip_white_spaces(content, index + 1)
+
+    if content.startswith("]", index):
+        return
+
+    while True:
+        item, index = _DECODER.raw_decode(content, index)
+        yield item
+
+        index = _skip_white_spaces(content, index)
+
+        if content.startswith(",", index):
+            index = _skip_white_spaces(content, index + 1)
+        elif content.startswith("]", index):
+            return
+        else:
+            raise json.JSONDecodeError("Expecting ',' delimiter", content, index)
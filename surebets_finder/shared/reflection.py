@@ -1,6 +1,8 @@
+from dataclasses import fields
 from typing import Any, Callable, Dict, List, Type, TypeVar, cast
 
 T = TypeVar("T", bound=Callable[..., Any])
+C = TypeVar("C", bound=type)
 
 
 def raises(*allowed_exceptions: Type[Exception]) -> Callable[[T], T]:
@@ -23,3 +25,19 @@ def raises(*allowed_exceptions: Type[Exception]) -> Callable[[T], T]:
         return cast(T, _callable)
 
     return cast(Callable[[T], T], decorator)
+
+
+def with_slots(cls: C) -> C:
+    """
+    Recreates given dataclass with `__slots__` of its fields, like `dataclass(slots=True)` available since python 3.10.
+    Has to be applied on top of `@dataclass`.
+    """
+
+    field_names = tuple(field.name for field in fields(cls))
+    cls_dict = {name: value for name, value in cls.__dict__.items() if name not in field_names}
+
+    cls_dict["__slots__"] = field_names
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    return cast(C, type(cls)(cls.__name__, cls.__bases__, cls_dict))
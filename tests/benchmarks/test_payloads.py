@@ -0,0 +1,32 @@
+from typing import Callable
+
+import pytest
+
+from benchmarks.payloads import SUB_MARKETS_EVERY, betclick_json, efortuna_html, lvbet_json
+from surebets_finder.bet.application.bet_finder import BetClickBetFinder, BetFinder, EFortunaBetFinder, LVBetBetFinder
+from surebets_finder.shared.category import Category
+
+
+@pytest.mark.parametrize(
+    "finder_class, generate",
+    [(EFortunaBetFinder, efortuna_html), (BetClickBetFinder, betclick_json), (LVBetBetFinder, lvbet_json)],
+)
+def test_finders_find_a_bet_for_every_generated_event(
+    finder_class: Callable[[], BetFinder], generate: Callable[[int], str]
+) -> None:
+    # given
+    events = 2 * SUB_MARKETS_EVERY + 1
+
+    # when
+    bets = finder_class().find_bets(generate(events), Category.ESPORT)
+
+    # then
+    assert len(bets) == events
+    assert all(bet.opponent_1 != bet.opponent_2 and bet.odds_1 > 1 for bet in bets)
+
+
+@pytest.mark.parametrize("generate", [efortuna_html, betclick_json, lvbet_json])
+def test_generated_payloads_are_deterministic(generate: Callable[[int], str]) -> None:
+    # then
+    assert generate(10) == generate(10)
+    assert generate(10, seed=1) != generate(10)
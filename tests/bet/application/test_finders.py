@@ -1,10 +1,21 @@
+import json
+import logging
 from pathlib import Path
+from typing import Any, Tuple
+from unittest.mock import Mock
 
 import pytest
 
-from surebets_finder.bet.application.bet_finder import BetClickBetFinder, EFortunaBetFinder, LVBetBetFinder
+from surebets_finder.bet.application.bet_finder import (
+    BetClickBetFinder,
+    EFortunaBetFinder,
+    EFortunaRowsBetFinder,
+    LVBetBetFinder,
+)
 from surebets_finder.bet.domain.entities import Bet
 from surebets_finder.shared.category import Category
+from surebets_finder.shared.efortuna_parser import SOUP_BACKEND, iter_rows, rows_to_json
+from surebets_finder.shared.provider import Provider
 
 
 @pytest.fixture
@@ -65,3 +76,120 @@ def test_lvbet_bet_finder_correctly_mapping_to_bet_entity(lvbet_raw_content: str
 
     # then
     assert isinstance(result[0], Bet)
+
+
+@pytest.mark.parametrize(
+    "finder_class, fixture, provider",
+    [
+        (EFortunaBetFinder, "efortuna_raw_content", Provider.EFORTUNA),
+        (BetClickBetFinder, "bet_click_raw_content", Provider.BETCLICK),
+        (LVBetBetFinder, "lvbet_raw_content", Provider.LVBET),
+    ],
+)
+def test_bet_finders_tag_bets_with_their_provider(
+    finder_class: Any, fixture: str, provider: Provider, request: pytest.FixtureRequest
+) -> None:
+    # given
+    finder = finder_class()
+
+    # when
+    bets = finder.find_bets(request.getfixturevalue(fixture), Category.ESPORT)
+
+    # then
+    assert {bet.provider for bet in bets} == {provider}
+
+
+def test_efortuna_bet_finder_backends_find_the_same_bets(efortuna_raw_content: str) -> None:
+    # given
+    def to_comparable(bet: Bet) -> Tuple[Any, ...]:
+        return bet.opponent_1, bet.opponent_2, bet.odds_1, bet.odds_2, bet.date, bet.url
+
+    lxml_finder = EFortunaBetFinder()  # type: ignore
+    soup_finder = EFortunaBetFinder()  # type: ignore
+    soup_finder._backend = SOUP_BACKEND
+
+    # when
+    lxml_bets = lxml_finder.find_bets(efortuna_raw_content, Category.ESPORT)
+    soup_bets = soup_finder.find_bets(efortuna_raw_content, Category.ESPORT)
+
+    # then
+    assert len(lxml_bets) > 0
+    assert [to_comparable(bet) for bet in lxml_bets] == [to_comparable(bet) for bet in soup_bets]
+
+
+def test_efortuna_rows_bet_finder_finds_the_same_bets_as_html_finder(efortuna_raw_content: str) -> None:
+    # given
+    def to_comparable(bet: Bet) -> Tuple[Any, ...]:
+        return bet.opponent_1, bet.opponent_2, bet.odds_1, bet.odds_2, bet.date, bet.url
+
+    rows_content = rows_to_json(iter_rows(efortuna_raw_content))
+
+    # when
+    html_bets = EFortunaBetFinder().find_bets(efortuna_raw_content, Category.ESPORT)  # type: ignore
+    rows_bets = EFortunaRowsBetFinder().find_bets(rows_content, Category.ESPORT)  # type: ignore
+
+    # then
+    assert len(rows_bets) > 0
+    assert [to_comparable(bet) for bet in rows_bets] == [to_comparable(bet) for bet in html_bets]
+
+
+@pytest.mark.parametrize(
+    "finder_class, fixture",
+    [
+        (EFortunaBetFinder, "efortuna_raw_content"),
+        (BetClickBetFinder, "bet_click_raw_content"),
+        (LVBetBetFinder, "lvbet_raw_content"),
+    ],
+)
+def test_bet_finders_yield_bets_one_at_a_time(finder_class: Any, fixture: str, request: pytest.FixtureRequest) -> None:
+    # given
+    content = request.getfixturevalue(fixture)
+    finder = finder_class()
+
+    # when
+    bets = finder.iter_bets(content, Category.ESPORT)
+
+    # then
+    assert isinstance(next(bets), Bet)
+    assert len(list(bets)) == len(finder.find_bets(content, Category.ESPORT)) - 1
+
+
+def test_efortuna_bet_finder_summarizes_skipped_rows_instead_of_logging_them(efortuna_raw_content: str) -> None:
+    # given
+    logger = Mock()
+    finder = EFortunaBetFinder(logger=logger)  # type: ignore
+
+    # when
+    bets = finder.find_bets(efortuna_raw_content, Category.ESPORT)
+
+    # then
+    summary = logger.log.call_args[0][1]
+    assert f"Found {len(bets)} bets" in summary
+    assert "running-live=" in summary
+    assert all("<tr" not in str(call) for call in logger.info.call_args_list)
+
+
+@pytest.mark.parametrize(
+    "finder_class, fixture, markets_key, required_key",
+    [
+        (BetClickBetFinder, "bet_click_raw_content", "markets", "contestants"),
+        (LVBetBetFinder, "lvbet_raw_content", "primaryMarkets", "participants"),
+    ],
+)
+def test_json_bet_finders_count_failures_per_reason_with_one_exemplar(
+    finder_class: Any, fixture: str, markets_key: str, required_key: str, request: pytest.FixtureRequest
+) -> None:
+    # given
+    items = [item for item in json.loads(request.getfixturevalue(fixture)) if item.get(markets_key)]
+    broken = [{key: value for key, value in item.items() if key != required_key} for item in items[:3]]
+    logger = Mock()
+    finder = finder_class(logger=logger)
+
+    # when
+    bets = finder.find_bets(json.dumps([*broken, items[3]]), Category.ESPORT)
+
+    # then
+    assert len(bets) == 1
+    assert logger.log.call_args[0][0] == logging.WARNING
+    assert "failed 3 (KeyError=3)" in logger.log.call_args[0][1]
+    assert logger.warning.call_count == 1
@@ -0,0 +1,173 @@
+import json
+from datetime import timedelta
+from pathlib import Path
+from typing import List
+
+import pytest
+from bson.objectid import ObjectId
+from pymongo.database import Database
+
+from surebets_finder.bet.application.bet_finder import LVBetBetFinder
+from surebets_finder.bet.application.importer import BetImporter
+from surebets_finder.raw_content.domain.entities import RawContent
+from surebets_finder.raw_content.infrastructure.mongodb_raw_content_repo import MongoDBRawContentRepository
+from surebets_finder.shared.category import Category
+from surebets_finder.shared.provider import Provider
+
+
+@pytest.fixture
+def lvbet_pages() -> List[str]:
+    root_project_path = Path(__file__).parent.parent.parent.parent
+    file_path = root_project_path / "surebets_finder" / "examples" / "lvbet.json"
+
+    with open(file_path) as file:
+        items = json.load(file)
+
+    return [json.dumps(items[:3]), json.dumps(items[3:6])]
+
+
+def test_bet_importer_parses_every_page_of_raw_content(mongodb: Database, lvbet_pages: List[str]) -> None:
+    # given
+    mongodb["raw_content"].delete_many({})
+    raw_content_id = ObjectId()
+    MongoDBRawContentRepository().create(  # type: ignore
+        RawContent(id=raw_content_id, pages=lvbet_pages, category=Category.ESPORT, provider=Provider.LVBET)
+    )
+
+    # and
+    finder = LVBetBetFinder()  # type: ignore
+    bets_per_page = [len(finder.find_bets(page, Category.ESPORT)) for page in lvbet_pages]
+
+    # when
+    BetImporter().import_all()  # type: ignore
+
+    # then
+    assert all(bets_per_page)
+    assert mongodb["bet"].count_documents({"url": {"$ne": "/test/bet/url"}}) == sum(bets_per_page)
+    assert mongodb["raw_content"].find_one({"_id": raw_content_id})["was_processed"] is True
+
+
+def test_bet_importer_parses_raw_contents_in_processes(mongodb: Database, lvbet_pages: List[str]) -> None:
+    # given
+    mongodb["raw_content"].delete_many({})
+    raw_content_ids = [ObjectId() for _ in lvbet_pages]
+
+    for raw_content_id, page in zip(raw_content_ids, lvbet_pages):
+        MongoDBRawContentRepository().create(  # type: ignore
+            RawContent(id=raw_content_id, pages=[page], category=Category.ESPORT, provider=Provider.LVBET)
+        )
+
+    # and
+    finder = LVBetBetFinder()  # type: ignore
+    bets_count = sum(len(finder.find_bets(page, Category.ESPORT)) for page in lvbet_pages)
+
+    # when
+    BetImporter().import_all(processes=2)  # type: ignore
+
+    # then
+    assert mongodb["bet"].count_documents({"url": {"$ne": "/test/bet/url"}}) == bets_count
+    assert mongodb["raw_content"].count_documents({"_id": {"$in": raw_content_ids}, "was_processed": True}) == 2
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_bet_importer_continues_when_one_raw_content_fails(
+    mongodb: Database, lvbet_pages: List[str], processes: int
+) -> None:
+    # given
+    mongodb["raw_content"].delete_many({})
+    broken_id, valid_id = ObjectId(), ObjectId()
+    repository = MongoDBRawContentRepository()  # type: ignore
+
+    for raw_content_id, page in [(broken_id, "<html>Maintenance</html>"), (valid_id, lvbet_pages[0])]:
+        repository.create(
+            RawContent(id=raw_content_id, pages=[page], category=Category.ESPORT, provider=Provider.LVBET)
+        )
+
+    # when
+    BetImporter().import_all(processes=processes)  # type: ignore
+
+    # then
+    broken = mongodb["raw_content"].find_one({"_id": broken_id})
+    assert mongodb["raw_content"].find_one({"_id": valid_id})["was_processed"] is True
+    assert broken["was_processed"] is False
+    assert "lease_owner" in broken
+    assert mongodb["bet"].count_documents({"url": {"$ne": "/test/bet/url"}}) > 0
+
+
+def test_bet_importer_writes_bets_in_batches(mongodb: Database, lvbet_pages: List[str]) -> None:
+    # given
+    mongodb["raw_content"].delete_many({})
+    MongoDBRawContentRepository().create(  # type: ignore
+        RawContent(id=ObjectId(), pages=lvbet_pages, category=Category.ESPORT, provider=Provider.LVBET)
+    )
+
+    # and
+    importer = BetImporter()  # type: ignore
+    batch_sizes: List[int] = []
+    save_batch = importer._save_batch
+    importer._save_batch = lambda bets, recorded_at: batch_sizes.append(len(bets)) or save_batch(bets, recorded_at)  # type: ignore
+
+    # when
+    importer.import_all(batch_size=2)
+
+    # then
+    assert len(batch_sizes) > 1
+    assert all(size <= 2 for size in batch_sizes)
+    assert mongodb["bet"].count_documents({"url": {"$ne": "/test/bet/url"}}) == sum(batch_sizes)
+
+
+def test_bet_importer_does_not_duplicate_bets_found_again(mongodb: Database, lvbet_pages: List[str]) -> None:
+    # given
+    mongodb["raw_content"].delete_many({})
+
+    for _ in range(2):
+        MongoDBRawContentRepository().create(  # type: ignore
+            RawContent(id=ObjectId(), pages=lvbet_pages, category=Category.ESPORT, provider=Provider.LVBET)
+        )
+
+    # and
+    finder = LVBetBetFinder()  # type: ignore
+    bets_count = sum(len(finder.find_bets(page, Category.ESPORT)) for page in lvbet_pages)
+
+    # when
+    BetImporter().import_all()  # type: ignore
+
+    # then
+    assert mongodb["bet"].count_documents({"url": {"$ne": "/test/bet/url"}}) == bets_count
+
+
+def test_bet_importer_skips_raw_contents_claimed_by_another_importer(mongodb: Database, lvbet_pages: List[str]) -> None:
+    # given
+    mongodb["raw_content"].delete_many({})
+    raw_content_id = ObjectId()
+    repository = MongoDBRawContentRepository()  # type: ignore
+    repository.create(
+        RawContent(id=raw_content_id, pages=lvbet_pages, category=Category.ESPORT, provider=Provider.LVBET)
+    )
+    repository.claim_unprocessed("another-importer", timedelta(minutes=10))
+
+    # when
+    BetImporter().import_all()  # type: ignore
+
+    # then
+    assert mongodb["bet"].count_documents({"url": {"$ne": "/test/bet/url"}}) == 0
+    assert mongodb["raw_content"].find_one({"_id": raw_content_id})["was_processed"] is False
+
+
+def test_bet_importer_records_odds_history_as_of_download(mongodb: Database, lvbet_pages: List[str]) -> None:
+    # given
+    mongodb["raw_content"].delete_many({})
+    raw_content_id = ObjectId()
+    MongoDBRawContentRepository().create(  # type: ignore
+        RawContent(id=raw_content_id, pages=lvbet_pages, category=Category.ESPORT, provider=Provider.LVBET)
+    )
+
+    # when
+    BetImporter().import_all()  # type: ignore
+
+    # then
+    snapshot_times = mongodb["odds_history"].distinct("snapshots.t")
+    assert mongodb["odds_history"].count_documents({}) == mongodb["bet"].count_documents(
+        {"url": {"$ne": "/test/bet/url"}}
+    )
+    assert snapshot_times == [raw_content_id.generation_time.replace(tzinfo=None)]
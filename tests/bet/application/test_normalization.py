@@ -0,0 +1,91 @@
+import json
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+import pytest
+
+from surebets_finder.bet.application.normalization import (
+    current_year,
+    extract_opponents,
+    normalize_name,
+    parse_betclick_date,
+    parse_efortuna_date,
+    parse_iso_date,
+)
+from surebets_finder.shared.efortuna_parser import iter_rows
+
+EXAMPLES_PATH = Path(__file__).parent.parent.parent.parent / "surebets_finder" / "examples"
+
+
+def _efortuna_cases() -> List[Tuple[Callable[..., Any], Tuple[Any, ...]]]:
+    rows = list(iter_rows((EXAMPLES_PATH / "efortuna.html").read_text()))
+    year = current_year()
+
+    return [(extract_opponents, (row.market_name,)) for row in rows if row.market_name] + [
+        (parse_efortuna_date, (row.event_datetime, year)) for row in rows if row.event_datetime
+    ]
+
+
+def _betclick_cases() -> List[Tuple[Callable[..., Any], Tuple[Any, ...]]]:
+    items = json.loads((EXAMPLES_PATH / "betclick.json").read_text())
+
+    return [(normalize_name, (contestant["name"],)) for item in items for contestant in item["contestants"]] + [
+        (parse_betclick_date, (item["date"],)) for item in items
+    ]
+
+
+def _lvbet_cases() -> List[Tuple[Callable[..., Any], Tuple[Any, ...]]]:
+    items = json.loads((EXAMPLES_PATH / "lvbet.json").read_text())
+
+    return [(normalize_name, (name,)) for item in items for name in item["participants"].values()] + [
+        (parse_iso_date, (item["date"],)) for item in items
+    ]
+
+
+@pytest.mark.parametrize("cases", [_efortuna_cases, _betclick_cases, _lvbet_cases])
+def test_cached_normalization_returns_the_same_results_as_uncached(cases: Callable[..., Any]) -> None:
+    # given
+    cases = cases()
+
+    # when
+    mismatches = []
+
+    for _ in range(2):
+        for function, args in cases:
+            try:
+                expected = function.__wrapped__(*args)
+            except ValueError as e:
+                expected = type(e)
+
+            try:
+                result = function(*args)
+            except ValueError as e:
+                result = type(e)
+
+            if result != expected:
+                mismatches.append((function.__name__, args, result, expected))
+
+    # then
+    assert len(cases) > 0
+    assert mismatches == []
+
+
+def test_repeated_names_are_served_from_cache() -> None:
+    # given
+    extract_opponents.cache_clear()
+
+    # when
+    for _ in range(3):
+        extract_opponents("G2 Esports - MAD Lions")
+
+    # then
+    assert extract_opponents.cache_info().hits == 2
+    assert extract_opponents("G2 Esports - MAD Lions") == ("g2 esports", "mad lions")
+
+
+def test_efortuna_date_is_parsed_with_the_given_year() -> None:
+    # when
+    date = parse_efortuna_date("16.02.\xa021:00", "2021")
+
+    # then
+    assert date.isoformat() == "2021-02-16T21:00:00"
@@ -0,0 +1,47 @@
+import logging
+from unittest.mock import Mock
+
+from surebets_finder.bet.application.parse_report import MAX_EXEMPLAR_LENGTH, ParseReport
+from surebets_finder.shared.provider import Provider
+
+
+def test_parse_report_keeps_only_the_first_exemplar_of_every_reason() -> None:
+    # given
+    report = ParseReport(Provider.EFORTUNA)
+
+    # when
+    report.skip("running-live", "first")
+    report.skip("running-live", "second")
+    report.fail(KeyError("date"), {"id": 1})
+    report.fail(KeyError("odds"), {"id": 2})
+
+    # then
+    assert report.skipped == {"running-live": 2}
+    assert report.failed == {"KeyError": 2}
+    assert report.exemplars == {"running-live": "first", "KeyError": "'date' in {'id': 1}"}
+
+
+def test_parse_report_truncates_exemplars() -> None:
+    # given
+    report = ParseReport(Provider.LVBET)
+
+    # when
+    report.skip("no-markets", "x" * MAX_EXEMPLAR_LENGTH * 2)
+
+    # then
+    assert report.exemplars["no-markets"] == "x" * MAX_EXEMPLAR_LENGTH + "..."
+
+
+def test_parse_report_logs_summary_as_warning_only_when_something_failed() -> None:
+    # given
+    logger = Mock()
+    report = ParseReport(Provider.BETCLICK)
+    report.found = 10
+    report.skip("no-markets", {})
+
+    # when
+    report.log(logger)
+
+    # then
+    logger.log.assert_called_once_with(logging.INFO, "[betclick] Found 10 bets, skipped 1 (no-markets=1), failed 0")
+    logger.warning.assert_not_called()
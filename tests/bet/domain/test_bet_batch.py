@@ -0,0 +1,112 @@
+import tracemalloc
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import List
+
+import pytest
+from bson.objectid import ObjectId
+
+from surebets_finder.bet.application.bet_finder import LVBetBetFinder
+from surebets_finder.bet.domain.bet_batch import BetBatch
+from surebets_finder.bet.domain.entities import Bet
+from surebets_finder.shared.category import Category
+from surebets_finder.shared.provider import Provider
+
+
+@pytest.fixture
+def lvbet_bets() -> List[Bet]:
+    root_project_path = Path(__file__).parent.parent.parent.parent
+    content = (root_project_path / "surebets_finder" / "examples" / "lvbet.json").read_text()
+
+    return LVBetBetFinder().find_bets(content, Category.ESPORT)  # type: ignore
+
+
+def _bet(odds_1: Decimal, date: datetime) -> Bet:
+    return Bet(
+        id=ObjectId(),
+        opponent_1="g2 esports",
+        opponent_2="mad lions",
+        odds_1=odds_1,
+        odds_2=Decimal("2.98"),
+        category=Category.ESPORT,
+        provider=Provider.BETCLICK,
+        date=date,
+        url="/esport/g2-mad-lions",
+        updated_at=datetime(2021, 1, 19, 12, 0),
+        created_at=datetime(2021, 1, 19, 12, 0),
+    )
+
+
+def test_bet_batch_restores_stored_bets() -> None:
+    # given
+    bet = _bet(Decimal("1.33"), datetime(2021, 1, 22, 18, 0))
+
+    # when
+    batch = BetBatch.from_bets([bet])
+
+    # then
+    assert len(batch) == 1
+    assert batch[0] == bet
+    assert list(batch) == [bet]
+    assert list(batch.odds_1) == [133]
+
+
+def test_bet_batch_rounds_odds_to_hundredths_and_keeps_dates_in_utc() -> None:
+    # given
+    bet = _bet(Decimal("1.335"), datetime(2021, 1, 22, 19, 0, tzinfo=timezone.utc))
+
+    # when
+    restored = BetBatch.from_bets([bet])[-1]
+
+    # then
+    assert restored.odds_1 == Decimal("1.34")
+    assert restored.date == datetime(2021, 1, 22, 19, 0)
+
+
+def test_bet_batch_interns_team_names(lvbet_bets: List[Bet]) -> None:
+    # when
+    batch = BetBatch.from_bets(lvbet_bets + lvbet_bets)
+
+    # then
+    assert len(batch) == 2 * len(lvbet_bets)
+    assert [batch.opponents(index) for index in range(len(lvbet_bets))] == [
+        (bet.opponent_1, bet.opponent_2) for bet in lvbet_bets
+    ]
+    assert len(set(batch.iter_keys())) == len({(b.opponent_1, b.opponent_2, b.date) for b in lvbet_bets})
+
+
+def test_bet_batch_takes_less_memory_than_list_of_bets(lvbet_bets: List[Bet]) -> None:
+    # given
+    bets = lvbet_bets * 20
+
+    # when
+    tracemalloc.start()
+    as_list = [_copy(bet) for bet in bets]
+    list_memory, _ = tracemalloc.get_traced_memory()
+    del as_list
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    as_batch = BetBatch.from_bets(bets)
+    batch_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # then
+    assert len(as_batch) == len(bets)
+    assert batch_memory * 3 < list_memory
+
+
+def _copy(bet: Bet) -> Bet:
+    return Bet(
+        id=ObjectId(),
+        opponent_1=bet.opponent_1,
+        opponent_2=bet.opponent_2,
+        odds_1=Decimal(bet.odds_1),
+        odds_2=Decimal(bet.odds_2),
+        category=bet.category,
+        provider=bet.provider,
+        date=bet.date.replace(),
+        url=bet.url,
+        updated_at=datetime.utcnow(),
+    )
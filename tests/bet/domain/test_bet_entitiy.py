@@ -1,3 +1,4 @@
+import pickle
 from datetime import datetime
 from decimal import Decimal
 
@@ -47,3 +48,48 @@ def test_can_build_full_url_based_on_provider() -> None:
 
     # then
     assert full_url == "https://www.efortuna.pl/test/bet/url"
+
+
+def test_bet_is_slotted_and_picklable() -> None:
+    # given
+    bet = Bet(
+        id=ObjectId(),
+        opponent_1="test 1",
+        opponent_2="test 2",
+        odds_1=Decimal("4.12"),
+        odds_2=Decimal("3.56"),
+        category=Category.ESPORT,
+        provider=Provider.EFORTUNA,
+        date=datetime.utcnow(),
+        url="/test/bet/url",
+        updated_at=datetime.utcnow(),
+    )
+
+    # when
+    restored = pickle.loads(pickle.dumps(bet))
+
+    # then
+    assert restored == bet
+    assert not hasattr(bet, "__dict__")
+
+
+def test_created_at_is_set_when_bet_is_created() -> None:
+    # given
+    before = datetime.utcnow()
+
+    # when
+    bet = Bet(
+        id=ObjectId(),
+        opponent_1="test 1",
+        opponent_2="test 2",
+        odds_1=Decimal("4.12"),
+        odds_2=Decimal("3.56"),
+        category=Category.ESPORT,
+        provider=Provider.EFORTUNA,
+        date=datetime.utcnow(),
+        url="/test/bet/url",
+        updated_at=datetime.utcnow(),
+    )
+
+    # then
+    assert bet.created_at >= before
@@ -1,14 +1,16 @@
-from datetime import datetime
+from dataclasses import replace
+from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Set
 
 import pytest
 from bson import Decimal128, ObjectId
+from pymongo.cursor import Cursor
 from pymongo.database import Database
 
-from surebets_finder.bet.domain.entities import Bet
+from surebets_finder.bet.domain.entities import Bet, BetUpsertResult
 from surebets_finder.bet.domain.errors import BetNotFoundError
-from surebets_finder.bet.infrastructure.mongodb_bet_repo import MongoDBBetRepository
+from surebets_finder.bet.infrastructure.mongodb_bet_repo import NATURAL_KEY, MongoDBBetRepository
 from surebets_finder.shared.category import Category
 from surebets_finder.shared.provider import Provider
 
@@ -97,6 +99,34 @@ def test_get_all_bets_which_are_in_future(mongodb: Database) -> None:
     assert len(in_future) == 5
 
 
+@pytest.mark.usefixtures("fill_in_db_with_bets_which_are_in_future")
+def test_iter_bets_which_are_in_future_fetches_bets_in_batches(mongodb: Database) -> None:
+    # given
+    repo = MongoDBBetRepository()  # type: ignore
+
+    # when
+    in_future = repo.iter_which_are_in_future(batch_size=2)
+
+    # then
+    assert next(in_future).opponent_1 == "opponent_1 0"
+    assert len(list(in_future)) == 4
+
+
+@pytest.mark.usefixtures("fill_in_db_with_bets_which_are_in_future")
+def test_get_all_bets_which_are_in_future_as_batch(mongodb: Database) -> None:
+    # given
+    repo = MongoDBBetRepository()  # type: ignore
+
+    # when
+    in_future = repo.get_all_which_are_in_future_as_batch()
+
+    # then
+    assert len(in_future) == 5
+    assert list(in_future.odds_1) == [412] * 5
+    assert list(in_future.odds_2) == [356] * 5
+    assert in_future.opponents(0) == ("opponent_1 0", "opponent_2 0")
+
+
 def test_find_one(mongodb: Database, dummy_bet_document: Dict[str, Any]) -> None:
     # given
     repo = MongoDBBetRepository()  # type: ignore
@@ -145,3 +175,96 @@ def test_can_save_bet(mongodb: Database, dummy_bet_id: ObjectId) -> None:
     document = mongodb["bet"].find_one({"_id": bet.id})
     assert str(document["odds_1"]) == str(round(bet.odds_1, 2))
     assert document["url"] == "another/new/url"
+
+
+def test_upsert_many_inserts_updates_and_skips_unchanged_bets(mongodb: Database) -> None:
+    # given
+    repo = MongoDBBetRepository()  # type: ignore
+    date = datetime(2021, 1, 22, 18)
+
+    # and
+    bets = [
+        Bet(
+            id=ObjectId(),
+            opponent_1=f"opponent_1 {i}",
+            opponent_2=f"opponent_2 {i}",
+            odds_1=Decimal("1.50"),
+            odds_2=Decimal("2.50"),
+            category=Category.ESPORT,
+            provider=Provider.LVBET,
+            date=date,
+            url=f"/bet/{i}",
+            updated_at=datetime.utcnow(),
+        )
+        for i in range(3)
+    ]
+    repo.upsert_many(bets, recorded_at=date - timedelta(hours=2))
+
+    # and
+    bets[0].odds_1 = Decimal("1.45")
+    bets[1].url = "/bet/moved"
+
+    # when
+    result = repo.upsert_many(
+        [*bets, replace(bets[2], id=ObjectId(), provider=Provider.EFORTUNA)], recorded_at=date - timedelta(hours=1)
+    )
+
+    # then
+    assert result == BetUpsertResult(inserted=1, updated=2, unchanged=1)
+    assert mongodb["bet"].count_documents({"date": date}) == 4
+    assert mongodb["bet"].find_one({"opponent_1": "opponent_1 0"})["odds_1"] == Decimal128("1.45")
+    assert mongodb["bet"].find_one({"opponent_1": "opponent_1 1"})["_id"] == bets[1].id
+
+
+def test_upsert_many_does_not_overwrite_odds_recorded_later(mongodb: Database) -> None:
+    # given
+    repo = MongoDBBetRepository()  # type: ignore
+    recorded_at = datetime(2021, 1, 22, 16)
+
+    # and
+    bet = Bet(
+        id=ObjectId(),
+        opponent_1="opponent_1",
+        opponent_2="opponent_2",
+        odds_1=Decimal("1.50"),
+        odds_2=Decimal("2.50"),
+        category=Category.ESPORT,
+        provider=Provider.LVBET,
+        date=datetime(2021, 1, 22, 18),
+        url="/bet",
+        updated_at=datetime.utcnow(),
+    )
+    repo.upsert_many([bet], recorded_at=recorded_at)
+
+    # when
+    result = repo.upsert_many([replace(bet, odds_1=Decimal("1.20"))], recorded_at=recorded_at - timedelta(minutes=5))
+
+    # then
+    assert result == BetUpsertResult(inserted=0, updated=0, unchanged=1)
+    assert repo.get(bet.id).odds_1 == Decimal("1.50")
+
+
+def test_create_indexes_is_idempotent(mongodb: Database) -> None:
+    # given
+    repo = MongoDBBetRepository()  # type: ignore
+    mongodb["bet"].delete_many({})
+
+    # when
+    repo.create_indexes()
+    repo.create_indexes()
+
+    # then
+    indexes = mongodb["bet"].index_information()
+    assert indexes["natural_key"]["unique"] is True
+    assert indexes["natural_key"]["key"] == [(field, 1) for field in NATURAL_KEY]
+    assert "date" in indexes
+
+
+def test_hot_queries_uses_indexes(mongodb: Database, used_indexes: Callable[[Cursor], Set[str]]) -> None:
+    # given
+    MongoDBBetRepository().create_indexes()  # type: ignore
+    key = {"opponent_1": "test 1", "opponent_2": "test 2", "date": datetime.utcnow(), "provider": "lvbet"}
+
+    # then
+    assert used_indexes(mongodb["bet"].find(key)) == {"natural_key"}
+    assert used_indexes(mongodb["bet"].find({"date": {"$gte": datetime.utcnow()}})) == {"date"}
@@ -0,0 +1,125 @@
+from dataclasses import replace
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Set
+
+import pytest
+from bson import ObjectId
+from pymongo.cursor import Cursor
+from pymongo.database import Database
+
+from surebets_finder.bet.domain.entities import Bet, OddsSnapshot
+from surebets_finder.bet.infrastructure.mongodb_odds_history_repo import MongoDBOddsHistoryRepository
+from surebets_finder.shared.category import Category
+from surebets_finder.shared.provider import Provider
+
+
+@pytest.fixture
+def bet() -> Bet:
+    return Bet(
+        id=ObjectId(),
+        opponent_1="g2 esports",
+        opponent_2="fnatic",
+        odds_1=Decimal("1.50"),
+        odds_2=Decimal("2.50"),
+        category=Category.ESPORT,
+        provider=Provider.EFORTUNA,
+        date=datetime(2021, 1, 22, 18),
+        url="/test/bet/url",
+        updated_at=datetime.utcnow(),
+    )
+
+
+def test_record_appends_snapshot_only_when_odds_have_changed(mongodb: Database, bet: Bet) -> None:
+    # given
+    repo = MongoDBOddsHistoryRepository()  # type: ignore
+    started_at = datetime(2021, 1, 20, 12)
+
+    # when
+    recorded = [
+        repo.record([bet], started_at),
+        repo.record([bet], started_at + timedelta(minutes=1)),
+        repo.record([replace(bet, odds_1=Decimal("1.45"))], started_at + timedelta(minutes=2)),
+    ]
+
+    # then
+    assert recorded == [1, 0, 1]
+    assert mongodb["odds_history"].count_documents({}) == 1
+    assert repo.get_history(bet, since=started_at) == [
+        OddsSnapshot(recorded_at=started_at, odds_1=Decimal("1.50"), odds_2=Decimal("2.50")),
+        OddsSnapshot(recorded_at=started_at + timedelta(minutes=2), odds_1=Decimal("1.45"), odds_2=Decimal("2.50")),
+    ]
+
+
+def test_record_drops_snapshot_recorded_before_the_last_one(mongodb: Database, bet: Bet) -> None:
+    # given
+    repo = MongoDBOddsHistoryRepository()  # type: ignore
+    started_at = datetime(2021, 1, 20, 12)
+    changed_bet = replace(bet, odds_1=Decimal("1.45"))
+
+    # when
+    recorded = [
+        repo.record([bet], started_at),
+        repo.record([changed_bet], started_at + timedelta(minutes=2)),
+        repo.record([bet], started_at + timedelta(minutes=1)),
+        repo.record([changed_bet], started_at + timedelta(minutes=3)),
+    ]
+
+    # then
+    assert recorded == [1, 1, 0, 0]
+    assert repo.get_history(bet, since=started_at) == [
+        OddsSnapshot(recorded_at=started_at, odds_1=Decimal("1.50"), odds_2=Decimal("2.50")),
+        OddsSnapshot(recorded_at=started_at + timedelta(minutes=2), odds_1=Decimal("1.45"), odds_2=Decimal("2.50")),
+    ]
+
+
+def test_record_starts_every_bucket_with_current_odds(mongodb: Database, bet: Bet) -> None:
+    # given
+    repo = MongoDBOddsHistoryRepository()  # type: ignore
+    recorded_at = datetime(2021, 1, 20, 23, 59)
+
+    # when
+    recorded = [repo.record([bet], recorded_at), repo.record([bet], recorded_at + timedelta(minutes=2))]
+
+    # then
+    assert recorded == [1, 1]
+    assert sorted(mongodb["odds_history"].distinct("bucket")) == [datetime(2021, 1, 20), datetime(2021, 1, 21)]
+
+
+def test_get_history_returns_snapshots_of_the_event_in_the_range(mongodb: Database, bet: Bet) -> None:
+    # given
+    repo = MongoDBOddsHistoryRepository()  # type: ignore
+    started_at = datetime(2021, 1, 20, 12)
+
+    for hour in range(12):
+        odds_1 = Decimal("1.50") + Decimal(hour).scaleb(-2)
+        repo.record(
+            [replace(bet, odds_1=odds_1), replace(bet, provider=Provider.LVBET)], started_at + timedelta(hours=hour)
+        )
+
+    # when
+    history = repo.get_history(bet, since=started_at + timedelta(hours=6), until=started_at + timedelta(hours=8))
+
+    # then
+    assert [snapshot.odds_1 for snapshot in history] == [Decimal("1.56"), Decimal("1.57"), Decimal("1.58")]
+
+
+def test_create_indexes_is_idempotent(mongodb: Database) -> None:
+    # given
+    repo = MongoDBOddsHistoryRepository()  # type: ignore
+
+    # when
+    repo.create_indexes()
+    repo.create_indexes()
+
+    # then
+    assert mongodb["odds_history"].index_information()["bucket"]["unique"] is True
+
+
+def test_hot_queries_uses_indexes(mongodb: Database, bet: Bet, used_indexes: Callable[[Cursor], Set[str]]) -> None:
+    # given
+    MongoDBOddsHistoryRepository().create_indexes()  # type: ignore
+    key = {"opponent_1": bet.opponent_1, "opponent_2": bet.opponent_2, "date": bet.date, "provider": "efortuna"}
+
+    # then
+    assert used_indexes(mongodb["odds_history"].find({**key, "bucket": {"$gte": datetime(2021, 1, 20)}})) == {"bucket"}
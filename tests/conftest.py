@@ -1,18 +1,26 @@
 import os
 from datetime import datetime, timedelta
-from typing import Any, Dict, Iterator
+from typing import Any, Callable, Dict, Iterator, Set
 
 import pytest
 from bson import Decimal128
 from bson.objectid import ObjectId
 from kink import di
+from pymongo.cursor import Cursor
 from pymongo.database import Database
 from pymongo.mongo_client import MongoClient
 
+from surebets_finder.bootstrap import bootstrap_clients_di, bootstrap_di
 from surebets_finder.shared.category import Category
 from surebets_finder.shared.provider import Provider
 
 
+@pytest.fixture(autouse=True, scope="session")
+def dependencies() -> None:
+    bootstrap_di()
+    bootstrap_clients_di()
+
+
 @pytest.fixture
 def dummy_raw_content_id() -> ObjectId:
     return ObjectId("6009cb62cd435afcacaee12c")
@@ -103,3 +111,21 @@ def fill_in_db_with_bets_which_are_in_future(mongodb: Database) -> None:
                 "created_at": datetime.utcnow(),
             }
         )
+
+
+def _find_index_names(plan: Any) -> Set[str]:
+    if isinstance(plan, dict):
+        names = {plan["indexName"]} if "indexName" in plan else set()
+        return names.union(*(_find_index_names(value) for value in plan.values()))
+
+    if isinstance(plan, list):
+        return set().union(*(_find_index_names(value) for value in plan))
+
+    return set()
+
+
+@pytest.fixture
+def used_indexes() -> Callable[[Cursor], Set[str]]:
+    """Names of indexes in the winning plan of the query"""
+
+    return lambda cursor: _find_index_names(cursor.explain()["queryPlanner"]["winningPlan"])
@@ -14,7 +14,7 @@ def test_efortuna_client_can_fetch_raw_data() -> None:
     raw_html_content = client.get_raw_data()
 
     # then
-    assert "main-content" in raw_html_content
+    assert "main-content" in raw_html_content[0]
 
 
 @pytest.mark.slow
@@ -30,7 +30,7 @@ def test_betclick_client_can_fetch_raw_data() -> None:
     raw_content = client.get_raw_data()
 
     # then
-    assert "selections" in raw_content
+    assert "selections" in raw_content[0]
 
 
 @pytest.mark.slow
@@ -44,4 +44,4 @@ def test_lvbet_client_can_fetch_raw_data() -> None:
     raw_content = client.get_raw_data()
 
     # then
-    assert "selections" in raw_content
+    assert "selections" in raw_content[0]
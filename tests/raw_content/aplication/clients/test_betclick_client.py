@@ -0,0 +1,99 @@
+import json
+from typing import Any, List
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+from requests import Response
+
+from surebets_finder.raw_content.aplication.clients.betclick_client import BetClickClient
+from surebets_finder.raw_content.domain.errors import RequestError
+
+URL = "https://offer.cdn.begmedia.com/api/pub/v4/events?application=2048&limit=100&offset=0&sportIds=102"
+
+
+class FakeSession:
+    def __init__(self, events_count: int, failing_offset: int = -1, maintenance: bool = False) -> None:
+        self._events_count = events_count
+        self._failing_offset = failing_offset
+        self._maintenance = maintenance
+        self.requested_offsets: List[int] = []
+
+    def get(self, url: str, **kwargs: Any) -> Response:
+        query = dict(parse_qsl(urlsplit(url).query))
+        limit, offset = int(query["limit"]), int(query["offset"])
+        self.requested_offsets.append(offset)
+
+        response = Response()
+        response.status_code = 500 if offset == self._failing_offset else 200
+        events = [{"id": i} for i in range(offset, min(offset + limit, self._events_count))]
+        response._content = b"<html>Maintenance</html>" if self._maintenance else json.dumps(events).encode()
+
+        return response
+
+
+def test_betclick_client_fetches_pages_until_result_set_is_exhausted() -> None:
+    # given
+    session = FakeSession(events_count=250)
+    client = BetClickClient(urls=[URL], session=session)  # type: ignore
+
+    # when
+    pages = list(client.iter_pages(URL))
+
+    # then
+    assert [len(json.loads(page)) for page in pages] == [100, 100, 50]
+    assert [event["id"] for page in pages for event in json.loads(page)] == list(range(250))
+    assert len(session.requested_offsets) <= 1 + BetClickClient.CONCURRENT_PAGES
+
+
+def test_betclick_client_fetches_a_single_page_when_result_set_fits_in_it() -> None:
+    # given
+    session = FakeSession(events_count=42)
+    client = BetClickClient(urls=[URL], session=session)  # type: ignore
+
+    # when
+    pages = list(client.iter_pages(URL))
+
+    # then
+    assert [len(json.loads(page)) for page in pages] == [42]
+    assert session.requested_offsets == [0]
+
+
+def test_betclick_client_fetches_more_than_one_window_of_pages() -> None:
+    # given
+    events_count = 100 * (1 + BetClickClient.CONCURRENT_PAGES) + 1
+    client = BetClickClient(urls=[URL], session=FakeSession(events_count=events_count))  # type: ignore
+
+    # when
+    pages = client.get_raw_data()
+
+    # then
+    assert sum(len(json.loads(page)) for page in pages) == events_count
+
+
+def test_betclick_client_skips_empty_last_page() -> None:
+    # given
+    client = BetClickClient(urls=[URL], session=FakeSession(events_count=200))  # type: ignore
+
+    # when
+    pages = list(client.iter_pages(URL))
+
+    # then
+    assert len(pages) == 2
+
+
+def test_betclick_client_should_raise_an_exception_when_one_of_pages_fails() -> None:
+    # given
+    client = BetClickClient(urls=[URL], session=FakeSession(events_count=250, failing_offset=100))  # type: ignore
+
+    # then
+    with pytest.raises(RequestError):
+        list(client.iter_pages(URL))
+
+
+def test_betclick_client_should_raise_an_exception_when_page_is_not_json() -> None:
+    # given
+    client = BetClickClient(urls=[URL], session=FakeSession(events_count=250, maintenance=True))  # type: ignore
+
+    # then
+    with pytest.raises(RequestError):
+        list(client.iter_pages(URL))
@@ -0,0 +1,68 @@
+from typing import List
+
+import pytest
+
+from surebets_finder.raw_content.aplication.clients.browser_pool import BrowserPool
+
+
+class FakeDriver:
+    def __init__(self, started: List["FakeDriver"]) -> None:
+        self.quit_called = False
+        started.append(self)
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+def test_browser_pool_reuses_warm_browsers() -> None:
+    # given
+    started: List[FakeDriver] = []
+    pool = BrowserPool(size=2, driver_factory=lambda: FakeDriver(started))  # type: ignore
+
+    # when
+    with pool.acquire() as first:
+        pass
+
+    with pool.acquire() as second:
+        pass
+
+    # then
+    assert first is second
+    assert len(started) == 1
+
+
+def test_browser_pool_replaces_browser_which_failed() -> None:
+    # given
+    started: List[FakeDriver] = []
+    pool = BrowserPool(size=1, driver_factory=lambda: FakeDriver(started))  # type: ignore
+
+    # when
+    with pytest.raises(RuntimeError):
+        with pool.acquire():
+            raise RuntimeError()
+
+    with pool.acquire() as driver:
+        pass
+
+    # then
+    assert started[0].quit_called is True
+    assert driver is started[1]
+    assert pool.started == 1
+
+
+def test_browser_pool_quits_all_browsers_on_close() -> None:
+    # given
+    started: List[FakeDriver] = []
+    pool = BrowserPool(size=2, driver_factory=lambda: FakeDriver(started))  # type: ignore
+
+    with pool.acquire():
+        with pool.acquire():
+            pass
+
+    # when
+    pool.close()
+
+    # then
+    assert len(started) == 2
+    assert all(driver.quit_called for driver in started)
+    assert pool.started == 0
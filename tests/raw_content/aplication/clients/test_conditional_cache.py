@@ -0,0 +1,49 @@
+from typing import Dict, Optional
+
+from requests import Response
+
+from surebets_finder.raw_content.aplication.clients.conditional_cache import ConditionalRequestCache
+
+
+def _response(status_code: int, body: str = "", headers: Optional[Dict[str, str]] = None) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = body.encode()
+    response.headers.update(headers or {})
+    return response
+
+
+def test_conditional_cache_sends_no_validators_for_unknown_url() -> None:
+    # given
+    cache = ConditionalRequestCache()
+
+    # then
+    assert cache.conditional_headers("https://app.lvbet.pl/matches") == {}
+
+
+def test_conditional_cache_sends_validators_of_last_response() -> None:
+    # given
+    cache = ConditionalRequestCache()
+    url = "https://app.lvbet.pl/matches"
+
+    # when
+    cache.read(url, _response(200, "[]", {"ETag": '"abc"', "Last-Modified": "Tue, 19 Jan 2021 18:30:00 GMT"}))
+
+    # then
+    assert cache.conditional_headers(url) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Tue, 19 Jan 2021 18:30:00 GMT",
+    }
+
+
+def test_conditional_cache_returns_remembered_body_when_not_modified() -> None:
+    # given
+    cache = ConditionalRequestCache()
+    url = "https://app.lvbet.pl/matches"
+    cache.read(url, _response(200, '[{"id": 1}]', {"ETag": '"abc"'}))
+
+    # when
+    body = cache.read(url, _response(304))
+
+    # then
+    assert body == '[{"id": 1}]'
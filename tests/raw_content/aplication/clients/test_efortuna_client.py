@@ -0,0 +1,64 @@
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+from bs4 import BeautifulSoup
+
+from benchmarks import load_efortuna_page
+from surebets_finder.bet.application.bet_finder import EFortunaBetFinder
+from surebets_finder.raw_content.aplication.clients.efortuna_client import EFortunaClient, EFortunaSettings
+from surebets_finder.raw_content.domain.errors import RequestError
+from surebets_finder.shared.category import Category
+from surebets_finder.shared.content_format import ContentFormat
+from surebets_finder.shared.efortuna_parser import iter_rows, rows_from_json
+
+
+def _bets(content: str) -> List[Tuple[Any, ...]]:
+    finder = EFortunaBetFinder()  # type: ignore
+    bets = finder.find_bets(content, Category.ESPORT)
+
+    return [(bet.opponent_1, bet.opponent_2, bet.odds_1, bet.odds_2, bet.date, bet.url) for bet in bets]
+
+
+@pytest.fixture
+def legacy_main_content() -> str:
+    soup = BeautifulSoup(load_efortuna_page(), "html.parser")
+
+    return soup.find(id=EFortunaClient.MAIN_HTML_DIV_ID).prettify()
+
+
+def test_efortuna_client_extracts_same_bets_as_prettified_main_content(legacy_main_content: str) -> None:
+    # given
+    client = EFortunaClient(urls=[])  # type: ignore
+
+    # when
+    main_content = client._extract_information(load_efortuna_page())
+
+    # then
+    assert main_content.startswith("<div")
+    assert _bets(main_content) == _bets(legacy_main_content)
+
+
+@pytest.mark.parametrize("page", ["<html><body><div id='maintenance'></div></body></html>", ""])
+def test_efortuna_client_should_raise_an_exception_when_there_is_no_main_content(page: str) -> None:
+    # given
+    client = EFortunaClient(urls=[])  # type: ignore
+
+    # then
+    with pytest.raises(RequestError):
+        client._extract_information(page)
+
+
+def test_efortuna_client_yields_extracted_rows_and_samples_html(tmp_path: Path) -> None:
+    # given
+    settings = EFortunaSettings(content_format=ContentFormat.ROWS, html_sample_rate=1.0, html_debug_dir=tmp_path)
+    client = EFortunaClient(urls=[], settings=settings)  # type: ignore
+    client._make_request = lambda url: load_efortuna_page()  # type: ignore
+
+    # when
+    pages = list(client.iter_pages("https://www.efortuna.pl/zaklady-bukmacherskie/esport"))
+
+    # then
+    assert client.content_format == ContentFormat.ROWS
+    assert list(rows_from_json(pages[0])) == list(iter_rows(client._extract_information(load_efortuna_page())))
+    assert len(list(tmp_path.iterdir())) == 1
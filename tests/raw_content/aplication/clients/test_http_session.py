@@ -0,0 +1,135 @@
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from typing import Any, Iterator, List
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from surebets_finder.raw_content.aplication.clients.http_session import (
+    DEFAULT_POOL_SIZE,
+    JitteredRetry,
+    build_http_session,
+    build_retry,
+    get_throttled,
+)
+from surebets_finder.raw_content.aplication.clients.throttling import ProviderThrottle, ThrottleConfig
+from surebets_finder.shared.provider import Provider
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    statuses: List[int] = []
+
+    def do_GET(self) -> None:
+        status = self.statuses.pop(0) if self.statuses else 200
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b"[]")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def flaky_server() -> Iterator[HTTPServer]:
+    server = HTTPServer(("127.0.0.1", 0), FlakyHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_uses_pool_size_configured_for_host() -> None:
+    # given
+    session = build_http_session(pool_sizes={"https://app.lvbet.pl": 3})
+
+    # when
+    host_adapter = session.get_adapter("https://app.lvbet.pl/_api/v1/offer/matches/")
+    default_adapter = session.get_adapter("https://www.efortuna.pl/")
+
+    # then
+    assert isinstance(host_adapter, HTTPAdapter)
+    assert isinstance(default_adapter, HTTPAdapter)
+    assert host_adapter._pool_maxsize == 3  # type: ignore
+    assert default_adapter._pool_maxsize == DEFAULT_POOL_SIZE  # type: ignore
+    assert isinstance(host_adapter.max_retries, JitteredRetry)
+
+
+def test_session_asks_for_compressed_responses() -> None:
+    # given
+    session = build_http_session()
+
+    # then
+    assert "gzip" in session.headers["Accept-Encoding"]
+    assert session.headers["Connection"] == "keep-alive"
+
+
+def test_retry_backoff_is_jittered() -> None:
+    # given
+    retry = build_retry(backoff_factor=1)
+
+    # when
+    retry = retry.increment(method="GET", url="/").increment(method="GET", url="/")
+
+    # then
+    assert 2 <= retry.get_backoff_time() <= 2 + JitteredRetry.MAX_JITTER
+
+
+def test_session_does_not_retry_throttling_statuses(flaky_server: HTTPServer) -> None:
+    # given
+    FlakyHandler.statuses = [503]
+    session = build_http_session(retry=build_retry(backoff_factor=0.01))
+
+    # when
+    response = session.get(f"http://127.0.0.1:{flaky_server.server_port}/events", timeout=(2, 3))
+
+    # then
+    assert response.status_code == 503
+
+
+def test_get_throttled_retries_transient_errors_through_the_throttle(flaky_server: HTTPServer) -> None:
+    # given
+    FlakyHandler.statuses = [429, 503]
+    throttle = ProviderThrottle(Provider.LVBET, ThrottleConfig(rate=100, burst=10, max_concurrency=4))
+    sleeps: List[float] = []
+
+    # when
+    response = get_throttled(
+        build_http_session(),
+        throttle,
+        f"http://127.0.0.1:{flaky_server.server_port}/events",
+        sleep=sleeps.append,
+        timeout=(2, 3),
+    )
+
+    # then
+    assert response.status_code == 200
+    assert response.json() == []
+    assert len(sleeps) == 2
+    state = throttle.state()
+    assert (state.throttled, state.succeeded) == (2, 1)
+    assert state.concurrency_limit < 4
+
+
+def test_get_throttled_returns_the_last_response_when_retries_are_exhausted(flaky_server: HTTPServer) -> None:
+    # given
+    FlakyHandler.statuses = [429, 429]
+    throttle = ProviderThrottle(Provider.LVBET, ThrottleConfig(rate=100, burst=10, max_concurrency=4))
+
+    # when
+    response = get_throttled(
+        build_http_session(),
+        throttle,
+        f"http://127.0.0.1:{flaky_server.server_port}/events",
+        retries=1,
+        sleep=lambda _: None,
+        timeout=(2, 3),
+    )
+
+    # then
+    assert response.status_code == 429
+    assert throttle.state().throttled == 2
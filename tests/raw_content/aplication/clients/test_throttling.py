@@ -0,0 +1,145 @@
+from typing import List
+
+import pytest
+
+from surebets_finder.raw_content.aplication.clients.throttling import (
+    DEFAULT_THROTTLE_CONFIGS,
+    AdaptiveConcurrencyLimiter,
+    ProviderThrottle,
+    ThrottleConfig,
+    ThrottleRegistry,
+    TokenBucket,
+    load_throttle_configs,
+    parse_throttle_config,
+)
+from surebets_finder.shared.provider import Provider
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_lets_burst_through_and_then_waits_for_tokens() -> None:
+    # given
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+
+    # when
+    waits = [bucket.acquire() for _ in range(5)]
+
+    # then
+    assert waits == [0, 0, 0, 0.5, 0.5]
+
+
+def test_adaptive_concurrency_limiter_backs_off_and_ramps_up() -> None:
+    # given
+    limiter = AdaptiveConcurrencyLimiter(min_limit=1, max_limit=8, backoff_factor=0.5)
+
+    # when
+    limiter.acquire()
+    limiter.release(succeeded=False)
+    backed_off_limit = limiter.limit
+
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(succeeded=True)
+
+    # then
+    assert backed_off_limit == 4
+    assert limiter.limit > backed_off_limit
+
+
+def test_adaptive_concurrency_limiter_never_goes_below_minimum() -> None:
+    # given
+    limiter = AdaptiveConcurrencyLimiter(min_limit=2, max_limit=4)
+
+    # when
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release(succeeded=False)
+
+    # then
+    assert limiter.limit == 2
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_provider_throttle_backs_off_on_throttling_responses(status_code: int) -> None:
+    # given
+    throttle = ProviderThrottle(Provider.LVBET, ThrottleConfig(rate=100, burst=10, max_concurrency=4))
+
+    # when
+    with throttle.request() as outcome:
+        outcome.status_code = status_code
+
+    # then
+    state = throttle.state()
+    assert state.concurrency_limit == 2
+    assert state.throttled == 1
+    assert state.in_flight == 0
+
+
+def test_provider_throttle_backs_off_on_errors_without_response() -> None:
+    # given
+    throttle = ProviderThrottle(Provider.LVBET, ThrottleConfig(rate=100, burst=10, max_concurrency=4))
+
+    # when
+    with pytest.raises(ConnectionError):
+        with throttle.request():
+            raise ConnectionError()
+
+    # then
+    assert throttle.state().throttled == 1
+
+
+def test_provider_throttle_does_not_back_off_on_client_errors() -> None:
+    # given
+    throttle = ProviderThrottle(Provider.LVBET, ThrottleConfig(rate=100, burst=10, max_concurrency=4))
+
+    # when
+    with pytest.raises(ValueError):
+        with throttle.request() as outcome:
+            outcome.status_code = 404
+            raise ValueError()
+
+    # then
+    assert throttle.state().concurrency_limit == 4
+    assert throttle.state().succeeded == 1
+
+
+def test_throttle_registry_exposes_state_of_every_provider() -> None:
+    # given
+    registry = ThrottleRegistry()
+
+    # when
+    states = registry.states()
+
+    # then
+    assert {state.provider for state in states} == set(Provider)
+
+
+def test_load_throttle_configs_overrides_given_fields_of_a_provider() -> None:
+    # given
+    environ = {"THROTTLE_LVBET": "rate=2.5, max_concurrency=2"}
+
+    # when
+    configs = load_throttle_configs(environ)
+
+    # then
+    assert configs[Provider.LVBET] == ThrottleConfig(rate=2.5, burst=5, max_concurrency=2)
+    assert configs[Provider.BETCLICK] == DEFAULT_THROTTLE_CONFIGS[Provider.BETCLICK]
+
+
+@pytest.mark.parametrize("spec", ["speed=2", "rate", "rate=fast"])
+def test_parse_throttle_config_rejects_invalid_spec(spec: str) -> None:
+    # then
+    with pytest.raises(ValueError):
+        parse_throttle_config(spec, DEFAULT_THROTTLE_CONFIGS[Provider.LVBET])
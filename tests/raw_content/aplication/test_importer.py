@@ -0,0 +1,97 @@
+from typing import Iterator, List, Optional
+
+from pymongo.database import Database
+
+from surebets_finder.raw_content.aplication.clients.client import IWebClient
+from surebets_finder.raw_content.aplication.importer import Importer
+from surebets_finder.raw_content.aplication.url_factory import UrlFactory
+from surebets_finder.raw_content.domain.errors import RequestError
+from surebets_finder.shared.category import Category
+from surebets_finder.shared.content_format import ContentFormat
+from surebets_finder.shared.provider import Provider
+
+
+class FakeClient(IWebClient):
+    def __init__(self, urls: List[str], fail: bool = False, error: Optional[Exception] = None) -> None:
+        self._urls = urls
+        self._fail = fail
+        self._error = error
+
+    @property
+    def urls(self) -> List[str]:
+        return self._urls
+
+    @property
+    def content_format(self) -> ContentFormat:
+        return ContentFormat.RAW
+
+    def iter_pages(self, url: str) -> Iterator[str]:
+        if self._fail:
+            raise RequestError("Timeout Error!")
+
+        if self._error is not None:
+            raise self._error
+
+        yield f"content of {url}"
+
+    def get_raw_data(self) -> List[str]:
+        return [page for url in self._urls for page in self.iter_pages(url)]
+
+
+def test_importer_reports_timing_for_every_url(mongodb: Database) -> None:
+    # given
+    importer = Importer()  # type: ignore
+    importer._get_client = lambda provider, urls: FakeClient(urls)  # type: ignore
+
+    # when
+    reports = importer.import_all(max_workers=4)
+
+    # then
+    assert len(reports) == sum(len(UrlFactory.create(provider, Category.ESPORT).get_urls()) for provider in Provider)
+    assert all(report.succeeded and report.elapsed >= 0 for report in reports)
+    assert mongodb["raw_content"].count_documents({"was_processed": False}) == 1 + len(Provider)
+
+
+def test_importer_stores_other_providers_when_one_of_them_fails(mongodb: Database) -> None:
+    # given
+    importer = Importer()  # type: ignore
+    importer._get_client = lambda provider, urls: FakeClient(urls, fail=provider == Provider.LVBET)  # type: ignore
+
+    # when
+    reports = importer.import_all(max_workers=4)
+
+    # then
+    assert all(not report.succeeded for report in reports if report.provider == Provider.LVBET)
+    assert mongodb["raw_content"].count_documents({"provider": Provider.LVBET.value}) == 0
+    assert mongodb["raw_content"].count_documents({"provider": Provider.BETCLICK.value}) == 1
+
+
+def test_importer_stores_other_providers_when_one_of_them_raises_unexpected_error(mongodb: Database) -> None:
+    # given
+    importer = Importer()  # type: ignore
+    importer._get_client = lambda provider, urls: FakeClient(  # type: ignore
+        urls, error=ValueError("Document is empty") if provider == Provider.EFORTUNA else None
+    )
+
+    # when
+    reports = importer.import_all(max_workers=4)
+
+    # then
+    efortuna_reports = [report for report in reports if report.provider == Provider.EFORTUNA]
+    assert all(report.error == "ValueError: Document is empty" for report in efortuna_reports)
+    assert mongodb["raw_content"].count_documents({"provider": Provider.BETCLICK.value}) == 1
+    assert mongodb["raw_content"].count_documents({"provider": Provider.LVBET.value}) == 1
+
+
+def test_importer_skips_content_which_has_not_changed_since_last_import(mongodb: Database) -> None:
+    # given
+    importer = Importer()  # type: ignore
+    importer._get_client = lambda provider, urls: FakeClient(urls)  # type: ignore
+    importer.import_all()
+
+    # when
+    importer.import_all()
+
+    # then
+    assert mongodb["raw_content"].count_documents({"provider": Provider.BETCLICK.value}) == 1
+    assert mongodb["raw_content"].count_documents({"content_hash": {"$ne": None}}) == len(Provider)
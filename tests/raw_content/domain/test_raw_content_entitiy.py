@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from bson.objectid import ObjectId
 
 from surebets_finder.raw_content.domain.entities import RawContent
@@ -8,8 +10,19 @@ from surebets_finder.shared.provider import Provider
 def test_can_instantiate() -> None:
     # given
     raw_content = RawContent(
-        id=ObjectId(), content="some content", category=Category.ESPORT, provider=Provider.EFORTUNA, was_processed=False
+        id=ObjectId(), pages=["some content"], category=Category.ESPORT, provider=Provider.EFORTUNA, was_processed=False
     )
 
     # then
     assert isinstance(raw_content, RawContent)
+
+
+def test_created_at_defaults_to_the_time_of_instantiation() -> None:
+    # given
+    before = datetime.utcnow()
+
+    # when
+    raw_content = RawContent(id=ObjectId(), pages=[], category=Category.ESPORT, provider=Provider.EFORTUNA)
+
+    # then
+    assert before <= raw_content.created_at <= datetime.utcnow()
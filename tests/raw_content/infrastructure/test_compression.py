@@ -0,0 +1,29 @@
+import pytest
+
+from surebets_finder.raw_content.infrastructure.compression import CODECS, get_codec, get_default_codec
+
+
+@pytest.mark.parametrize("codec_name", list(CODECS))
+def test_codec_round_trip(codec_name: str) -> None:
+    # given
+    codec = get_codec(codec_name)
+    data = '<div id="main-content">some content</div>'.encode() * 100
+
+    # when
+    compressed = codec.compress(data)
+
+    # then
+    assert codec.decompress(compressed) == data
+
+
+def test_default_codec_makes_content_smaller() -> None:
+    # given
+    data = '<div id="main-content">some content</div>'.encode() * 100
+
+    # then
+    assert len(get_default_codec().compress(data)) < len(data) / 10
+
+
+def test_get_codec_should_raise_an_exception_when_codec_is_not_supported() -> None:
+    with pytest.raises(ValueError):
+        get_codec("lzma")
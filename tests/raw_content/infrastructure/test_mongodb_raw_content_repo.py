@@ -1,13 +1,17 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Callable, Set
 
 import pytest
 from bson.objectid import ObjectId
+from pymongo.cursor import Cursor
 from pymongo.database import Database
 
-from surebets_finder.raw_content.domain.entities import RawContent
+from surebets_finder.raw_content.domain.entities import RawContent, RawContentMetadata
 from surebets_finder.raw_content.domain.errors import RawContentNotFoundError
+from surebets_finder.raw_content.infrastructure.compression import IdentityCodec, get_codec
 from surebets_finder.raw_content.infrastructure.mongodb_raw_content_repo import MongoDBRawContentRepository
 from surebets_finder.shared.category import Category
+from surebets_finder.shared.content_format import ContentFormat
 from surebets_finder.shared.provider import Provider
 
 
@@ -17,7 +21,7 @@ def test_can_create_raw_content(mongodb: Database) -> None:
 
     # and
     raw_content = RawContent(
-        id=ObjectId(), content="some content", category=Category.ESPORT, provider=Provider.EFORTUNA, was_processed=False
+        id=ObjectId(), pages=["some content"], category=Category.ESPORT, provider=Provider.EFORTUNA, was_processed=False
     )
 
     # when
@@ -26,7 +30,8 @@ def test_can_create_raw_content(mongodb: Database) -> None:
     # then
     document = mongodb["raw_content"].find_one({"_id": raw_content.id})
     assert document["_id"] == raw_content.id
-    assert document["content"] == raw_content.content
+    codec = get_codec(document["content_codec"])
+    assert [codec.decompress(page).decode() for page in document["pages"]] == raw_content.pages
 
 
 def test_can_get_raw_content(mongodb: Database) -> None:
@@ -52,10 +57,32 @@ def test_can_get_raw_content(mongodb: Database) -> None:
     # then
     assert isinstance(raw_content, RawContent)
     assert raw_content.id == raw_content_id
-    assert raw_content.content == "some content"
+    assert raw_content.pages == ["some content"]
     assert raw_content.category == Category.ESPORT
     assert raw_content.provider == Provider.EFORTUNA
     assert raw_content.was_processed is False
+    assert raw_content.content_format == ContentFormat.RAW
+
+
+def test_can_create_raw_content_with_extracted_rows(mongodb: Database) -> None:
+    # given
+    repo = MongoDBRawContentRepository()  # type: ignore
+
+    # and
+    raw_content = RawContent(
+        id=ObjectId(),
+        pages=["[]"],
+        category=Category.ESPORT,
+        provider=Provider.EFORTUNA,
+        content_format=ContentFormat.ROWS,
+    )
+
+    # when
+    repo.create(raw_content)
+
+    # then
+    assert mongodb["raw_content"].find_one({"_id": raw_content.id})["content_format"] == ContentFormat.ROWS.value
+    assert repo.get(raw_content.id).content_format == ContentFormat.ROWS
 
 
 def test_get_raw_content_should_raise_an_exception_when_entity_does_not_exist(mongodb: Database) -> None:
@@ -75,14 +102,16 @@ def test_can_save_raw_content(mongodb: Database, dummy_raw_content_id: ObjectId)
     raw_content = repo.get(ObjectId(dummy_raw_content_id))
 
     # and
-    raw_content.content = "some different content"
+    raw_content.pages = ["some different content", "and another page"]
 
     # and
     repo.save(raw_content)
 
     # then
     document = mongodb["raw_content"].find_one({"_id": dummy_raw_content_id})
-    assert document["content"] == "some different content"
+    assert document["content_codec"] != IdentityCodec.name
+    assert "content" not in document
+    assert repo.get(dummy_raw_content_id).pages == ["some different content", "and another page"]
 
 
 @pytest.mark.usefixtures("fill_in_db_with_some_processed_raw_contents")
@@ -95,3 +124,176 @@ def test_can_get_all_unprocessed(mongodb: Database) -> None:
 
     # then
     assert len(all_unprocessed) == 1
+
+
+@pytest.mark.usefixtures("fill_in_db_with_some_processed_raw_contents")
+def test_iter_unprocessed_metadata_yields_metadata_without_pages(
+    mongodb: Database, dummy_raw_content_id: ObjectId
+) -> None:
+    # given
+    repo = MongoDBRawContentRepository()  # type: ignore
+    repo.create(RawContent(id=ObjectId(), pages=["content"], category=Category.ESPORT, provider=Provider.LVBET))
+
+    # when
+    unprocessed = repo.iter_unprocessed_metadata(batch_size=1)
+
+    # then
+    assert not isinstance(unprocessed, list)
+    metadata = list(unprocessed)
+    assert all(isinstance(record, RawContentMetadata) for record in metadata)
+    assert [record.provider for record in metadata] == [Provider.EFORTUNA, Provider.LVBET]
+    assert metadata[0].id == dummy_raw_content_id
+
+
+def test_can_get_latest_content_hash(mongodb: Database) -> None:
+    # given
+    repo = MongoDBRawContentRepository()  # type: ignore
+
+    # and
+    for content_hash in ["first", "second"]:
+        repo.create(
+            RawContent(
+                id=ObjectId(),
+                pages=["some content"],
+                category=Category.ESPORT,
+                provider=Provider.LVBET,
+                content_hash=content_hash,
+            )
+        )
+
+    # when
+    latest_hash = repo.get_latest_content_hash(Provider.LVBET, Category.ESPORT)
+
+    # then
+    assert latest_hash == "second"
+
+
+def test_get_latest_content_hash_should_raise_an_exception_when_there_is_no_content(mongodb: Database) -> None:
+    # given
+    repo = MongoDBRawContentRepository()  # type: ignore
+
+    # then
+    with pytest.raises(RawContentNotFoundError):
+        repo.get_latest_content_hash(Provider.BETCLICK, Category.ESPORT)
+
+
+def test_compress_uncompressed_compresses_content_stored_as_plain_text(
+    mongodb: Database, dummy_raw_content_id: ObjectId
+) -> None:
+    # given
+    repo = MongoDBRawContentRepository()  # type: ignore
+
+    # when
+    compressed = repo.compress_uncompressed()
+
+    # then
+    document = mongodb["raw_content"].find_one({"_id": dummy_raw_content_id})
+    assert compressed == 1
+    assert "content" not in document
+    assert isinstance(document["pages"][0], bytes)
+    assert repo.get(dummy_raw_content_id).pages == ["some content"]
+    assert repo.compress_uncompressed() == 0
+
+
+@pytest.mark.usefixtures("fill_in_db_with_some_processed_raw_contents")
+def test_can_get_all_unprocessed_of_given_provider(mongodb: Database) -> None:
+    # given
+    repo = MongoDBRawContentRepository()  # type: ignore
+
+    # when
+    efortuna_unprocessed = repo.get_all_unprocessed(Provider.EFORTUNA)
+    lvbet_unprocessed = repo.get_all_unprocessed(Provider.LVBET)
+
+    # then
+    assert len(efortuna_unprocessed) == 1
+    assert len(lvbet_unprocessed) == 0
+
+
+def test_create_indexes_is_idempotent(mongodb: Database) -> None:
+    # given
+    repo = MongoDBRawContentRepository()  # type: ignore
+
+    # when
+    repo.create_indexes()
+    repo.create_indexes()
+
+    # then
+    indexes = mongodb["raw_content"].index_information()
+    assert {"unprocessed", "latest"} <= set(indexes)
+
+
+def test_hot_queries_uses_indexes(mongodb: Database, used_indexes: Callable[[Cursor], Set[str]]) -> None:
+    # given
+    MongoDBRawContentRepository().create_indexes()  # type: ignore
+    collection = mongodb["raw_content"]
+
+    # then
+    assert used_indexes(collection.find({"was_processed": False})) == {"unprocessed"}
+    assert used_indexes(collection.find({"was_processed": False, "provider": "lvbet"})) == {"unprocessed"}
+    assert used_indexes(collection.find({"provider": "lvbet", "category": "esport"}).sort("_id", -1)) == {"latest"}
+
+
+def test_claim_unprocessed_leases_raw_content_to_a_single_owner(
+    mongodb: Database, dummy_raw_content_id: ObjectId
+) -> None:
+    # given
+    repo = MongoDBRawContentRepository()  # type: ignore
+
+    # when
+    claimed = repo.claim_unprocessed("worker-1", timedelta(minutes=10))
+
+    # then
+    assert claimed is not None and claimed.id == dummy_raw_content_id
+    assert repo.claim_unprocessed("worker-2", timedelta(minutes=10)) is None
+    assert mongodb["raw_content"].find_one({"_id": dummy_raw_content_id})["lease_owner"] == "worker-1"
+
+
+def test_claim_unprocessed_claims_raw_content_whose_lease_has_expired(
+    mongodb: Database, dummy_raw_content_id: ObjectId
+) -> None:
+    # given
+    repo = MongoDBRawContentRepository()  # type: ignore
+    repo.claim_unprocessed("worker-1", timedelta(seconds=-1))
+
+    # when
+    claimed = repo.claim_unprocessed("worker-2", timedelta(minutes=10))
+
+    # then
+    assert claimed is not None and claimed.id == dummy_raw_content_id
+    assert mongodb["raw_content"].find_one({"_id": dummy_raw_content_id})["lease_owner"] == "worker-2"
+
+
+def test_mark_as_processed_marks_raw_contents_and_releases_leases(mongodb: Database) -> None:
+    # given
+    repo = MongoDBRawContentRepository()  # type: ignore
+
+    for _ in range(2):
+        repo.create(RawContent(id=ObjectId(), pages=["content"], category=Category.ESPORT, provider=Provider.LVBET))
+
+    # and
+    claimed = [repo.claim_unprocessed("worker-1", timedelta(minutes=10)) for _ in range(2)]
+
+    # when
+    marked = repo.mark_as_processed(raw_content.id for raw_content in claimed if raw_content)
+
+    # then
+    assert marked == 2
+    assert mongodb["raw_content"].count_documents({"was_processed": False}) == 1
+    assert mongodb["raw_content"].count_documents({"lease_owner": {"$exists": True}}) == 0
+
+
+def test_mark_as_processed_does_not_mark_raw_content_leased_to_another_owner(
+    mongodb: Database, dummy_raw_content_id: ObjectId
+) -> None:
+    # given
+    repo = MongoDBRawContentRepository()  # type: ignore
+    repo.claim_unprocessed("worker-1", timedelta(seconds=-1))
+    repo.claim_unprocessed("worker-2", timedelta(minutes=10))
+
+    # when
+    marked = repo.mark_as_processed([dummy_raw_content_id], owner="worker-1")
+
+    # then
+    assert marked == 0
+    assert repo.get(dummy_raw_content_id).was_processed is False
+    assert mongodb["raw_content"].find_one({"_id": dummy_raw_content_id})["lease_owner"] == "worker-2"
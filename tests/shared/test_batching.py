@@ -0,0 +1,26 @@
+import pytest
+
+from surebets_finder.shared.batching import batched
+
+
+@pytest.mark.parametrize(
+    "items, size, expected",
+    [
+        ([], 2, []),
+        ([1, 2, 3, 4], 2, [[1, 2], [3, 4]]),
+        ([1, 2, 3, 4, 5], 2, [[1, 2], [3, 4], [5]]),
+        ([1, 2], 5, [[1, 2]]),
+    ],
+)
+def test_batched_yields_fixed_size_chunks(items: list, size: int, expected: list) -> None:
+    # when
+    batches = list(batched(iter(items), size))
+
+    # then
+    assert batches == expected
+
+
+def test_batched_should_raise_an_exception_when_size_is_not_positive() -> None:
+    # then
+    with pytest.raises(ValueError):
+        list(batched([1], 0))
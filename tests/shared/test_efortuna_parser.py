@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+
+from surebets_finder.shared.efortuna_parser import (
+    LXML_BACKEND,
+    SOUP_BACKEND,
+    EFortunaRow,
+    iter_rows,
+    rows_from_json,
+    rows_to_json,
+)
+
+
+@pytest.fixture
+def efortuna_raw_content() -> str:
+    root_project_path = Path(__file__).parent.parent.parent
+    file_path = root_project_path / "surebets_finder" / "examples" / "efortuna.html"
+
+    with open(file_path) as file:
+        return file.read()
+
+
+def test_lxml_and_soup_backends_extract_the_same_rows(efortuna_raw_content: str) -> None:
+    # when
+    lxml_rows = list(iter_rows(efortuna_raw_content, LXML_BACKEND))
+    soup_rows = list(iter_rows(efortuna_raw_content, SOUP_BACKEND))
+
+    # then
+    assert len(lxml_rows) > 0
+    assert lxml_rows == soup_rows
+
+
+def test_rows_can_be_restored_from_json(efortuna_raw_content: str) -> None:
+    # given
+    rows = list(iter_rows(efortuna_raw_content))
+
+    # when
+    content = rows_to_json(rows)
+
+    # then
+    assert list(rows_from_json(content)) == rows
+    assert len(content) < len(efortuna_raw_content)
+
+
+def test_row_is_extracted_in_a_single_pass() -> None:
+    # given
+    content = """
+    <table><tbody>
+        <tr class="tablesorter-hasChildRow">
+            <td class="col-title"><a class="event-name" href="/mecz/1"><span class="market-name">A - B</span></a></td>
+            <td class="col-odds"><a class="odds-button"><span class="odds-value">1.25</span></a></td>
+            <td class="col-odds"><a class="odds-button"><span class="odds-value">3.48</span></a></td>
+            <td class="col-date"><span class="event-datetime">21.01. 17:00</span></td>
+        </tr>
+        <tr><td class="col-title"></td></tr>
+    </tbody></table>
+    """
+
+    # when
+    rows = list(iter_rows(content, LXML_BACKEND))
+
+    # then
+    assert rows == [
+        EFortunaRow(
+            classes=["tablesorter-hasChildRow"],
+            market_name="A - B",
+            odds=["1.25", "3.48"],
+            event_datetime="21.01. 17:00",
+            url="/mecz/1",
+        ),
+        EFortunaRow(),
+    ]
+
+
+def test_unknown_backend_is_rejected() -> None:
+    # when & then
+    with pytest.raises(ValueError):
+        iter_rows("", "regex")
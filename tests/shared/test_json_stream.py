@@ -0,0 +1,35 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from surebets_finder.shared.json_stream import iter_json_array
+
+
+@pytest.mark.parametrize("file_name", ["betclick.json", "lvbet.json"])
+def test_iter_json_array_decodes_the_same_items_as_json_loads(file_name: str) -> None:
+    # given
+    root_project_path = Path(__file__).parent.parent.parent
+    content = (root_project_path / "surebets_finder" / "examples" / file_name).read_text()
+
+    # when
+    items = list(iter_json_array(content))
+
+    # then
+    assert items == json.loads(content)
+
+
+@pytest.mark.parametrize("content", ["[]", " [ ] ", '[1, "a" ,{"b": [2, 3]} ]'])
+def test_iter_json_array_decodes_arrays(content: str) -> None:
+    # when
+    items = list(iter_json_array(content))
+
+    # then
+    assert items == json.loads(content)
+
+
+@pytest.mark.parametrize("content", ["", "{}", "[1 2]", "[1,", '[{"a": }]'])
+def test_iter_json_array_should_raise_an_exception_when_content_is_not_an_array(content: str) -> None:
+    # then
+    with pytest.raises(ValueError):
+        list(iter_json_array(content))
@@ -1,6 +1,9 @@
+from dataclasses import dataclass, field
+from typing import List
+
 import pytest
 
-from surebets_finder.shared.reflection import raises
+from surebets_finder.shared.reflection import raises, with_slots
 
 
 def test_raises_decorator_with_valid_exception() -> None:
@@ -19,3 +22,17 @@ def test_raises_decorator_with_invalid_exception() -> None:
 
     with pytest.raises(AssertionError):
         raise_an_exception()
+
+
+def test_with_slots_decorator_removes_instance_dict() -> None:
+    @with_slots
+    @dataclass
+    class Point:
+        x: int
+        tags: List[str] = field(default_factory=list)
+
+    point = Point(x=1)
+
+    assert point == Point(x=1, tags=[])
+    assert Point.__slots__ == ("x", "tags")
+    assert not hasattr(point, "__dict__")
@@ -0,0 +1,77 @@
+from logging import Logger
+from threading import Thread
+from typing import Any, List, Optional, Tuple
+
+from kink import di
+
+from surebets_finder.daemon import Daemon
+from surebets_finder.shared.provider import Provider
+
+
+class FakeRawContentImporter:
+    def __init__(self, calls: List[Tuple[str, Provider]], failing: Optional[Provider] = None) -> None:
+        self._calls = calls
+        self._failing = failing
+
+    def import_all(self, max_workers: int = 1, providers: Any = None) -> None:
+        (provider,) = providers
+
+        if provider == self._failing:
+            raise RuntimeError("Provider is down!")
+
+        self._calls.append(("raw_content", provider))
+
+
+class FakeBetImporter:
+    def __init__(self, calls: List[Tuple[str, Provider]]) -> None:
+        self._calls = calls
+
+    def import_all(self, provider: Optional[Provider] = None) -> None:
+        assert provider is not None
+        self._calls.append(("bets", provider))
+
+
+def _run_for(daemon: Daemon, seconds: float) -> None:
+    thread = Thread(target=daemon.run)
+    thread.start()
+    thread.join(seconds)
+    daemon.stop()
+    thread.join()
+
+
+def test_daemon_chains_raw_content_and_bets_import_for_every_provider() -> None:
+    # given
+    calls: List[Tuple[str, Provider]] = []
+    daemon = Daemon(
+        raw_content_importer=FakeRawContentImporter(calls),  # type: ignore
+        bet_importer=FakeBetImporter(calls),  # type: ignore
+        logger=di[Logger],
+        intervals={Provider.LVBET: 0.05, Provider.BETCLICK: 10},
+    )
+
+    # when
+    _run_for(daemon, 0.3)
+
+    # then
+    lvbet_calls = [step for step, provider in calls if provider == Provider.LVBET]
+    assert lvbet_calls[:4] == ["raw_content", "bets", "raw_content", "bets"]
+    assert [step for step, provider in calls if provider == Provider.BETCLICK] == ["raw_content", "bets"]
+    assert not [provider for _, provider in calls if provider == Provider.EFORTUNA]
+
+
+def test_daemon_keeps_running_when_one_of_providers_fails() -> None:
+    # given
+    calls: List[Tuple[str, Provider]] = []
+    daemon = Daemon(
+        raw_content_importer=FakeRawContentImporter(calls, failing=Provider.EFORTUNA),  # type: ignore
+        bet_importer=FakeBetImporter(calls),  # type: ignore
+        logger=di[Logger],
+        intervals={Provider.EFORTUNA: 0.05, Provider.LVBET: 0.05},
+    )
+
+    # when
+    _run_for(daemon, 0.3)
+
+    # then
+    assert calls.count(("bets", Provider.LVBET)) >= 2
+    assert ("bets", Provider.EFORTUNA) not in calls
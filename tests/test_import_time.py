@@ -0,0 +1,50 @@
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# cumulative import time of the CLI module in microseconds, measured ~25ms, leaves room for slower machines
+CLI_IMPORT_BUDGET = 150_000
+
+HEAVY_MODULES = {"selenium", "webdriver_manager", "requests", "bs4", "pymongo", "lxml", "kink"}
+
+
+def _import_times(code: str) -> Dict[str, int]:
+    """Runs given code in a fresh interpreter and returns cumulative import time of every imported module"""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def test_cli_import_does_not_load_heavy_dependencies() -> None:
+    # when
+    times = _import_times("import surebets_finder.cli")
+
+    # then
+    assert {name.split(".")[0] for name in times} & HEAVY_MODULES == set()
+    assert times["surebets_finder.cli"] < CLI_IMPORT_BUDGET
+
+
+@pytest.mark.parametrize("module", ["selenium", "webdriver_manager", "requests", "bs4"])
+def test_bets_import_does_not_load_raw_content_clients(module: str) -> None:
+    # when
+    times = _import_times(
+        "from surebets_finder.bootstrap import bootstrap_di; bootstrap_di(); "
+        "import surebets_finder.bet.application.importer"
+    )
+
+    # then
+    assert "surebets_finder.bet.application.importer" in times
+    assert module not in times